@@ -72,7 +72,7 @@ export default function JobDetails() {
                   to={`/jobs/${job.id}/applicants`}
                   className="text-blue-600 hover:text-blue-800 font-medium"
                 >
-                  View Applicants ({job.applicants?.length || 0})
+                  View Applicants ({job.applicant_count || 0})
                 </Link>
               )}
             </div>
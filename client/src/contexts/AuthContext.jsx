@@ -72,7 +72,7 @@ export function AuthProvider({ children }) {
   const logout = async () => {
     try {
       if (accessToken) {
-        await firebaseAuth.logout(accessToken)
+        await firebaseAuth.logout(accessToken, refreshToken)
       }
       localStorage.removeItem('tokens')
       setCurrentUser(null)
@@ -1,16 +1,19 @@
 import { useState } from 'react'
 import { useAuth } from '../contexts/AuthContext'
+import { jobsService } from '../service/jobs'
 
 export function useApplications() {
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState(null)
   const { currentUser, accessToken } = useAuth()
 
-  const getMyApplications = async () => {
+  const getMyApplications = async ({ limit = 20, cursor } = {}) => {
     setLoading(true)
     setError(null)
     try {
-      const response = await fetch(`${import.meta.env.VITE_API_URL}/applications/my-applications`, {
+      const params = new URLSearchParams({ limit })
+      if (cursor) params.set('cursor', cursor)
+      const response = await fetch(`${import.meta.env.VITE_API_URL}/applications/my-applications?${params}`, {
         headers: {
           'Authorization': `Bearer ${accessToken}`
         }
@@ -29,14 +32,7 @@ export function useApplications() {
     setLoading(true)
     setError(null)
     try {
-      const response = await fetch(`${import.meta.env.VITE_API_URL}/jobs/${jobId}/apply`, {
-        method: 'POST',
-        headers: {
-          'Authorization': `Bearer ${accessToken}`
-        }
-      })
-      if (!response.ok) throw new Error('Failed to apply to job')
-      return await response.json()
+      return await jobsService.applyToJob(jobId, accessToken)
     } catch (err) {
       setError(err.message)
       throw err
@@ -45,11 +41,13 @@ export function useApplications() {
     }
   }
 
-  const getJobApplicants = async (jobId) => {
+  const getJobApplicants = async (jobId, { limit = 20, cursor } = {}) => {
     setLoading(true)
     setError(null)
     try {
-      const response = await fetch(`${import.meta.env.VITE_API_URL}/jobs/${jobId}/applicants`, {
+      const params = new URLSearchParams({ limit })
+      if (cursor) params.set('cursor', cursor)
+      const response = await fetch(`${import.meta.env.VITE_API_URL}/jobs/${jobId}/applicants?${params}`, {
         headers: {
           'Authorization': `Bearer ${accessToken}`
         }
@@ -1,23 +1,17 @@
 import { useState } from 'react'
 import { useAuth } from '../contexts/AuthContext'
+import { jobsService } from '../service/jobs'
 
 export function useJobs() {
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState(null)
   const { currentUser, accessToken } = useAuth()
 
-  const getAllJobs = async () => {
+  const getAllJobs = async ({ limit = 20, cursor } = {}) => {
     setLoading(true)
     setError(null)
     try {
-      const response = await fetch(`${import.meta.env.VITE_API_URL}/jobs`, {
-        headers: {
-          'Authorization': `Bearer ${accessToken}`
-        }
-      })
-      if (!response.ok) throw new Error('Failed to fetch jobs')
-      const data = await response.json()
-      return data.jobs
+      return await jobsService.getAllJobs(accessToken, { limit, cursor })
     } catch (err) {
       setError(err.message)
       throw err
@@ -26,18 +20,24 @@ export function useJobs() {
     }
   }
 
-  const getMatchedJobs = async () => {
+  const getMyJobs = async ({ limit = 20, cursor } = {}) => {
     setLoading(true)
     setError(null)
     try {
-      const response = await fetch(`${import.meta.env.VITE_API_URL}/jobs/match`, {
-        headers: {
-          'Authorization': `Bearer ${accessToken}`
-        }
-      })
-      if (!response.ok) throw new Error('Failed to fetch matched jobs')
-      const data = await response.json()
-      return data.jobs
+      return await jobsService.getMyJobs(accessToken, { limit, cursor })
+    } catch (err) {
+      setError(err.message)
+      throw err
+    } finally {
+      setLoading(false)
+    }
+  }
+
+  const getMatchedJobs = async ({ limit = 20, offset = 0 } = {}) => {
+    setLoading(true)
+    setError(null)
+    try {
+      return await jobsService.getMatchedJobs(accessToken, { limit, offset })
     } catch (err) {
       setError(err.message)
       throw err
@@ -71,6 +71,7 @@ export function useJobs() {
     loading,
     error,
     getAllJobs,
+    getMyJobs,
     getMatchedJobs,
     postJob
   }
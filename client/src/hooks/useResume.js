@@ -1,5 +1,6 @@
 import { useState } from 'react'
 import { useAuth } from '../contexts/AuthContext'
+import { waitForResumeJob } from '../service/resume'
 
 export function useResume() {
   const [loading, setLoading] = useState(false)
@@ -18,7 +19,8 @@ export function useResume() {
         body: formData
       })
       if (!response.ok) throw new Error('Failed to upload resume')
-      return await response.json()
+      const { job_id } = await response.json()
+      return await waitForResumeJob(job_id, accessToken)
     } catch (err) {
       setError(err.message)
       throw err
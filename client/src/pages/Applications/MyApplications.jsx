@@ -5,6 +5,7 @@ import LoadingSpinner from '../../components/common/LoadingSpinner'
 
 function MyApplications() {
   const [applications, setApplications] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
   const { getMyApplications, loading, error } = useApplications()
 
   useEffect(() => {
@@ -12,6 +13,7 @@ function MyApplications() {
       try {
         const data = await getMyApplications()
         setApplications(data.applications)
+        setNextCursor(data.next_cursor)
       } catch (err) {
         console.error(err)
       }
@@ -19,7 +21,17 @@ function MyApplications() {
     fetchApplications()
   }, [])
 
-  if (loading) return <LoadingSpinner />
+  const loadMore = async () => {
+    try {
+      const data = await getMyApplications({ cursor: nextCursor })
+      setApplications(prev => [...prev, ...data.applications])
+      setNextCursor(data.next_cursor)
+    } catch (err) {
+      console.error(err)
+    }
+  }
+
+  if (loading && applications.length === 0) return <LoadingSpinner />
   if (error) return <div className="text-red-500">{error}</div>
 
   return (
@@ -40,6 +52,12 @@ function MyApplications() {
           ))}
         </div>
       )}
+
+      {nextCursor && (
+        <button onClick={loadMore} disabled={loading} className="w-full mt-6 px-4 py-3 text-sm font-medium text-blue-600 hover:bg-gray-50 border border-gray-200 rounded-md">
+          Load more
+        </button>
+      )}
     </div>
   )
 }
@@ -8,6 +8,8 @@ function ViewApplicants() {
   const { jobId } = useParams()
   const [applicants, setApplicants] = useState([])
   const [selectedApplicant, setSelectedApplicant] = useState(null)
+  const [applicantCount, setApplicantCount] = useState(0)
+  const [nextCursor, setNextCursor] = useState(null)
   const { getJobApplicants, loading, error } = useApplications()
 
   useEffect(() => {
@@ -15,6 +17,8 @@ function ViewApplicants() {
       try {
         const data = await getJobApplicants(jobId)
         setApplicants(data.applicants)
+        setApplicantCount(data.applicant_count)
+        setNextCursor(data.next_cursor)
         if (data.applicants.length > 0) {
           setSelectedApplicant(data.applicants[0])
         }
@@ -25,7 +29,18 @@ function ViewApplicants() {
     fetchApplicants()
   }, [jobId])
 
-  if (loading) return <LoadingSpinner />
+  const loadMore = async () => {
+    try {
+      const data = await getJobApplicants(jobId, { cursor: nextCursor })
+      setApplicants(current => [...current, ...data.applicants])
+      setNextCursor(data.next_cursor)
+    } catch (err) {
+      console.error(err)
+    }
+  }
+
+  // Keep the loaded applicants on screen while the next page is fetched
+  if (loading && applicants.length === 0) return <LoadingSpinner />
   if (error) return <div className="text-red-500">{error}</div>
 
   return (
@@ -37,7 +52,7 @@ function ViewApplicants() {
           <div className="bg-white shadow overflow-hidden sm:rounded-lg">
             <div className="px-4 py-5 sm:px-6 border-b border-gray-200">
               <h3 className="text-lg leading-6 font-medium text-gray-900">
-                Applicants ({applicants.length})
+                Applicants ({applicantCount})
               </h3>
             </div>
             <div className="divide-y divide-gray-200">
@@ -59,6 +74,15 @@ function ViewApplicants() {
                 </div>
               ))}
             </div>
+            {nextCursor && (
+              <button
+                onClick={loadMore}
+                disabled={loading}
+                className="w-full px-4 py-3 text-sm font-medium text-blue-600 hover:bg-gray-50 border-t border-gray-200 disabled:text-gray-400 disabled:cursor-wait"
+              >
+                {loading ? 'Loading...' : 'Load more'}
+              </button>
+            )}
           </div>
         </div>
         
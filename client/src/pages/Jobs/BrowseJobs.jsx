@@ -8,14 +8,16 @@ function BrowseJobs() {
   const [jobs, setJobs] = useState([])
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState('')
+  const [nextOffset, setNextOffset] = useState(null)
   const { getMatchedJobs } = useJobs()
 
   useEffect(() => {
     const fetchJobs = async () => {
       try {
         setLoading(true)
-        const matchedJobs = await getMatchedJobs()
-        setJobs(matchedJobs)
+        const data = await getMatchedJobs()
+        setJobs(data.jobs)
+        setNextOffset(data.next_offset)
       } catch (err) {
         setError(err.message || 'Failed to load jobs')
       } finally {
@@ -26,6 +28,16 @@ function BrowseJobs() {
     fetchJobs()
   }, [])
 
+  const loadMore = async () => {
+    try {
+      const data = await getMatchedJobs({ offset: nextOffset })
+      setJobs(prev => [...prev, ...data.jobs])
+      setNextOffset(data.next_offset)
+    } catch (err) {
+      setError(err.message || 'Failed to load jobs')
+    }
+  }
+
   if (loading) return <LoadingSpinner />
   if (error) return <div className="text-red-500">{error}</div>
 
@@ -59,6 +71,12 @@ function BrowseJobs() {
           ))}
         </div>
       )}
+
+      {nextOffset != null && (
+        <button onClick={loadMore} className="w-full mt-6 px-4 py-3 text-sm font-medium text-blue-600 hover:bg-gray-50 border border-gray-200 rounded-md">
+          Load more
+        </button>
+      )}
     </div>
   )
 }
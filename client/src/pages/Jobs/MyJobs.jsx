@@ -5,6 +5,7 @@ import { Link } from 'react-router-dom'
 
 function MyJobs() {
   const [jobs, setJobs] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
   const { getMyJobs, loading, error } = useJobs()
 
   useEffect(() => {
@@ -12,6 +13,7 @@ function MyJobs() {
       try {
         const data = await getMyJobs()
         setJobs(data.jobs)
+        setNextCursor(data.next_cursor)
       } catch (err) {
         console.error(err)
       }
@@ -19,6 +21,16 @@ function MyJobs() {
     fetchJobs()
   }, [])
 
+  const loadMore = async () => {
+    try {
+      const data = await getMyJobs({ cursor: nextCursor })
+      setJobs(prev => [...prev, ...data.jobs])
+      setNextCursor(data.next_cursor)
+    } catch (err) {
+      console.error(err)
+    }
+  }
+
   return (
     <div className="max-w-6xl mx-auto px-4 py-8">
       <div className="flex justify-between items-center mb-8">
@@ -31,7 +43,14 @@ function MyJobs() {
         </Link>
       </div>
       
-      <JobList jobs={jobs} loading={loading} error={error} />
+      {/* Keep the loaded jobs on screen while the next page is fetched */}
+      <JobList jobs={jobs} loading={loading && jobs.length === 0} error={error} />
+
+      {nextCursor && (
+        <button onClick={loadMore} disabled={loading} className="w-full mt-6 px-4 py-3 text-sm font-medium text-blue-600 hover:bg-gray-50 border border-gray-200 rounded-md">
+          Load more
+        </button>
+      )}
     </div>
   )
 }
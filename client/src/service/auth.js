@@ -71,14 +71,16 @@ export const firebaseAuth = {
     }
   },
 
-  async logout(accessToken) {
+  async logout(accessToken, refreshToken) {
     try {
-      // First call your backend logout
+      // First call your backend logout, which revokes both tokens
       const response = await fetch(`${import.meta.env.VITE_API_URL}/auth/logout`, {
         method: 'POST',
         headers: {
-          'Authorization': `Bearer ${accessToken}`
-        }
+          'Authorization': `Bearer ${accessToken}`,
+          'Content-Type': 'application/json'
+        },
+        body: JSON.stringify({ refreshToken })
       })
 
       if (!response.ok) {
@@ -1,6 +1,9 @@
 export const jobsService = {
-  async getAllJobs(accessToken) {
-    const response = await fetch(`${import.meta.env.VITE_API_URL}/jobs`, {
+  // Listings come one page at a time, pass the previous response's next_cursor to get the next page
+  async getAllJobs(accessToken, { limit = 20, cursor } = {}) {
+    const params = new URLSearchParams({ limit })
+    if (cursor) params.set('cursor', cursor)
+    const response = await fetch(`${import.meta.env.VITE_API_URL}/jobs?${params}`, {
       headers: {
         'Authorization': `Bearer ${accessToken}`
       }
@@ -9,8 +12,21 @@ export const jobsService = {
     return await response.json()
   },
 
-  async getMatchedJobs(accessToken) {
-    const response = await fetch(`${import.meta.env.VITE_API_URL}/jobs/match`, {
+  async getMyJobs(accessToken, { limit = 20, cursor } = {}) {
+    const params = new URLSearchParams({ limit })
+    if (cursor) params.set('cursor', cursor)
+    const response = await fetch(`${import.meta.env.VITE_API_URL}/jobs/my-jobs?${params}`, {
+      headers: {
+        'Authorization': `Bearer ${accessToken}`
+      }
+    })
+    if (!response.ok) throw new Error('Failed to fetch your jobs')
+    return await response.json()
+  },
+
+  async getMatchedJobs(accessToken, { limit = 20, offset = 0 } = {}) {
+    const params = new URLSearchParams({ limit, offset })
+    const response = await fetch(`${import.meta.env.VITE_API_URL}/jobs/match?${params}`, {
       headers: {
         'Authorization': `Bearer ${accessToken}`
       }
@@ -41,14 +57,24 @@ export const jobsService = {
     return await response.json()
   },
 
-  async applyToJob(jobId, accessToken) {
-    const response = await fetch(`${import.meta.env.VITE_API_URL}/jobs/${jobId}/apply`, {
-      method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${accessToken}`
+  async applyToJob(jobId, accessToken, retries = 2) {
+    // The same key on every attempt lets the server recognise a retry
+    const idempotencyKey = crypto.randomUUID()
+    for (let attempt = 0; ; attempt++) {
+      try {
+        const response = await fetch(`${import.meta.env.VITE_API_URL}/jobs/${jobId}/apply`, {
+          method: 'POST',
+          headers: {
+            'Authorization': `Bearer ${accessToken}`,
+            'Idempotency-Key': idempotencyKey
+          }
+        })
+        if (!response.ok) throw new Error('Failed to apply to job')
+        return await response.json()
+      } catch (err) {
+        // fetch only rejects with a TypeError when the request never got a response
+        if (!(err instanceof TypeError) || attempt >= retries) throw err
       }
-    })
-    if (!response.ok) throw new Error('Failed to apply to job')
-    return await response.json()
+    }
   }
 }
\ No newline at end of file
@@ -1,4 +1,29 @@
-export async function uploadResume(formData, accessToken) {
+const JOB_POLL_INTERVAL = 2000
+const JOB_MAX_WAIT = 10 * 60 * 1000
+
+export async function getResumeJob(jobId, accessToken) {
+  const response = await fetch(`${import.meta.env.VITE_API_URL}/resume/jobs/${jobId}`, {
+    headers: {
+      'Authorization': `Bearer ${accessToken}`
+    }
+  })
+  if (!response.ok) throw new Error('Failed to fetch resume processing status')
+  return await response.json()
+}
+
+export async function waitForResumeJob(jobId, accessToken, onProgress) {
+  const deadline = Date.now() + JOB_MAX_WAIT
+  while (Date.now() < deadline) {
+    const job = await getResumeJob(jobId, accessToken)
+    if (onProgress) onProgress(job)
+    if (job.status === 'completed') return job.result
+    if (job.status === 'failed') throw new Error(job.error || 'Resume processing failed')
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL))
+  }
+  throw new Error('Resume processing is taking too long, please try again later')
+}
+
+export async function uploadResume(formData, accessToken, onProgress) {
   const response = await fetch(`${import.meta.env.VITE_API_URL}/resume/upload`, {
     method: 'POST',
     headers: {
@@ -7,11 +32,14 @@ export async function uploadResume(formData, accessToken) {
     body: formData
   })
   if (!response.ok) throw new Error('Failed to upload resume')
-  return await response.json()
+  const { job_id } = await response.json()
+  return await waitForResumeJob(job_id, accessToken, onProgress)
 }
 
 export const resumeService = {
   uploadResume,
+  getResumeJob,
+  waitForResumeJob,
   async getResume(accessToken) {
     const response = await fetch(`${import.meta.env.VITE_API_URL}/resume`, {
       headers: {
@@ -0,0 +1,116 @@
+"""Benchmark applicant detail reads: per-applicant gets against batched get_all, on a fake Firestore
+
+Each fake call sleeps for a round trip plus a small per-document cost, so the
+numbers show how latency scales with round trips rather than real throughput.
+
+Run from the server directory:
+    python -m benchmarks.bench_applicant_reads [--rtt-ms 8] [--per-doc-ms 0.05]
+"""
+import time
+import argparse
+from services.applicants import fetch_applicant_resumes
+
+class FakeSnapshot:
+    def __init__(self, reference, data, field_paths=None):
+        self.reference = reference
+        self.id = reference.id
+        self.exists = data is not None
+        if data is not None and field_paths is not None:
+            data = {field: data[field] for field in field_paths if field in data}
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+class FakeDocumentReference:
+    def __init__(self, db, collection, doc_id):
+        self.db = db
+        self.id = doc_id
+        self.path = f"{collection}/{doc_id}"
+
+    def get(self):
+        self.db.round_trip(1)
+        return FakeSnapshot(self, self.db.docs.get(self.path))
+
+class FakeCollection:
+    def __init__(self, db, name):
+        self.db = db
+        self.name = name
+
+    def document(self, doc_id):
+        return FakeDocumentReference(self.db, self.name, doc_id)
+
+class FakeFirestore:
+    """Just enough of the Firestore client for applicant reads, with simulated latency"""
+
+    def __init__(self, rtt, per_doc):
+        self.rtt = rtt
+        self.per_doc = per_doc
+        self.docs = {}
+        self.calls = 0
+
+    def round_trip(self, documents):
+        self.calls += 1
+        time.sleep(self.rtt + self.per_doc * documents)
+
+    def collection(self, name):
+        return FakeCollection(self, name)
+
+    def get_all(self, refs, field_paths=None):
+        self.round_trip(len(refs))
+        return [FakeSnapshot(ref, self.docs.get(ref.path), field_paths) for ref in refs]
+
+def seed(db, applicants):
+    """Create a user and a resume for each applicant"""
+    for i in range(applicants):
+        db.docs[f"users/user{i}"] = {'resumeId': f"resume{i}", 'email': f"user{i}@example.com"}
+        db.docs[f"resumes/resume{i}"] = {
+            'name': f"Applicant {i}",
+            'email': f"user{i}@example.com",
+            'summary': "Backend engineer " * 20,
+            'technical_skills': ['Python', 'SQL', 'Docker'],
+            'programming_languages': ['Python'],
+            'raw_text': "x" * 20000
+        }
+    return [f"user{i}" for i in range(applicants)]
+
+def sequential_reads(db, applicant_ids):
+    """Baseline: one users get and one resumes get per applicant, in turn"""
+    found = {}
+    for applicant_id in applicant_ids:
+        user_data = db.collection('users').document(applicant_id).get().to_dict()
+        resume_data = db.collection('resumes').document(user_data.get('resumeId', '')).get().to_dict()
+        if resume_data:
+            found[applicant_id] = resume_data
+    return found
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rtt-ms", type=float, default=8.0, help="simulated round trip per call")
+    parser.add_argument("--per-doc-ms", type=float, default=0.05, help="simulated cost per document returned")
+    parser.add_argument("--sizes", default="10,100,1000", help="applicant counts to run")
+    args = parser.parse_args()
+
+    fields = ['name', 'email', 'summary', 'technical_skills', 'programming_languages']
+    print(f"simulated rtt {args.rtt_ms}ms, {args.per_doc_ms}ms per document")
+    for size in [int(size) for size in args.sizes.split(",")]:
+        db = FakeFirestore(args.rtt_ms / 1000, args.per_doc_ms / 1000)
+        applicant_ids = seed(db, size)
+
+        db.calls = 0
+        start = time.perf_counter()
+        baseline = sequential_reads(db, applicant_ids)
+        sequential_time, sequential_calls = time.perf_counter() - start, db.calls
+
+        db.calls = 0
+        start = time.perf_counter()
+        batched = fetch_applicant_resumes(db, applicant_ids, fields)
+        batched_time, batched_calls = time.perf_counter() - start, db.calls
+
+        assert batched.keys() == baseline.keys()
+        print(f"{size:>5} applicants: sequential {sequential_time * 1000:8.1f}ms ({sequential_calls} calls)  "
+              f"batched {batched_time * 1000:7.1f}ms ({batched_calls} calls)  "
+              f"{sequential_time / batched_time:5.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark DocumentParser throughput in pages per second at different pool sizes
+
+Run from the server directory:
+    python -m benchmarks.bench_document_parser [path/to/document.pdf] [--pages N]
+"""
+import io
+import os
+import sys
+import time
+import argparse
+import PyPDF2
+from services.document_parser import DocumentParser
+
+def build_pdf(pages, lines_per_page=45):
+    """Build a text-only PDF with the given number of pages"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page in range(pages):
+        lines = [f"Page {page + 1} line {line}: Python, Flask, Firebase, React, Kubernetes, SQL" for line in range(lines_per_page)]
+        content = "BT /F1 10 Tf 40 800 Td 12 TL " + " ".join(f"({text}) '" for text in lines) + " ET"
+        stream = content.encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids).encode()
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % pages
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", nargs="?", help="PDF to parse (a synthetic PDF is generated if omitted)")
+    parser.add_argument("--pages", type=int, default=200, help="pages in the synthetic PDF")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per pool size")
+    args = parser.parse_args()
+
+    if args.path:
+        with open(args.path, "rb") as f:
+            data = f.read()
+    else:
+        data = build_pdf(args.pages)
+    page_count = len(PyPDF2.PdfReader(io.BytesIO(data)).pages)
+
+    cpu_count = os.cpu_count() or 1
+    for workers in sorted({1, 2, 4, cpu_count}):
+        document_parser = DocumentParser(max_workers=workers, max_pages=sys.maxsize, timeout=600)
+        try:
+            # Start the workers and warm up imports; they are reused by the timed runs
+            document_parser.parse(data, "bench.pdf")
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                document_parser.parse(data, "bench.pdf")
+            elapsed = time.perf_counter() - start
+        finally:
+            document_parser.shutdown()
+        print(f"{workers:>3} processes: {page_count * args.repeat / elapsed:10.1f} pages/s ({elapsed / args.repeat:.3f}s per document)")
+
+if __name__ == "__main__":
+    main()
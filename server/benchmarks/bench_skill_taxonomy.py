@@ -0,0 +1,72 @@
+"""Benchmark skill extraction with the Aho-Corasick matcher against per-alias regex scanning
+
+Run from the server directory:
+    python -m benchmarks.bench_skill_taxonomy [--resumes N]
+"""
+import re
+import time
+import random
+import argparse
+from services.skill_taxonomy import SkillMatcher
+
+FILLER = (
+    "designed built delivered maintained improved led the team across projects for clients "
+    "responsible for ownership of features with a focus on quality and performance in production"
+).split()
+
+def build_corpus(matcher, resumes, words_per_resume, seed=7):
+    """Generate synthetic resumes that mix skill aliases into filler text"""
+    rng = random.Random(seed)
+    aliases = list(matcher.aliases)
+    corpus = []
+    for _ in range(resumes):
+        words = [rng.choice(aliases) if rng.random() < 0.1 else rng.choice(FILLER) for _ in range(words_per_resume)]
+        corpus.append(" ".join(words))
+    return corpus
+
+def regex_extract(patterns, text):
+    """Baseline: one word-bounded regex search per alias"""
+    found = {}
+    lowered = text.lower()
+    for pattern, canonical in patterns:
+        if pattern.search(lowered):
+            found[canonical] = None
+    return list(found)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=1000, help="resumes in the corpus")
+    parser.add_argument("--words", type=int, default=600, help="words per resume")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    matcher = SkillMatcher()
+    build_time = time.perf_counter() - start
+
+    corpus = build_corpus(matcher, args.resumes, args.words)
+    megabytes = sum(len(text) for text in corpus) / (1024 * 1024)
+    print(f"corpus: {args.resumes} resumes, {megabytes:.1f} MB, {len(matcher.aliases)} aliases "
+          f"(automaton built in {build_time * 1000:.1f} ms)")
+
+    start = time.perf_counter()
+    automaton_results = [matcher.extract(text) for text in corpus]
+    automaton_time = time.perf_counter() - start
+
+    patterns = [
+        (re.compile(r'(?<![a-z0-9])' + re.escape(alias) + r'(?![a-z0-9])'), canonical)
+        for alias, (_, canonical) in matcher.aliases.items()
+    ]
+    start = time.perf_counter()
+    regex_results = [regex_extract(patterns, text) for text in corpus]
+    regex_time = time.perf_counter() - start
+
+    mismatches = sum(
+        set(skill for skills in automaton.values() for skill in skills) != set(baseline)
+        for automaton, baseline in zip(automaton_results, regex_results)
+    )
+    for name, elapsed in (("aho-corasick", automaton_time), ("per-alias regex", regex_time)):
+        print(f"{name:>16}: {elapsed:7.3f}s  {args.resumes / elapsed:9.1f} resumes/s  {megabytes / elapsed:6.2f} MB/s")
+    print(f"result mismatches: {mismatches}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark the per-request cost of token checks: decode only, decode plus the Bloom-fronted revocation list, and decode plus a store lookup per request
+
+The store is the local backend behind a simulated round trip, so the store
+lookup column shows what checking a shared store on every request would cost.
+
+Run from the server directory:
+    python -m benchmarks.bench_token_checks [--requests 20000] [--revoked 10000] [--rtt-ms 0.5]
+"""
+import time
+import uuid
+import argparse
+import jwt
+from services.revocation import RevocationList, LocalRevocationBackend
+
+SECRET = "benchmark-secret-" + "x" * 32
+
+class SlowBackend(LocalRevocationBackend):
+    """Local backend that sleeps for a round trip on every call, like a remote store"""
+
+    def __init__(self, rtt):
+        super().__init__()
+        self.rtt = rtt
+        self.calls = 0
+
+    def _round_trip(self):
+        self.calls += 1
+        time.sleep(self.rtt)
+
+    def contains(self, jti):
+        self._round_trip()
+        return super().contains(jti)
+
+    def version(self):
+        self._round_trip()
+        return super().version()
+
+    def entries(self):
+        self._round_trip()
+        return super().entries()
+
+def make_token(expires_at):
+    """Build an access token shaped like the ones the app issues"""
+    payload = {
+        "uid": "benchmark-user",
+        "email": "user@example.com",
+        "provider_id": "google.com",
+        "role": "applicant",
+        "type": "access",
+        "jti": uuid.uuid4().hex,
+        "exp": expires_at
+    }
+    return jwt.encode(payload, SECRET, algorithm="HS256")
+
+def run(tokens, check):
+    """Return mean microseconds per token for a check"""
+    start = time.perf_counter()
+    for token in tokens:
+        check(token)
+    return (time.perf_counter() - start) / len(tokens) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000, help="tokens checked per mode")
+    parser.add_argument("--revoked", type=int, default=10000, help="revoked token ids in the store")
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="simulated round trip to the store")
+    args = parser.parse_args()
+
+    expires_at = int(time.time()) + 3600
+    backend = SlowBackend(args.rtt_ms / 1000)
+    revocations = RevocationList(backend, capacity=args.revoked, sync_interval=1.0)
+    for _ in range(args.revoked):
+        revocations.revoke(uuid.uuid4().hex, expires_at)
+    tokens = [make_token(expires_at) for _ in range(args.requests)]
+    # Store lookups are slow, so that mode runs on a sample
+    sample = tokens[:max(1, args.requests // 20)]
+
+    def decode(token):
+        return jwt.decode(token, SECRET, algorithms=["HS256"])
+
+    def decode_and_filter(token):
+        payload = decode(token)
+        return revocations.is_revoked(payload["jti"])
+
+    def decode_and_lookup(token):
+        payload = decode(token)
+        return backend.contains(payload["jti"])
+
+    revocations.is_revoked("warm-up")
+    backend.calls = 0
+    decode_time = run(tokens, decode)
+    filter_time = run(tokens, decode_and_filter)
+    filter_calls = backend.calls
+    lookup_time = run(sample, decode_and_lookup)
+
+    print(f"{args.requests} tokens, {args.revoked} revoked, simulated store rtt {args.rtt_ms}ms")
+    print(f"decode only          {decode_time:8.1f}us")
+    print(f"decode + bloom       {filter_time:8.1f}us  (+{filter_time - decode_time:.1f}us, "
+          f"{filter_calls} store calls, {revocations.false_positives} false positives)")
+    print(f"decode + store check {lookup_time:8.1f}us  (+{lookup_time - decode_time:.1f}us)")
+
+if __name__ == "__main__":
+    main()
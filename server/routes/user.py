@@ -2,6 +2,9 @@ from flask import Blueprint, jsonify, request
 from firebase_admin import auth
 from firebase.firebase_client import db
 from utils.decorators import jwt_required
+from services.user_record_cache import get_user_record_cache
+from services.profile_versions import get_profile_versions
+from utils.concurrency import get_fanout
 from datetime import datetime
 import datetime as dt
 import logging
@@ -17,8 +20,10 @@ def get_profile():
     """Get user profile information"""
     try:
         uid = request.uid
-        user_record = auth.get_user(uid)
-        user_doc = db.collection("users").document(uid).get()
+        user_record, user_doc = get_fanout().gather(
+            lambda: get_user_record_cache().get(uid),
+            db.collection("users").document(uid).get
+        )
         
         user_data = user_doc.to_dict() if user_doc.exists else {}
         
@@ -60,6 +65,9 @@ def update_profile():
         
         if update_data:
             auth.update_user(uid, **update_data)
+            get_user_record_cache().invalidate(uid)
+            # Tokens issued before this carry the old profile
+            get_profile_versions().bump(uid)
         
         # Update Firestore user data
         user_ref = db.collection("users").document(uid)
@@ -74,7 +82,7 @@ def update_profile():
         logger.info(f"Profile updated for user {uid}")
         
         # Return updated profile
-        user_record = auth.get_user(uid)
+        user_record = get_user_record_cache().get(uid)
         user_data = user_ref.get().to_dict()
         
         return jsonify({
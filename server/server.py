@@ -1,6 +1,5 @@
 import os
 import jwt
-import PyPDF2
 import openai
 from flask import Flask, request, jsonify, send_from_directory
 from werkzeug.utils import secure_filename
@@ -11,6 +10,7 @@ import uuid
 from typing import List, Dict, Any
 import firebase_admin
 from firebase_admin import credentials, auth, firestore
+from google.api_core.exceptions import AlreadyExists
 import json
 from flask_cors import CORS
 from flask_limiter import Limiter
@@ -18,14 +18,39 @@ from flask_limiter.util import get_remote_address
 from dotenv import load_dotenv
 import logging
 import datetime as dt
-from docx import Document
 from langchain.text_splitter import CharacterTextSplitter
 from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import FAISS
 from langchain.chains.question_answering import load_qa_chain
 from langchain_openai import OpenAI
 import re
+import time
+import hashlib
+import click
+import atexit
 from collections import Counter
+from services.resume_jobs import ResumeJobQueue
+from services.extraction_cache import ExtractionCache
+from services.embedding_cache import EmbeddingStore, CachedEmbeddings
+from services.resume_index_store import ResumeIndexStore
+from services.document_parser import DocumentParser
+from services.text_stream import normalize_stream, chunk_stream, TextPrefix
+from services.skill_taxonomy import SKILL_CATEGORIES, get_skill_matcher
+from services.skill_index import SkillIndex, normalize_skill, job_skills
+from services.job_vector_index import JobVectorIndex
+from services.bulk_matcher import BulkMatcher
+from services.question_runner import QuestionRunner
+from services.applicants import fetch_applicant_resumes
+from services.job_catalogue import JobCatalogueCache, LocalVersionStore
+from services.job_replica import JobReplica, FirestoreSnapshotSource
+from services.user_record_cache import get_user_record_cache
+from services.profile_versions import get_profile_versions
+from services.write_behind import get_write_behind
+from services.revocation import get_revocation_list
+from utils.exceptions import QueueFullError, FileTooLargeError
+from utils.pagination import parse_page_args, paginate, decode_cursor, make_cursor
+from utils.batch_reads import get_all_batched
+from utils.concurrency import get_fanout
 
 # Load environment variables
 load_dotenv()
@@ -48,10 +73,90 @@ limiter = Limiter(
 )
 
 # Configuration
-UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'pdf', 'docx'}
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+UPLOAD_SPOOL_THRESHOLD = int(os.getenv("UPLOAD_SPOOL_THRESHOLD", 1024 * 1024))  # Keep uploads in memory up to 1MB
+# Reject oversized requests before the body is read (file plus form fields)
+app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE + 1024 * 1024
+
+# Document parsing process pool
+PARSER_WORKERS = int(os.getenv("PARSER_WORKERS", os.cpu_count() or 1))
+PARSER_MAX_PAGES = int(os.getenv("PARSER_MAX_PAGES", 50))
+PARSER_TIMEOUT = float(os.getenv("PARSER_TIMEOUT", 30))
+PARSER_PAGES_PER_TASK = int(os.getenv("PARSER_PAGES_PER_TASK", 8))
+
+# Characters of job PDF text sent to OpenAI for summarization
+SUMMARY_CONTEXT_CHARS = 4000
+
+# Job matching
+MATCH_MIN_SCORE = 0.3
+SKILL_INDEX_REFRESH = int(os.getenv("SKILL_INDEX_REFRESH", 300))  # Picks up jobs written by other workers
+SEMANTIC_MATCH_MIN_SCORE = float(os.getenv("SEMANTIC_MATCH_MIN_SCORE", 0.3))
+JOB_VECTOR_REFRESH = int(os.getenv("JOB_VECTOR_REFRESH", 300))
+# Switch to "semantic" once backfill-job-embeddings has embedded the jobs posted before it
+MATCH_DEFAULT_MODE = os.getenv("MATCH_DEFAULT_MODE", "skills")
+MATCH_PAGE_SIZE = 20
+MATCH_MAX_PAGE_SIZE = 100
+
+# Applications are keyed by (job, applicant) so each pair can only exist once
+APPLICATION_ID_NAMESPACE = uuid.UUID("6f1c2a4e-9d3b-4f0a-8c7e-2b5d1e9a4c30")
+
+# Listings
+LIST_PAGE_SIZE = 20
+LIST_MAX_PAGE_SIZE = 100
+JOB_FIELDS = (
+    'id', 'title', 'company', 'location', 'description', 'enhanced_description', 'posted_by',
+    'created_at', 'updated_at', 'pdf_processed', 'ai_enhanced', 'is_active', 'key_requirements',
+    'key_responsibilities', 'preferred_qualifications', 'compensation_info', 'additional_details',
+    'pdf_summary', 'original_pdf_text', 'applicant_count'
+)
+# Listings never download the raw PDF text, and applicant counts only go to the job owner
+JOB_LIST_FIELDS = tuple(field for field in JOB_FIELDS if field not in ('original_pdf_text', 'applicant_count'))
+MY_JOB_LIST_FIELDS = tuple(field for field in JOB_FIELDS if field != 'original_pdf_text')
+APPLICATION_FIELDS = ('job_id', 'job_title', 'company', 'status', 'applied_at')
+RESUME_FIELDS = (
+    'name', 'email', 'phone', 'technical_skills', 'soft_skills', 'programming_languages', 'frameworks_tools',
+    'certifications', 'summary', 'experience_summary', 'education_summary', 'projects', 'industries', 'career_level'
+)
+
+# Applicant reads
+APPLICANT_RESUME_FIELDS = tuple(os.getenv("APPLICANT_RESUME_FIELDS", "name,email,summary,technical_skills").split(","))
+APPLICANT_READ_CHUNK = int(os.getenv("APPLICANT_READ_CHUNK", 100))  # Documents per get_all call
+APPLICANT_READ_WORKERS = int(os.getenv("APPLICANT_READ_WORKERS", 4))
+
+# Job catalogue: "replica" follows a snapshot listener, "cache" reloads when a shared version moves
+JOB_CATALOGUE_MODE = os.getenv("JOB_CATALOGUE_MODE", "replica")
+JOB_CACHE_TTL = int(os.getenv("JOB_CACHE_TTL", 300))
+JOB_CACHE_CHECK_INTERVAL = float(os.getenv("JOB_CACHE_CHECK_INTERVAL", 0.5))  # Seconds between shared version reads
+JOB_CACHE_REDIS_URL = os.getenv("JOB_CACHE_REDIS_URL")  # Shared version counter across workers
+JOB_REPLICA_CHECK_INTERVAL = float(os.getenv("JOB_REPLICA_CHECK_INTERVAL", 15))  # Seconds between watch health checks
+
+# Background resume processing
+RESUME_WORKERS = int(os.getenv("RESUME_WORKERS", 2))
+RESUME_MAX_PENDING = int(os.getenv("RESUME_MAX_PENDING", 20))
+RESUME_JOB_STALE_AFTER = int(os.getenv("RESUME_JOB_STALE_AFTER", 600))  # Unfinished jobs without a heartbeat this long are failed
+
+# RAG extraction (set RAG_CONCURRENCY=1 to ask questions sequentially)
+RAG_CONCURRENCY = int(os.getenv("RAG_CONCURRENCY", 4))
+RAG_QUESTION_TIMEOUT = float(os.getenv("RAG_QUESTION_TIMEOUT", 30))
+RAG_MAX_ABANDONED = int(os.getenv("RAG_MAX_ABANDONED", 8))  # Timed-out calls still running before new questions are refused
+
+# Resume extraction engine: "structured" (one JSON prompt) or "per_question"
+RESUME_EXTRACTION_MODE = os.getenv("RESUME_EXTRACTION_MODE", "structured")
+STRUCTURED_EXTRACTION_MAX_CHARS = int(os.getenv("STRUCTURED_EXTRACTION_MAX_CHARS", 12000))
+
+# Content-addressed cache of extraction results
+EXTRACTION_CACHE_PATH = os.getenv("EXTRACTION_CACHE_PATH", "cache/extraction_cache.db")
+EXTRACTION_CACHE_MAX_BYTES = int(os.getenv("EXTRACTION_CACHE_MAX_BYTES", 50 * 1024 * 1024))
+EXTRACTION_CACHE_MAX_AGE = int(os.getenv("EXTRACTION_CACHE_MAX_AGE", 30 * 24 * 3600))  # 30 days
+
+# Persistent embedding cache keyed by chunk hash and model
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", "cache/embeddings.db")
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", 100000))
+
+# Persisted per-resume FAISS indexes
+RESUME_INDEX_DIR = os.getenv("RESUME_INDEX_DIR", "cache/resume_indexes")
+RESUME_INDEX_MAX_RESIDENT = int(os.getenv("RESUME_INDEX_MAX_RESIDENT", 32))
 
 # OpenAI Configuration
 openai.api_key = os.getenv('OPENAI_API_KEY')
@@ -64,6 +169,8 @@ if not JWT_SECRET:
 JWT_ALGORITHM = "HS256"
 ACCESS_TOKEN_EXP = 3600  # 1 hour
 REFRESH_TOKEN_EXP = 7 * 24 * 3600  # 7 days
+# Access tokens carry the profile so /auth/verify can answer from the token alone
+ACCESS_TOKEN_CLAIMS_VERSION = 2
 
 # Initialize Firebase Admin SDK
 cred_path = os.getenv("FIREBASE_CREDENTIALS")
@@ -82,8 +189,90 @@ except Exception as e:
     logger.error(f"Failed to initialize Firebase: {e}")
     raise
 
-# Ensure upload directory exists
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+# Shared services
+extraction_cache = ExtractionCache(
+    EXTRACTION_CACHE_PATH,
+    max_bytes=EXTRACTION_CACHE_MAX_BYTES,
+    max_age=EXTRACTION_CACHE_MAX_AGE
+)
+embedding_store = EmbeddingStore(EMBEDDING_CACHE_PATH, max_entries=EMBEDDING_CACHE_MAX_ENTRIES)
+question_runner = QuestionRunner(
+    max_workers=RAG_CONCURRENCY,
+    timeout=RAG_QUESTION_TIMEOUT,
+    max_abandoned=RAG_MAX_ABANDONED
+)
+
+def get_embeddings():
+    """OpenAI embeddings backed by the local embedding cache"""
+    return CachedEmbeddings(OpenAIEmbeddings(), embedding_store)
+
+resume_index_store = ResumeIndexStore(
+    RESUME_INDEX_DIR,
+    get_embeddings,
+    max_resident=RESUME_INDEX_MAX_RESIDENT
+)
+document_parser = DocumentParser(
+    max_workers=PARSER_WORKERS,
+    max_pages=PARSER_MAX_PAGES,
+    timeout=PARSER_TIMEOUT,
+    pages_per_task=PARSER_PAGES_PER_TASK
+)
+atexit.register(document_parser.shutdown)
+
+# Shared with the blueprints so an invalidation reaches every reader
+user_records = get_user_record_cache()
+profile_versions = get_profile_versions()
+# Independent Auth and Firestore calls in request handlers run side by side
+fanout = get_fanout()
+atexit.register(fanout.shutdown)
+# Login timestamps are coalesced per user and written in batches after the response
+login_writes = get_write_behind(db, "users")
+atexit.register(login_writes.shutdown)
+# Logged out tokens stay rejected until they expire. Without REVOCATION_REDIS_URL the
+# list is per process, so multi-worker deployments must set it
+revoked_tokens = get_revocation_list()
+
+def load_active_jobs():
+    """Stream the catalogue fields of every active job for the job catalogue"""
+    jobs_ref = db.collection('jobs').where('is_active', '==', True)
+    for job in jobs_ref.select(list(MY_JOB_LIST_FIELDS)).stream():
+        yield job.id, job.to_dict()
+
+if JOB_CATALOGUE_MODE == "replica":
+    # Listeners cannot project, the replica drops the fields it does not keep
+    job_catalogue = JobReplica(
+        FirestoreSnapshotSource(
+            db.collection('jobs').where('is_active', '==', True),
+            check_interval=JOB_REPLICA_CHECK_INTERVAL
+        ),
+        fields=MY_JOB_LIST_FIELDS
+    )
+    atexit.register(job_catalogue.stop)
+else:
+    if JOB_CACHE_REDIS_URL:
+        import redis  # Only needed when several workers share the catalogue version
+        job_version_store = redis.Redis.from_url(JOB_CACHE_REDIS_URL)
+    else:
+        job_version_store = LocalVersionStore()
+    
+    job_catalogue = JobCatalogueCache(
+        load_active_jobs,
+        version_store=job_version_store,
+        ttl=JOB_CACHE_TTL,
+        fields=MY_JOB_LIST_FIELDS,
+        check_interval=JOB_CACHE_CHECK_INTERVAL
+    )
+
+# The skill index rebuilds from the catalogue instead of scanning Firestore again
+skill_index = SkillIndex(job_catalogue.items, refresh_interval=SKILL_INDEX_REFRESH)
+
+def load_active_job_vectors():
+    """Stream the stored embedding of every active job for the vector index"""
+    vectors_ref = db.collection('job_embeddings').where('is_active', '==', True)
+    for doc in vectors_ref.select(['vector']).stream():
+        yield doc.id, doc.to_dict().get('vector')
+
+job_vector_index = JobVectorIndex(load_active_job_vectors, refresh_interval=JOB_VECTOR_REFRESH)
 
 # Utility Functions
 def allowed_file(filename):
@@ -91,30 +280,46 @@ def allowed_file(filename):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def extract_text_from_file(filepath):
-    """Extract text from PDF or DOCX files"""
+def iter_text_from_file(source, filename=None):
+    """Yield text from a PDF or DOCX file path or file-like stream as pages are parsed"""
     try:
-        if filepath.endswith('.pdf'):
-            reader = PyPDF2.PdfReader(filepath)
-            text = "".join([page.extract_text() for page in reader.pages])
-        elif filepath.endswith('.docx'):
-            doc = Document(filepath)
-            text = "\n".join([para.text for para in doc.paragraphs])
+        if isinstance(source, str):
+            filename = filename or source
+            with open(source, 'rb') as f:
+                data = f.read()
         else:
-            raise ValueError("Unsupported file format")
-        return text
+            data = source.read()
+        # Parsing is CPU-bound, so it runs on the process pool instead of the request thread
+        yield from document_parser.iter_text(data, filename)
     except Exception as e:
         raise Exception(f"Error extracting text from file: {str(e)}")
 
+def extract_text_from_file(source, filename=None):
+    """Extract text from a PDF or DOCX file path or file-like stream"""
+    return "".join(iter_text_from_file(source, filename))
+
+def spool_upload(file, max_size=MAX_FILE_SIZE):
+    """Copy an uploaded file into memory, spilling to a temp file only above UPLOAD_SPOOL_THRESHOLD"""
+    spooled = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_THRESHOLD)
+    size = 0
+    while True:
+        chunk = file.stream.read(64 * 1024)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_size:
+            spooled.close()
+            raise FileTooLargeError(f"File size exceeds {max_size // (1024 * 1024)}MB limit")
+        spooled.write(chunk)
+    spooled.seek(0)
+    return spooled
+
 def preprocess_text(text):
     """Clean and preprocess extracted text"""
     if not text:
         return ""
-    # Remove multiple whitespaces
-    text = re.sub(r'\s+', ' ', text)
-    # Remove special characters except those used in contact info
-    text = re.sub(r'[^\w\s@\+\(\)\-\.\,\#\&]', '', text)
-    return text.strip()
+    # Collapse whitespace and remove special characters except those used in contact info
+    return "".join(normalize_stream([text]))
 
 def extract_contact_info(text):
     """Extract name, email, and phone using regex"""
@@ -173,75 +378,269 @@ def create_rag_index(text):
         raise ValueError("No text chunks created")
     
     try:
-        embeddings = OpenAIEmbeddings()
+        embeddings = get_embeddings()
         knowledge_base = FAISS.from_texts(chunks, embeddings)
         return knowledge_base
     except Exception as e:
         raise Exception(f"Failed to create embeddings: {str(e)}")
 
-def extract_comprehensive_info_with_rag(text):
-    """Use RAG to extract comprehensive information from text"""
+def get_resume_index(resume_id, text=None):
+    """Get the persisted RAG index for a resume, building it from text or the stored resume on first use"""
+    def build():
+        if text is not None:
+            return create_rag_index(text)
+        resume_doc = db.collection("resumes").document(resume_id).get()
+        if not resume_doc.exists:
+            raise ValueError("Resume not found")
+        return create_rag_index(resume_doc.to_dict().get("raw_text", ""))
+    
+    return resume_index_store.get(resume_id, build)
+
+def job_embedding_text(job_data):
+    """Text a job is embedded from for semantic matching"""
+    parts = [
+        job_data.get('title', ''),
+        job_data.get('enhanced_description') or job_data.get('description', ''),
+        ", ".join(job_data.get('key_requirements') or []),
+        ", ".join(job_data.get('preferred_qualifications') or []),
+        ", ".join(job_data.get('key_responsibilities') or [])
+    ]
+    return "\n".join(part for part in parts if part)
+
+def resume_embedding_text(resume_data):
+    """Text a resume is embedded from for semantic matching"""
+    skills = []
+    for field in RESUME_LIST_FIELDS:
+        skills.extend(resume_data.get(field) or [])
+    parts = [
+        resume_data.get('summary', ''),
+        ", ".join(skills),
+        resume_data.get('experience_summary', ''),
+        resume_data.get('projects', ''),
+        resume_data.get('industries', '')
+    ]
+    return "\n".join(part for part in parts if part and part != 'Not available')
+
+def resume_match_skills(resume_data):
+    """Skills a resume is matched on against job requirements"""
+    return (resume_data.get('technical_skills') or []) + (resume_data.get('programming_languages') or [])
+
+def store_job_embedding(job_id, job_data):
+    """Embed a job and keep its vector in Firestore and the vector index, best effort"""
+    vector_ref = db.collection('job_embeddings').document(job_id)
     try:
-        # Create vector store
-        knowledge_base = create_rag_index(text)
-        
-        # Enhanced questions to extract actual skills from resume
-        questions = [
-            "Extract all specific technical skills, technologies, software tools, and programming languages explicitly mentioned. Return only the exact terms found, separated by commas.",
-            "Extract all soft skills and interpersonal abilities explicitly mentioned. Return only the exact terms found, separated by commas.",
-            "Extract all programming languages specifically mentioned. Return only the exact language names found, separated by commas.",
-            "Extract all frameworks, libraries, development tools, and platforms specifically mentioned. Return only the exact names found, separated by commas.",
-            "Extract all certifications, licenses, or professional credentials mentioned. Include the full certification names.",
-            "Provide a comprehensive summary of the work experience, highlighting key roles, responsibilities, and achievements mentioned.",
-            "Summarize the educational background including degrees, institutions, and relevant academic achievements mentioned.",
-            "Extract and list all specific projects mentioned with their key details.",
-            "Identify the industries and domains mentioned.",
-            "Determine the experience level and career stage based on the information provided."
-        ]
-        
-        # Initialize LLM chain
-        try:
-            llm = OpenAI(temperature=0.1)
-            chain = load_qa_chain(llm, chain_type="stuff")
-        except Exception as e:
-            raise Exception(f"Failed to initialize LLM chain: {str(e)}")
+        if not job_data.get('is_active', False):
+            vector_ref.set({'is_active': False, 'updated_at': datetime.now(dt.UTC)}, merge=True)
+            job_vector_index.remove(job_id)
+            return
         
+        vector = get_embeddings().embed_query(job_embedding_text(job_data))
+        vector_ref.set({
+            'vector': vector,
+            'is_active': True,
+            'updated_at': datetime.now(dt.UTC)
+        })
+        job_vector_index.upsert(job_id, vector)
+    except Exception as e:
+        # Skill matching still covers the job, the next refresh picks up a later write
+        logger.warning(f"Failed to store embedding for job {job_id}: {e}")
+
+def get_resume_embedding(resume_id, resume_data):
+    """Get a resume's stored embedding, computing it when missing or stale"""
+    vector_ref = db.collection('resume_embeddings').document(resume_id)
+    vector_doc = vector_ref.get()
+    if vector_doc.exists:
+        stored = vector_doc.to_dict()
+        if stored.get('content_hash') == resume_data.get('content_hash') and stored.get('vector'):
+            return stored['vector']
+    
+    vector = get_embeddings().embed_query(resume_embedding_text(resume_data))
+    vector_ref.set({
+        'vector': vector,
+        'content_hash': resume_data.get('content_hash'),
+        'updated_at': datetime.now(dt.UTC)
+    })
+    return vector
+
+def answer_question(knowledge_base, chain, question):
+    """Answer a single question against the resume index"""
+    docs = knowledge_base.similarity_search(question, k=4)
+    if not docs:
+        return "Not available"
+    answer = chain.run(input_documents=docs, question=question)
+    return answer.strip() if answer else "Not available"
+
+def answer_questions_concurrently(knowledge_base, chain, questions, max_workers=None, timeout=None):
+    """Answer questions in parallel, isolating failures and timeouts per question
+
+    Returns the answers and the questions that failed or timed out, which are
+    answered "Not available".
+    """
+    return question_runner.run(
+        lambda question: answer_question(knowledge_base, chain, question),
+        questions,
+        max_workers=max_workers,
+        timeout=timeout
+    )
+
+# Questions used to extract each resume field, in the order they are asked
+RESUME_QUESTIONS = {
+    'technical_skills': "Extract all specific technical skills, technologies, software tools, and programming languages explicitly mentioned. Return only the exact terms found, separated by commas.",
+    'soft_skills': "Extract all soft skills and interpersonal abilities explicitly mentioned. Return only the exact terms found, separated by commas.",
+    'programming_languages': "Extract all programming languages specifically mentioned. Return only the exact language names found, separated by commas.",
+    'frameworks_tools': "Extract all frameworks, libraries, development tools, and platforms specifically mentioned. Return only the exact names found, separated by commas.",
+    'certifications': "Extract all certifications, licenses, or professional credentials mentioned. Include the full certification names.",
+    'experience_summary': "Provide a comprehensive summary of the work experience, highlighting key roles, responsibilities, and achievements mentioned.",
+    'education_summary': "Summarize the educational background including degrees, institutions, and relevant academic achievements mentioned.",
+    'projects': "Extract and list all specific projects mentioned with their key details.",
+    'industries': "Identify the industries and domains mentioned.",
+    'career_level': "Determine the experience level and career stage based on the information provided."
+}
+
+# Fields returned as lists of terms; the rest are free text
+RESUME_LIST_FIELDS = ('technical_skills', 'soft_skills', 'programming_languages', 'frameworks_tools')
+
+def parse_structured_resume_response(content):
+    """Validate a JSON extraction response into raw answers keyed by field, dropping invalid fields"""
+    if not content:
+        return {}
+    
+    # Tolerate markdown code fences around the JSON object
+    content = content.strip()
+    if content.startswith("```"):
+        content = re.sub(r'^```(?:json)?\s*|\s*```$', '', content)
+    
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        return {}
+    
+    if not isinstance(data, dict):
+        return {}
+    
+    answers = {}
+    for field in RESUME_QUESTIONS:
+        value = data.get(field)
+        if field in RESUME_LIST_FIELDS:
+            if isinstance(value, list) and all(isinstance(item, str) for item in value):
+                answers[field] = ", ".join(item.strip() for item in value if item.strip()) or "None"
+        elif isinstance(value, str) and value.strip():
+            answers[field] = value.strip()
+    return answers
+
+def extract_structured_info(text):
+    """Extract all resume fields with a single JSON-schema prompt"""
+    schema = {
+        field: (["term1", "term2"] if field in RESUME_LIST_FIELDS else "string")
+        for field in RESUME_QUESTIONS
+    }
+    instructions = "\n".join(f"- {field}: {question}" for field, question in RESUME_QUESTIONS.items())
+    
+    # Dictionary matches give the model a head start on the skill lists
+    detected_skills = get_skill_matcher().extract(text)
+    skill_hints = "\n".join(
+        f"- {field}: {', '.join(skills)}" for field, skills in detected_skills.items() if skills
+    ) or "None"
+    
+    prompt = f"""
+    Extract the following fields from the resume below. Only use information explicitly present in the resume.
+    Use an empty list or "Not available" when a field is not mentioned.
+    
+    Fields:
+    {instructions}
+    
+    Skills already found by dictionary matching (keep them where correct and add any that were missed):
+    {skill_hints}
+    
+    Resume:
+    {text[:STRUCTURED_EXTRACTION_MAX_CHARS]}
+    
+    Respond with only a JSON object matching this schema:
+    {json.dumps(schema, indent=2)}
+    """
+    
+    response = openai.ChatCompletion.create(
+        model="gpt-3.5-turbo",
+        messages=[
+            {"role": "system", "content": "You are an expert resume parser that responds with valid JSON only."},
+            {"role": "user", "content": prompt}
+        ],
+        max_tokens=2000,
+        temperature=0.1
+    )
+    return parse_structured_resume_response(response.choices[0].message.content)
+
+def extract_info_per_question(text, fields, resume_id=None):
+    """Answer the given fields one question each against a RAG index of the text, and list the fields that failed"""
+    # A resume's index is persisted, so re-running extraction on the same resume does not embed it again
+    knowledge_base = get_resume_index(resume_id, text) if resume_id else create_rag_index(text)
+    
+    # Initialize LLM chain
+    try:
+        llm = OpenAI(temperature=0.1, timeout=RAG_QUESTION_TIMEOUT)
+        chain = load_qa_chain(llm, chain_type="stuff")
+    except Exception as e:
+        raise Exception(f"Failed to initialize LLM chain: {str(e)}")
+    
+    questions = [RESUME_QUESTIONS[field] for field in fields]
+    answers, failed = answer_questions_concurrently(knowledge_base, chain, questions)
+    return (
+        {field: answers[RESUME_QUESTIONS[field]] for field in fields},
+        [field for field in fields if RESUME_QUESTIONS[field] in failed]
+    )
+
+def extract_comprehensive_info_with_rag(text, resume_id=None):
+    """Use RAG to extract comprehensive information from text"""
+    # Identical resumes reuse the stored results without any OpenAI calls
+    content_hash = extraction_cache.key_for(text, namespace=RESUME_EXTRACTION_MODE)
+    cached_results = extraction_cache.get(content_hash)
+    # Entries cached before degraded results were kept out carry no completeness flag
+    if cached_results is not None and cached_results.get('extraction_complete'):
+        return cached_results
+    
+    try:
         answers = {}
-        for question in questions:
+        if RESUME_EXTRACTION_MODE == "structured":
             try:
-                docs = knowledge_base.similarity_search(question, k=4)
-                if docs:
-                    answer = chain.run(input_documents=docs, question=question)
-                    answers[question] = answer.strip() if answer else "Not available"
-                else:
-                    answers[question] = "Not available"
+                answers = extract_structured_info(text)
             except Exception as e:
-                print(f"Error processing question '{question}': {str(e)}")
-                answers[question] = "Not available"
+                logger.warning(f"Structured extraction failed, asking per question: {e}")
+        
+        # Fall back to one RAG question per field for anything not extracted
+        missing_fields = [field for field in RESUME_QUESTIONS if field not in answers]
+        failed_fields = []
+        if missing_fields:
+            fallback_answers, failed_fields = extract_info_per_question(text, missing_fields, resume_id)
+            answers.update(fallback_answers)
         
         # Process extracted skills - only use what's actually found
         def parse_extracted_skills(skills_text):
             if not skills_text or skills_text == "Not available" or skills_text.lower() == "none":
                 return []
-            skills = [skill.strip().title() for skill in skills_text.split(',') if skill.strip()]
+            matcher = get_skill_matcher()
             filtered_skills = []
-            for skill in skills:
-                if len(skill) > 2 and not any(phrase in skill.lower() for phrase in ['not mentioned', 'not available', 'none found']):
-                    filtered_skills.append(skill)
-            return list(set(filtered_skills))[:20]
-        
-        technical_skills = parse_extracted_skills(answers.get(questions[0], ""))
-        soft_skills = parse_extracted_skills(answers.get(questions[1], ""))
-        programming_languages = parse_extracted_skills(answers.get(questions[2], ""))
-        frameworks_tools = parse_extracted_skills(answers.get(questions[3], ""))
+            for skill in skills_text.split(','):
+                skill = skill.strip()
+                # Known aliases map to one canonical name (JS -> JavaScript) so matching lines up
+                canonical = matcher.canonicalize(skill)
+                if canonical:
+                    filtered_skills.append(canonical)
+                elif len(skill) > 2 and not any(phrase in skill.lower() for phrase in ['not mentioned', 'not available', 'none found']):
+                    filtered_skills.append(skill.title())
+            return list(dict.fromkeys(filtered_skills))[:20]
+        
+        technical_skills = parse_extracted_skills(answers.get('technical_skills', ""))
+        soft_skills = parse_extracted_skills(answers.get('soft_skills', ""))
+        programming_languages = parse_extracted_skills(answers.get('programming_languages', ""))
+        frameworks_tools = parse_extracted_skills(answers.get('frameworks_tools', ""))
         
         # Create structured summary
-        certifications = answers.get(questions[4], 'Not available')
-        experience_summary = answers.get(questions[5], 'Not available')
-        education_summary = answers.get(questions[6], 'Not available')
-        projects = answers.get(questions[7], 'Not available')
-        industries = answers.get(questions[8], 'Not available')
-        career_level = answers.get(questions[9], 'Not available')
+        certifications = answers.get('certifications', 'Not available')
+        experience_summary = answers.get('experience_summary', 'Not available')
+        education_summary = answers.get('education_summary', 'Not available')
+        projects = answers.get('projects', 'Not available')
+        industries = answers.get('industries', 'Not available')
+        career_level = answers.get('career_level', 'Not available')
         
         comprehensive_summary = f"""
 ## Professional Summary
@@ -269,7 +668,7 @@ Industries: {industries}
 • {", ".join(soft_skills) if soft_skills else "Not specified"}
         """.strip()
         
-        return {
+        results = {
             'technical_skills': technical_skills,
             'soft_skills': soft_skills,
             'programming_languages': programming_languages,
@@ -280,14 +679,21 @@ Industries: {industries}
             'education_summary': education_summary,
             'projects': projects,
             'industries': industries,
-            'career_level': career_level
+            'career_level': career_level,
+            # Placeholder answers from failed or timed out questions must not outlive the outage
+            'extraction_complete': not failed_fields
         }
+        if failed_fields:
+            logger.warning(f"Resume extraction degraded, not caching: {', '.join(failed_fields)} failed")
+        else:
+            extraction_cache.set(content_hash, results)
+        return results
     except Exception as e:
         print(f"RAG processing failed: {str(e)}")
         return extract_fallback_skills_from_text(text)
 
 def extract_fallback_skills_from_text(text):
-    """Fallback skill extraction using NLP patterns"""
+    """Fallback skill extraction using the skill taxonomy dictionary"""
     if not text:
         return {
             'technical_skills': [],
@@ -300,31 +706,14 @@ def extract_fallback_skills_from_text(text):
             'education_summary': 'Not available',
             'projects': 'Not available',
             'industries': 'Not available',
-            'career_level': 'Not available'
+            'career_level': 'Not available',
+            'extraction_complete': False
         }
     
-    text_lower = text.lower()
-    
-    # Look for skills in common contexts
-    skill_contexts = [
-        r'skills?[:\s]+([^\.]+)',
-        r'technologies?[:\s]+([^\.]+)',
-        r'proficient in[:\s]+([^\.]+)',
-        r'experience with[:\s]+([^\.]+)',
-        r'knowledge of[:\s]+([^\.]+)',
-        r'familiar with[:\s]+([^\.]+)',
-        r'worked with[:\s]+([^\.]+)'
-    ]
-    
-    found_skills = []
-    for pattern in skill_contexts:
-        matches = re.findall(pattern, text_lower, re.IGNORECASE)
-        for match in matches:
-            skills_in_match = re.split(r'[,;|\n•·]', match)
-            for skill in skills_in_match:
-                skill = skill.strip().title()
-                if len(skill) > 2 and skill not in found_skills:
-                    found_skills.append(skill)
+    skills = get_skill_matcher().extract(text)
+    found_skills = [skill for category in SKILL_CATEGORIES for skill in skills[category]]
+    # Like the LLM path, technical skills also cover languages and tools
+    technical_skills = skills['technical_skills'] + skills['programming_languages'] + skills['frameworks_tools']
     
     summary = f"""
 ## Skills Extracted
@@ -332,45 +721,23 @@ def extract_fallback_skills_from_text(text):
     """.strip()
     
     return {
-        'technical_skills': found_skills[:10],
-        'soft_skills': [],
-        'programming_languages': [],
-        'frameworks_tools': [],
+        'technical_skills': technical_skills[:20],
+        'soft_skills': skills['soft_skills'][:20],
+        'programming_languages': skills['programming_languages'][:20],
+        'frameworks_tools': skills['frameworks_tools'][:20],
         'certifications': '',
         'summary': summary,
         'experience_summary': 'Experience details extracted using pattern matching.',
         'education_summary': 'Education details not available with current processing.',
         'projects': 'Projects not identified',
         'industries': 'Industries not identified',
-        'career_level': 'Career level not determined'
+        'career_level': 'Career level not determined',
+        'extraction_complete': False
     }
 
 def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
     """Split text into overlapping chunks for better RAG processing"""
-    if len(text) <= chunk_size:
-        return [text]
-    
-    chunks = []
-    start = 0
-    
-    while start < len(text):
-        end = start + chunk_size
-        if end > len(text):
-            end = len(text)
-        
-        # Try to break at sentence boundary
-        if end < len(text):
-            last_period = text.rfind('.', start, end)
-            if last_period > start + chunk_size // 2:
-                end = last_period + 1
-        
-        chunks.append(text[start:end].strip())
-        start = end - overlap
-        
-        if start >= len(text):
-            break
-    
-    return chunks
+    return list(chunk_stream([text], chunk_size, overlap))
 
 def summarize_with_openai(text_chunks: List[str], context: Dict[str, Any]) -> Dict[str, Any]:
     """Use OpenAI to summarize and extract meaningful information from text chunks"""
@@ -390,7 +757,7 @@ def summarize_with_openai(text_chunks: List[str], context: Dict[str, Any]) -> Di
         {json.dumps(context, indent=2)}
         
         Content:
-        {full_text[:4000]}
+        {full_text[:SUMMARY_CONTEXT_CHARS]}
         
         Format your response as a JSON object with:
         {{
@@ -429,14 +796,20 @@ def summarize_with_openai(text_chunks: List[str], context: Dict[str, Any]) -> Di
     except Exception as e:
         raise Exception(f"Error processing with OpenAI: {str(e)}")
 
-def create_access_token(uid, email=None, provider_id=None, role=None):
-    """Create access JWT token"""
+def create_access_token(uid, email=None, provider_id=None, role=None, user_record=None, profile_version=0):
+    """Create access JWT token, carrying the profile from user_record when given"""
     payload = {
         "uid": uid,
         "email": email,
         "provider_id": provider_id,
         "role": role,
         "type": "access",
+        "jti": uuid.uuid4().hex,
+        "cv": ACCESS_TOKEN_CLAIMS_VERSION,
+        "pv": profile_version,
+        "name": user_record.display_name if user_record else None,
+        "picture": user_record.photo_url if user_record else None,
+        "email_verified": bool(user_record.email_verified) if user_record else False,
         "iat": datetime.now(dt.UTC),
         "exp": datetime.now(dt.UTC) + timedelta(seconds=ACCESS_TOKEN_EXP)
     }
@@ -447,6 +820,7 @@ def create_refresh_token(uid):
     payload = {
         "uid": uid,
         "type": "refresh",
+        "jti": uuid.uuid4().hex,
         "iat": datetime.now(dt.UTC),
         "exp": datetime.now(dt.UTC) + timedelta(seconds=REFRESH_TOKEN_EXP)
     }
@@ -473,9 +847,12 @@ def jwt_required(token_type="access"):
                     return jsonify({"error": f"Invalid token type, expected {token_type}"}), 401
                 if token_type == "access" and payload.get("provider_id") != "google.com":
                     return jsonify({"error": "Invalid authentication provider"}), 401
+                if payload.get("jti") and revoked_tokens.is_revoked(payload["jti"]):
+                    return jsonify({"error": "Token has been revoked"}), 401
                 request.uid = payload["uid"]
                 request.user_email = payload.get("email")
                 request.user_role = payload.get("role")
+                request.token_claims = payload
             except jwt.ExpiredSignatureError:
                 return jsonify({"error": "Token has expired"}), 401
             except jwt.InvalidTokenError as e:
@@ -505,6 +882,25 @@ def health_check():
     """Health check endpoint"""
     return jsonify({"status": "healthy", "timestamp": datetime.now(dt.UTC).isoformat()})
 
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """Cache and queue metrics for monitoring"""
+    return jsonify({
+        "extraction_cache": extraction_cache.stats(),
+        "rag_questions": question_runner.stats(),
+        "embedding_cache": embedding_store.stats(),
+        "document_parser": document_parser.stats(),
+        "skill_index": skill_index.stats(),
+        "job_vector_index": job_vector_index.stats(),
+        "job_catalogue": job_catalogue.stats(),
+        "user_records": user_records.stats(),
+        "profile_versions": profile_versions.stats(),
+        "fanout": fanout.stats(),
+        "login_writes": login_writes.stats(),
+        "revoked_tokens": revoked_tokens.stats(),
+        "timestamp": datetime.now(dt.UTC).isoformat()
+    })
+
 # Authentication Routes
 @app.route("/auth/signup", methods=["POST"])
 @limiter.limit("5 per minute")
@@ -534,16 +930,16 @@ def signup():
         if provider_id != "google.com":
             return jsonify({"error": "Only Google Sign-In is supported"}), 401
         
-        # Check if user already exists in Firestore
+        # Read the profile version before the record, so a token never pairs a new version with an old record
+        profile_version = profile_versions.get(uid)
+        
+        # Check if user already exists in Firestore while the user record is fetched from Firebase Auth
         user_ref = db.collection("users").document(uid)
-        existing_user = user_ref.get()
+        existing_user, user_record = fanout.gather(user_ref.get, lambda: user_records.get(uid))
         
         if existing_user.exists:
             return jsonify({"error": "User already exists. Please try logging in instead."}), 409
         
-        # Get user record from Firebase Auth
-        user_record = auth.get_user(uid)
-        
         # Create new user in Firestore
         user_data = {
             "email": email,
@@ -561,7 +957,7 @@ def signup():
         user_ref.set(user_data)
         
         # Create tokens
-        access_token = create_access_token(uid, email, provider_id, role)
+        access_token = create_access_token(uid, email, provider_id, role, user_record, profile_version)
         refresh_token = create_refresh_token(uid)
         
         logger.info(f"New user {email} signed up with role {role}")
@@ -616,9 +1012,10 @@ def login():
         if provider_id != "google.com":
             return jsonify({"error": "Only Google Sign-In is supported"}), 401
         
-        # Check if user exists in Firestore and has the correct role
+        # Check if user exists in Firestore and has the correct role, fetching the user record alongside
+        profile_version = profile_versions.get(uid)
         user_ref = db.collection("users").document(uid)
-        user_doc = user_ref.get()
+        user_doc, user_record = fanout.gather(user_ref.get, lambda: user_records.get(uid))
         
         if not user_doc.exists:
             return jsonify({
@@ -635,17 +1032,14 @@ def login():
                 "needsSignup": True
             }), 403
         
-        # Get user record for additional info
-        user_record = auth.get_user(uid)
-        
-        # Update last login
-        user_ref.update({
+        # Update last login, without waiting on the write
+        login_writes.update(uid, {
             "lastLogin": datetime.now(dt.UTC),
             "updatedAt": datetime.now(dt.UTC)
         })
         
         # Create tokens
-        access_token = create_access_token(uid, email, provider_id, role)
+        access_token = create_access_token(uid, email, provider_id, role, user_record, profile_version)
         refresh_token = create_refresh_token(uid)
         
         logger.info(f"User {email} logged in with role {role}")
@@ -685,13 +1079,15 @@ def refresh_token():
         payload = jwt.decode(refresh_token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         if payload.get("type") != "refresh":
             return jsonify({"error": "Invalid token type"}), 401
+        if payload.get("jti") and revoked_tokens.is_revoked(payload["jti"]):
+            return jsonify({"error": "Refresh token has been revoked"}), 401
         
         uid = payload["uid"]
-        user_record = auth.get_user(uid)
+        profile_version = profile_versions.get(uid)
         
-        # Get user role from Firestore
+        # Get user role from Firestore alongside the user record
         user_ref = db.collection("users").document(uid)
-        user_doc = user_ref.get()
+        user_record, user_doc = fanout.gather(lambda: user_records.get(uid), user_ref.get)
         
         if not user_doc.exists:
             return jsonify({"error": "User not found"}), 404
@@ -700,7 +1096,7 @@ def refresh_token():
         role = user_data.get("role")
         
         # Create new access token
-        access_token = create_access_token(uid, user_record.email, "google.com", role)
+        access_token = create_access_token(uid, user_record.email, "google.com", role, user_record, profile_version)
         
         return jsonify({
             "success": True,
@@ -729,11 +1125,25 @@ def verify_token():
     """Verify JWT token and return user info"""
     try:
         uid = request.uid
-        user_record = auth.get_user(uid)
+        claims = request.token_claims
         
-        # Get user role from Firestore
+        # Current tokens answer from their claims unless the profile changed after they were issued
+        if claims.get("cv") == ACCESS_TOKEN_CLAIMS_VERSION and claims.get("pv") == profile_versions.get(uid):
+            return jsonify({
+                "success": True,
+                "user": {
+                    "uid": uid,
+                    "email": claims.get("email"),
+                    "displayName": claims.get("name"),
+                    "emailVerified": claims.get("email_verified", False),
+                    "photoURL": claims.get("picture"),
+                    "role": claims.get("role")
+                }
+            })
+        
+        # Older or stale tokens read the profile again, and the role from Firestore
         user_ref = db.collection("users").document(uid)
-        user_doc = user_ref.get()
+        user_record, user_doc = fanout.gather(lambda: user_records.get(uid), user_ref.get)
         
         if not user_doc.exists:
             return jsonify({"error": "User data not found"}), 404
@@ -762,8 +1172,10 @@ def get_profile():
     """Get user profile information"""
     try:
         uid = request.uid
-        user_record = auth.get_user(uid)
-        user_doc = db.collection("users").document(uid).get()
+        user_record, user_doc = fanout.gather(
+            lambda: user_records.get(uid),
+            db.collection("users").document(uid).get
+        )
         
         user_data = user_doc.to_dict() if user_doc.exists else {}
         
@@ -816,6 +1228,9 @@ def update_profile():
         
         if update_data:
             auth.update_user(uid, **update_data)
+            user_records.invalidate(uid)
+            # Tokens issued before this carry the old profile
+            profile_versions.bump(uid)
         
         # Update Firestore user data
         user_ref = db.collection("users").document(uid)
@@ -830,11 +1245,16 @@ def update_profile():
         logger.info(f"Profile updated for user {uid}")
         
         # Return updated profile
-        user_record = auth.get_user(uid)
-        user_data = user_ref.get().to_dict()
+        profile_version = profile_versions.get(uid)
+        user_record, user_doc = fanout.gather(lambda: user_records.get(uid), user_ref.get)
+        user_data = user_doc.to_dict()
         
         return jsonify({
             "success": True,
+            # A token with the new profile keeps /auth/verify on the claims path
+            "accessToken": create_access_token(
+                uid, user_record.email, "google.com", user_data.get("role"), user_record, profile_version
+            ),
             "profile": {
                 "uid": user_record.uid,
                 "email": user_record.email,
@@ -855,17 +1275,139 @@ def update_profile():
 @app.route("/auth/logout", methods=["POST"])
 @jwt_required("access")
 def logout():
-    """Logout endpoint (client should remove tokens)"""
+    """Logout endpoint that revokes the access token and, if sent, the refresh token"""
     uid = request.uid
+    claims = request.token_claims
+    if claims.get("jti"):
+        revoked_tokens.revoke(claims["jti"], claims["exp"])
+    
+    data = request.get_json(silent=True) or {}
+    if data.get("refreshToken"):
+        try:
+            payload = jwt.decode(data["refreshToken"], JWT_SECRET, algorithms=[JWT_ALGORITHM])
+            if payload.get("type") == "refresh" and payload.get("uid") == uid and payload.get("jti"):
+                revoked_tokens.revoke(payload["jti"], payload["exp"])
+        except jwt.InvalidTokenError:
+            # An expired or invalid refresh token cannot be used anyway
+            pass
+    
     logger.info(f"User {uid} logged out")
     return jsonify({"success": True, "message": "Logged out successfully"})
 
+# Resume Processing Pipeline
+def process_resume_file(stream, filename, uid, user_email, report_stage=None):
+    """Run the full resume pipeline for an uploaded file and store the result"""
+    report_stage = report_stage or (lambda stage: None)
+
+    # Step 1: Extract text
+    report_stage("extracting_text")
+    # Pages are normalized as they are parsed, the raw document text is never held in full
+    cleaned_text = "".join(normalize_stream(iter_text_from_file(stream, filename)))
+    if not cleaned_text:
+        raise ValueError('Could not extract text from file')
+    
+    # Step 2: Extract contact info
+    report_stage("extracting_contact_info")
+    contact_info = extract_contact_info(cleaned_text)
+    
+    # Check if user already has a resume, the resume id keys its persisted RAG index
+    content_hash = extraction_cache.key_for(cleaned_text)
+    user_ref = db.collection("users").document(uid)
+    user_data = user_ref.get().to_dict()
+    new_resume = not user_data.get("resumeId")
+    existing = {}
+    if new_resume:
+        resume_id = db.collection("resumes").document().id
+    else:
+        resume_id = user_data["resumeId"]
+        existing_resume = db.collection("resumes").document(resume_id).get()
+        existing = existing_resume.to_dict() if existing_resume.exists else {}
+        if existing.get("content_hash") != content_hash:
+            # The persisted index was built from the replaced resume
+            resume_index_store.invalidate(resume_id)
+    
+    # Step 3: Comprehensive processing with RAG
+    report_stage("analyzing")
+    comprehensive_results = extract_comprehensive_info_with_rag(cleaned_text, resume_id)
+    
+    # Step 4: Store in database
+    report_stage("saving")
+    resume_data = {
+        "name": contact_info.get("name"),
+        "email": contact_info.get("email") or user_email,
+        "phone": contact_info.get("phone"),
+        "technical_skills": comprehensive_results['technical_skills'],
+        "soft_skills": comprehensive_results['soft_skills'],
+        "programming_languages": comprehensive_results['programming_languages'],
+        "frameworks_tools": comprehensive_results['frameworks_tools'],
+        "certifications": comprehensive_results['certifications'],
+        "summary": comprehensive_results['summary'],
+        "experience_summary": comprehensive_results['experience_summary'],
+        "education_summary": comprehensive_results['education_summary'],
+        "projects": comprehensive_results.get('projects', 'Not available'),
+        "industries": comprehensive_results.get('industries', 'Not available'),
+        "career_level": comprehensive_results.get('career_level', 'Not available'),
+        # Fallback values are replaced by the next upload even when the text is unchanged
+        "extraction_complete": comprehensive_results.get('extraction_complete', False),
+        "raw_text": cleaned_text,
+        "content_hash": content_hash,
+        "userId": uid,
+        "createdAt": datetime.now(dt.UTC),
+        "updatedAt": datetime.now(dt.UTC),
+        "isActive": True
+    }
+    
+    resume_ref = db.collection("resumes").document(resume_id)
+    if not new_resume:
+        # Update existing resume, skipping the write when the content is unchanged
+        if existing.get("content_hash") != content_hash or not existing.get("extraction_complete"):
+            resume_ref.update(resume_data)
+    else:
+        # Create new resume
+        resume_ref.set(resume_data)
+        # Update user with resume ID
+        user_ref.update({"resumeId": resume_id})
+    
+    # Embed once per upload so matching does not have to
+    try:
+        get_resume_embedding(resume_id, resume_data)
+    except Exception as e:
+        logger.warning(f"Failed to embed resume {resume_id}: {e}")
+    
+    return {
+        'id': resume_id,
+        'contact_info': contact_info,
+        'technical_skills': comprehensive_results['technical_skills'],
+        'soft_skills': comprehensive_results['soft_skills'],
+        'programming_languages': comprehensive_results['programming_languages'],
+        'frameworks_tools': comprehensive_results['frameworks_tools'],
+        'certifications': comprehensive_results['certifications'],
+        'summary': comprehensive_results['summary'],
+        'message': 'Resume processed successfully'
+    }
+
+resume_job_queue = ResumeJobQueue(
+    process_resume_file,
+    db=db,
+    max_workers=RESUME_WORKERS,
+    max_pending=RESUME_MAX_PENDING,
+    stale_after=RESUME_JOB_STALE_AFTER
+)
+atexit.register(resume_job_queue.shutdown)
+
+# Jobs left unfinished by a dead worker would otherwise stay "processing" forever; jobs
+# owned by live workers keep a fresh heartbeat and are left alone
+try:
+    resume_job_queue.recover_stale()
+except Exception as e:
+    logger.warning(f"Stale resume job recovery failed: {e}")
+
 # Resume Processing Routes
 @app.route('/resume/upload', methods=['POST'])
 @jwt_required("access")
 @role_required("applicant")
 def upload_resume():
-    """Handle resume upload and processing for applicants"""
+    """Accept a resume upload and queue it for background processing"""
     if 'file' not in request.files:
         return jsonify({'error': 'No file uploaded'}), 400
     
@@ -875,85 +1417,51 @@ def upload_resume():
     
     if file and allowed_file(file.filename):
         filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
         
         try:
-            # Step 1: Extract text
-            raw_text = extract_text_from_file(filepath)
-            if not raw_text or len(raw_text.strip()) == 0:
-                return jsonify({'error': 'Could not extract text from file'}), 400
-            
-            cleaned_text = preprocess_text(raw_text)
-            
-            # Step 2: Extract contact info
-            contact_info = extract_contact_info(cleaned_text)
-            
-            # Step 3: Comprehensive processing with RAG
-            comprehensive_results = extract_comprehensive_info_with_rag(cleaned_text)
-            
-            # Step 4: Store in database
-            resume_data = {
-                "name": contact_info.get("name"),
-                "email": contact_info.get("email") or request.user_email,
-                "phone": contact_info.get("phone"),
-                "technical_skills": comprehensive_results['technical_skills'],
-                "soft_skills": comprehensive_results['soft_skills'],
-                "programming_languages": comprehensive_results['programming_languages'],
-                "frameworks_tools": comprehensive_results['frameworks_tools'],
-                "certifications": comprehensive_results['certifications'],
-                "summary": comprehensive_results['summary'],
-                "experience_summary": comprehensive_results['experience_summary'],
-                "education_summary": comprehensive_results['education_summary'],
-                "projects": comprehensive_results.get('projects', 'Not available'),
-                "industries": comprehensive_results.get('industries', 'Not available'),
-                "career_level": comprehensive_results.get('career_level', 'Not available'),
-                "raw_text": cleaned_text,
-                "userId": request.uid,
-                "createdAt": datetime.now(dt.UTC),
-                "updatedAt": datetime.now(dt.UTC),
-                "isActive": True
-            }
-            
-            # Check if user already has a resume
-            user_ref = db.collection("users").document(request.uid)
-            user_data = user_ref.get().to_dict()
-            
-            if user_data.get("resumeId"):
-                # Update existing resume
-                resume_ref = db.collection("resumes").document(user_data["resumeId"])
-                resume_ref.update(resume_data)
-                resume_id = user_data["resumeId"]
-            else:
-                # Create new resume
-                resume_ref = db.collection("resumes").document()
-                resume_id = resume_ref.id
-                resume_ref.set(resume_data)
-                # Update user with resume ID
-                user_ref.update({"resumeId": resume_id})
-            
-            return jsonify({
-                'id': resume_id,
-                'contact_info': contact_info,
-                'technical_skills': comprehensive_results['technical_skills'],
-                'soft_skills': comprehensive_results['soft_skills'],
-                'programming_languages': comprehensive_results['programming_languages'],
-                'frameworks_tools': comprehensive_results['frameworks_tools'],
-                'certifications': comprehensive_results['certifications'],
-                'summary': comprehensive_results['summary'],
-                'message': 'Resume processed successfully'
-            })
-            
+            stream = spool_upload(file)
+        except FileTooLargeError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        try:
+            job_id = resume_job_queue.submit(request.uid, request.user_email, filename, stream)
+        except QueueFullError as e:
+            return jsonify({'error': str(e)}), 503
         except Exception as e:
-            print(f"Processing error: {str(e)}")
-            return jsonify({'error': f'Processing error: {str(e)}'}), 500
-        finally:
-            # Clean up uploaded file
-            if os.path.exists(filepath):
-                os.remove(filepath)
+            logger.error(f"Failed to queue resume: {e}")
+            return jsonify({'error': f'Failed to queue resume: {str(e)}'}), 500
+        
+        response = jsonify({
+            'job_id': job_id,
+            'status': 'queued',
+            'status_url': f'/resume/jobs/{job_id}',
+            'message': 'Resume accepted for processing'
+        })
+        response.headers['Location'] = f'/resume/jobs/{job_id}'
+        return response, 202
     else:
         return jsonify({'error': 'Invalid file format. Only PDF and DOCX are supported.'}), 400
 
+@app.route('/resume/jobs/<job_id>', methods=['GET'])
+@jwt_required("access")
+@role_required("applicant")
+def get_resume_job(job_id):
+    """Get the processing status of a queued resume upload"""
+    try:
+        job = resume_job_queue.get(job_id)
+        
+        if not job or job.get('userId') != request.uid:
+            return jsonify({'error': 'Job not found'}), 404
+        
+        # Convert datetime objects to ISO strings
+        for field in ('createdAt', 'updatedAt'):
+            if job.get(field):
+                job[field] = job[field].isoformat()
+        
+        return jsonify(job), 200
+    except Exception as e:
+        return jsonify({'error': f'Failed to get job status: {str(e)}'}), 500
+
 @app.route('/resume', methods=['GET'])
 @jwt_required("access")
 @role_required("applicant")
@@ -1021,7 +1529,7 @@ def post_job():
             'compensation_info': '',
             'additional_details': '',
             'pdf_summary': '',
-            'applicants': []  # Track applicants
+            'applicant_count': 0  # Applicants live in the jobs/<id>/applicants subcollection
         }
         
         pdf_processing_error = None
@@ -1043,19 +1551,20 @@ def post_job():
                 if file_size > MAX_FILE_SIZE:
                     return jsonify({'error': 'File size exceeds 5MB limit'}), 400
                 
-                # Save file temporarily
                 filename = secure_filename(pdf_file.filename)
-                temp_path = os.path.join(tempfile.gettempdir(), f"{job_id}_{filename}")
-                pdf_file.save(temp_path)
                 
                 try:
-                    # Extract text from PDF
-                    pdf_text = extract_text_from_file(temp_path)
+                    # Chunk pages as they are parsed and stop once the summary has enough context
+                    pdf_text = TextPrefix(iter_text_from_file(pdf_file.stream, filename), 2000)
+                    text_chunks = []
+                    context_size = 0
+                    for chunk in chunk_stream(pdf_text):
+                        text_chunks.append(chunk)
+                        context_size += len(chunk) + 1
+                        if context_size >= SUMMARY_CONTEXT_CHARS:
+                            break
                     
-                    if pdf_text.strip():
-                        # Chunk the text for better processing
-                        text_chunks = chunk_text(pdf_text)
-                        
+                    if any(chunk.strip() for chunk in text_chunks):
                         # Process with OpenAI
                         job_context = {
                             'title': title,
@@ -1075,7 +1584,7 @@ def post_job():
                             'compensation_info': ai_result.get('compensation_info', ''),
                             'additional_details': ai_result.get('additional_details', ''),
                             'pdf_summary': ai_result.get('summary', ''),
-                            'original_pdf_text': pdf_text[:2000],  # Store first 2000 chars
+                            'original_pdf_text': pdf_text.text,  # Store first 2000 chars
                             'pdf_processed': True,
                             'ai_enhanced': True
                         })
@@ -1085,17 +1594,15 @@ def post_job():
                 
                 except Exception as e:
                     pdf_processing_error = str(e)
-                
-                finally:
-                    # Clean up temporary file
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
         
         # Save job to Firebase Firestore
         try:
             # Add the job document to the 'jobs' collection
             job_ref = db.collection('jobs').document(job_id)
             job_ref.set(job_data)
+            job_catalogue.upsert(job_id, job_data)
+            skill_index.upsert(job_id, job_data)
+            store_job_embedding(job_id, job_data)
             
             # Also add to user's posted jobs collection for easier querying
             user_jobs_ref = db.collection('users').document(request.uid).collection('posted_jobs').document(job_id)
@@ -1135,14 +1642,26 @@ def get_job_details(job_id):
         if not db:
             return jsonify({'error': 'Firebase not initialized'}), 500
             
-        # Get job from Firebase
-        job_ref = db.collection('jobs').document(job_id)
-        job_doc = job_ref.get()
+        # Active jobs are in the catalogue, inactive ones still come from Firebase
+        job_data = job_catalogue.get(job_id)
+        if job_data is None:
+            job_doc = db.collection('jobs').document(job_id).get()
+            
+            if not job_doc.exists:
+                return jsonify({'error': 'Job not found'}), 404
+            
+            job_data = job_doc.to_dict()
+            job_data.pop('original_pdf_text', None)
+            job_data.pop('applicants', None)  # Left over on jobs not yet migrated
         
-        if not job_doc.exists:
-            return jsonify({'error': 'Job not found'}), 404
+        # Applicant counts only go to the job owner, which also keeps them out of everyone else's ETag
+        if job_data.get('posted_by') != request.uid:
+            job_data.pop('applicant_count', None)
         
-        job_data = job_doc.to_dict()
+        etag = compute_etag(request.path, job_fingerprint(job_id, job_data), job_data.get('is_active'))
+        cached = not_modified(etag)
+        if cached:
+            return cached
         
         # Convert datetime objects to ISO strings for JSON serialization
         if 'created_at' in job_data and job_data['created_at']:
@@ -1150,7 +1669,9 @@ def get_job_details(job_id):
         if 'updated_at' in job_data and job_data['updated_at']:
             job_data['updated_at'] = job_data['updated_at'].isoformat()
         
-        return jsonify(job_data), 200
+        response = jsonify(job_data)
+        response.set_etag(etag)
+        return response, 200
     
     except Exception as e:
         return jsonify({'error': f'Failed to retrieve job details: {str(e)}'}), 500
@@ -1159,18 +1680,34 @@ def get_job_details(job_id):
 @jwt_required("access")
 @role_required("requester")
 def get_my_jobs():
-    """Get all jobs posted by the current user"""
+    """Get a page of jobs posted by the current user, newest first"""
     try:
         if not db:
             return jsonify({'error': 'Firebase not initialized'}), 500
+        
+        try:
+            limit, cursor, fields = parse_page_args(
+                request.args, JOB_FIELDS, MY_JOB_LIST_FIELDS, LIST_PAGE_SIZE, LIST_MAX_PAGE_SIZE
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
             
-        # Query jobs posted by current user
-        jobs_ref = db.collection('jobs').where('posted_by', '==', request.uid).where('is_active', '==', True)
-        jobs = jobs_ref.stream()
+        etag = None
+        page = catalogue_page(limit, cursor, fields, owner=request.uid)
+        if page is not None:
+            jobs, next_cursor, fingerprints = page
+            etag = compute_etag(request.path, fields, fingerprints, next_cursor)
+            cached = not_modified(etag)
+            if cached:
+                return cached
+        else:
+            # Query jobs posted by current user
+            jobs_ref = db.collection('jobs').where('posted_by', '==', request.uid).where('is_active', '==', True)
+            jobs, next_cursor = paginate(jobs_ref, 'created_at', limit, cursor, fields)
+            jobs = [job.to_dict() for job in jobs]
         
         job_list = []
-        for job in jobs:
-            job_data = job.to_dict()
+        for job_data in jobs:
             
             # Convert datetime objects to ISO strings
             if 'created_at' in job_data and job_data['created_at']:
@@ -1180,13 +1717,14 @@ def get_my_jobs():
             
             job_list.append(job_data)
         
-        # Sort by creation date (most recent first)
-        job_list.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        
-        return jsonify({
+        response = jsonify({
             'jobs': job_list,
-            'total': len(job_list)
-        }), 200
+            'total': len(job_list),
+            'next_cursor': next_cursor
+        })
+        if etag:
+            response.set_etag(etag)
+        return response, 200
     
     except Exception as e:
         return jsonify({'error': f'Failed to retrieve jobs: {str(e)}'}), 500
@@ -1218,14 +1756,15 @@ def update_job(job_id):
         allowed_fields = ['title', 'company', 'location', 'description', 'is_active']
         
         # Update only allowed fields
-        for field in allowed_fields:
-            if field in update_data:
-                job_data[field] = update_data[field]
+        changes = {field: update_data[field] for field in allowed_fields if field in update_data}
+        changes['updated_at'] = datetime.now(dt.UTC)
+        job_data.update(changes)
         
-        job_data['updated_at'] = datetime.now(dt.UTC)
-        
-        # Update in Firebase
-        job_ref.update(job_data)
+        # Write only the changed fields so concurrent applicant counts are not overwritten
+        job_ref.update(changes)
+        job_catalogue.upsert(job_id, job_data)
+        skill_index.upsert(job_id, job_data)
+        store_job_embedding(job_id, job_data)
         
         # Convert datetime for response
         if 'created_at' in job_data and job_data['created_at']:
@@ -1268,27 +1807,76 @@ def delete_job(job_id):
             'is_active': False,
             'updated_at': datetime.now(dt.UTC)
         })
+        job_catalogue.remove(job_id)
+        skill_index.remove(job_id)
+        store_job_embedding(job_id, {'is_active': False})
         
         return jsonify({'message': 'Job deleted successfully'}), 200
     
     except Exception as e:
         return jsonify({'error': f'Failed to delete job: {str(e)}'}), 500
 
+def catalogue_page(limit, cursor, fields, owner=None):
+    """Serve a page of active jobs from the in-memory catalogue, or None if it lacks some fields
+
+    Returns the projected jobs, the next cursor and the page's job fingerprints.
+    """
+    if not set(fields) <= set(MY_JOB_LIST_FIELDS):
+        return None
+    after = decode_cursor(cursor) if cursor else None
+    jobs, has_more = job_catalogue.page(limit, after, owner)
+    next_cursor = make_cursor(jobs[-1][1]['created_at'], jobs[-1][0]) if has_more else None
+    fingerprints = [job_fingerprint(job_id, job) for job_id, job in jobs]
+    return [{field: job[field] for field in fields if field in job} for _, job in jobs], next_cursor, fingerprints
+
+def job_fingerprint(job_id, job_data):
+    """What a job's JSON depends on, for building ETags without serializing it"""
+    return [job_id, str(job_data.get('updated_at')), job_data.get('applicant_count', 0)]
+
+def compute_etag(*parts):
+    """Strong ETag for a response determined by the given parts"""
+    return hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()[:32]
+
+def not_modified(etag):
+    """Return a 304 response if the client already holds this ETag, else None"""
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag)
+        return response
+    return None
+
 @app.route('/jobs', methods=['GET'])
 @jwt_required("access")
 def get_all_jobs():
-    """Get all active jobs (for applicants to browse)"""
+    """Get a page of active jobs, newest first (for applicants to browse)"""
     try:
         if not db:
             return jsonify({'error': 'Firebase not initialized'}), 500
+        
+        try:
+            limit, cursor, fields = parse_page_args(
+                request.args, JOB_FIELDS, JOB_LIST_FIELDS, LIST_PAGE_SIZE, LIST_MAX_PAGE_SIZE
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
             
-        # Query active jobs
-        jobs_ref = db.collection('jobs').where('is_active', '==', True)
-        jobs = jobs_ref.stream()
+        etag = None
+        page = catalogue_page(limit, cursor, fields)
+        if page is not None:
+            jobs, next_cursor, fingerprints = page
+            # Polling clients that are up to date get a 304 before anything is serialized
+            etag = compute_etag(request.path, fields, fingerprints, next_cursor)
+            cached = not_modified(etag)
+            if cached:
+                return cached
+        else:
+            # Fields the catalogue does not hold come straight from Firestore
+            jobs_ref = db.collection('jobs').where('is_active', '==', True)
+            jobs, next_cursor = paginate(jobs_ref, 'created_at', limit, cursor, fields)
+            jobs = [job.to_dict() for job in jobs]
         
         job_list = []
-        for job in jobs:
-            job_data = job.to_dict()
+        for job_data in jobs:
             
             # Convert datetime objects to ISO strings
             if 'created_at' in job_data and job_data['created_at']:
@@ -1296,19 +1884,16 @@ def get_all_jobs():
             if 'updated_at' in job_data and job_data['updated_at']:
                 job_data['updated_at'] = job_data['updated_at'].isoformat()
             
-            # Remove large fields to reduce payload
-            if 'original_pdf_text' in job_data:
-                del job_data['original_pdf_text']
-            
             job_list.append(job_data)
         
-        # Sort by creation date (most recent first)
-        job_list.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        
-        return jsonify({
+        response = jsonify({
             'jobs': job_list,
-            'total': len(job_list)
-        }), 200
+            'total': len(job_list),
+            'next_cursor': next_cursor
+        })
+        if etag:
+            response.set_etag(etag)
+        return response, 200
     
     except Exception as e:
         return jsonify({'error': f'Failed to retrieve jobs: {str(e)}'}), 500
@@ -1318,16 +1903,22 @@ def get_all_jobs():
 @jwt_required("access")
 @role_required("applicant")
 def apply_to_job(job_id):
-    """Apply to a job with the current user's resume"""
+    """Apply to a job with the current user's resume, safe to retry"""
     try:
+        idempotency_key = request.headers.get('Idempotency-Key')
+        if idempotency_key and len(idempotency_key) > 255:
+            return jsonify({'error': 'Idempotency-Key must be at most 255 characters'}), 400
+        
         # Get job details
         job_ref = db.collection('jobs').document(job_id)
-        job_doc = job_ref.get()
-        
-        if not job_doc.exists:
-            return jsonify({'error': 'Job not found'}), 404
-        
-        job_data = job_doc.to_dict()
+        job_data = job_catalogue.get(job_id)
+        if job_data is None:
+            job_doc = job_ref.get()
+            
+            if not job_doc.exists:
+                return jsonify({'error': 'Job not found'}), 404
+            
+            job_data = job_doc.to_dict()
         
         if not job_data.get('is_active', False):
             return jsonify({'error': 'This job is no longer active'}), 400
@@ -1346,47 +1937,66 @@ def apply_to_job(job_id):
             return jsonify({'error': 'Resume not found'}), 404
         
         # Create application
-        application_id = str(uuid.uuid4())
+        application_id = str(uuid.uuid5(APPLICATION_ID_NAMESPACE, f"{job_id}/{request.uid}"))
+        applied_at = datetime.now(dt.UTC)
         application_data = {
             'id': application_id,
             'job_id': job_id,
             'applicant_id': request.uid,
             'resume_id': user_data['resumeId'],
             'status': 'submitted',
-            'applied_at': datetime.now(dt.UTC),
-            'updated_at': datetime.now(dt.UTC),
+            'applied_at': applied_at,
+            'updated_at': applied_at,
             'applicant_name': resume_data.get('name', ''),
             'applicant_email': resume_data.get('email', ''),
             'job_title': job_data['title'],
-            'company': job_data['company']
+            'company': job_data['company'],
+            'idempotency_key': idempotency_key
+        }
+        success = {
+            'message': 'Application submitted successfully',
+            'application_id': application_id
         }
         
-        # Store application
-        db.collection('applications').document(application_id).set(application_data)
-        
-        # Add applicant to job
-        job_ref.update({
-            'applicants': firestore.ArrayUnion([{
-                'applicant_id': request.uid,
-                'application_id': application_id,
-                'status': 'submitted',
-                'applied_at': datetime.now(dt.UTC)
-            }])
+        # All writes commit together; create() fails the whole batch if this pair already applied
+        application_ref = db.collection('applications').document(application_id)
+        batch = db.batch()
+        batch.create(application_ref, application_data)
+        # The job document itself only keeps a count
+        batch.set(job_ref.collection('applicants').document(application_id), {
+            'applicant_id': request.uid,
+            'application_id': application_id,
+            'status': 'submitted',
+            'applied_at': applied_at
         })
-        
-        # Add to user's applications
-        user_ref.collection('applications').document(application_id).set({
+        batch.update(job_ref, {'applicant_count': firestore.Increment(1)})
+        batch.set(user_ref.collection('applications').document(application_id), {
             'job_id': job_id,
             'job_title': job_data['title'],
             'company': job_data['company'],
             'status': 'submitted',
-            'applied_at': datetime.now(dt.UTC)
+            'applied_at': applied_at
         })
         
-        return jsonify({
-            'message': 'Application submitted successfully',
-            'application_id': application_id
-        }), 201
+        try:
+            batch.commit()
+        except AlreadyExists:
+            # A retry with the same key gets the original response, anything else is a duplicate
+            existing = application_ref.get().to_dict() or {}
+            if idempotency_key and existing.get('idempotency_key') == idempotency_key:
+                response = jsonify(success)
+                response.headers['Idempotent-Replayed'] = 'true'
+                return response, 201
+            return jsonify({
+                'error': 'You have already applied to this job',
+                'application_id': application_id
+            }), 409
+        
+        # Relative to the cached count, not the one read above, so concurrent applications all count.
+        # A counter change is not worth a catalogue reload on every other worker.
+        job_catalogue.increment(job_id, 'applicant_count')
+        
+        return jsonify(success), 201
     
     except Exception as e:
         return jsonify({'error': f'Failed to submit application: {str(e)}'}), 500
@@ -1395,49 +2005,79 @@ def apply_to_job(job_id):
 @jwt_required("access")
 @role_required("requester")
 def get_job_applicants(job_id):
-    """Get all applicants for a job (for recruiters)"""
+    """Get a page of applicants for a job, newest first (for recruiters)"""
     try:
+        # Resume fields to return, the skills used for scoring are always read
+        try:
+            limit, cursor, fields = parse_page_args(
+                request.args, RESUME_FIELDS, APPLICANT_RESUME_FIELDS, LIST_PAGE_SIZE, LIST_MAX_PAGE_SIZE
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
         # Verify job exists and belongs to requester
         job_ref = db.collection('jobs').document(job_id)
-        job_doc = job_ref.get()
-        
-        if not job_doc.exists:
-            return jsonify({'error': 'Job not found'}), 404
-        
-        job_data = job_doc.to_dict()
+        job_data = job_catalogue.get(job_id)
+        if job_data is None:
+            job_doc = job_ref.get()
+            
+            if not job_doc.exists:
+                return jsonify({'error': 'Job not found'}), 404
+            
+            job_data = job_doc.to_dict()
         
         if job_data.get('posted_by') != request.uid:
             return jsonify({'error': 'Unauthorized to view applicants for this job'}), 403
         
-        # Get applicants from job document
-        applicants = job_data.get('applicants', [])
+        # Get one page of applicants from the job's subcollection
+        applicant_docs, next_cursor = paginate(job_ref.collection('applicants'), 'applied_at', limit, cursor)
+        applicants = [doc.to_dict() for doc in applicant_docs]
+        
+        # Get detailed applicant info with batched reads
+        resumes = fetch_applicant_resumes(
+            db,
+            [applicant['applicant_id'] for applicant in applicants],
+            set(fields) | {'technical_skills', 'programming_languages'},
+            chunk_size=APPLICANT_READ_CHUNK,
+            max_workers=APPLICANT_READ_WORKERS
+        )
         
-        # Get detailed applicant info
         detailed_applicants = []
+        applicant_skills = {}
         for applicant in applicants:
-            # Get user info
-            user_ref = db.collection('users').document(applicant['applicant_id'])
-            user_data = user_ref.get().to_dict()
-            
-            # Get resume info
-            resume_ref = db.collection('resumes').document(user_data.get('resumeId', ''))
-            resume_data = resume_ref.get().to_dict()
+            resume_data = resumes.get(applicant['applicant_id'])
             
             if resume_data:
-                detailed_applicants.append({
+                detailed_applicant = {
                     'application_id': applicant['application_id'],
                     'applicant_id': applicant['applicant_id'],
-                    'name': resume_data.get('name', ''),
-                    'email': resume_data.get('email', ''),
-                    'summary': resume_data.get('summary', ''),
-                    'technical_skills': resume_data.get('technical_skills', []),
                     'status': applicant.get('status', 'submitted'),
                     'applied_at': applicant.get('applied_at').isoformat() if applicant.get('applied_at') else None
-                })
+                }
+                for field in fields:
+                    detailed_applicant[field] = resume_data.get(field, [] if field in RESUME_LIST_FIELDS else '')
+                detailed_applicants.append(detailed_applicant)
+                applicant_skills[applicant['application_id']] = resume_match_skills(resume_data)
+        
+        # Score every applicant against the job in one pass
+        matches = BulkMatcher().top_matches(
+            applicant_skills, {job_id: list(job_skills(job_data))}, k=1, min_score=0.0
+        )
+        for applicant in detailed_applicants:
+            best = matches.get(applicant['application_id'])
+            _, score, common_skills = best[0] if best else (None, 0.0, [])
+            applicant['match_score'] = round(score * 100, 1)
+            applicant['matching_skills'] = common_skills
+        
+        # Ranks the applicants on this page
+        if request.args.get('sort') == 'match':
+            detailed_applicants.sort(key=lambda x: x['match_score'], reverse=True)
         
         return jsonify({
             'applicants': detailed_applicants,
-            'total': len(detailed_applicants)
+            'total': len(detailed_applicants),
+            'applicant_count': job_data.get('applicant_count', 0),
+            'next_cursor': next_cursor
         }), 200
     
     except Exception as e:
@@ -1447,10 +2087,17 @@ def get_job_applicants(job_id):
 @jwt_required("access")
 @role_required("applicant")
 def get_my_applications():
-    """Get all applications submitted by the current user"""
+    """Get a page of applications submitted by the current user, newest first"""
     try:
+        try:
+            limit, cursor, fields = parse_page_args(
+                request.args, APPLICATION_FIELDS, None, LIST_PAGE_SIZE, LIST_MAX_PAGE_SIZE
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
         applications_ref = db.collection('users').document(request.uid).collection('applications')
-        applications = applications_ref.stream()
+        applications, next_cursor = paginate(applications_ref, 'applied_at', limit, cursor, fields)
         
         application_list = []
         for app in applications:
@@ -1463,12 +2110,10 @@ def get_my_applications():
             
             application_list.append(app_data)
         
-        # Sort by application date (most recent first)
-        application_list.sort(key=lambda x: x.get('applied_at', ''), reverse=True)
-        
         return jsonify({
             'applications': application_list,
-            'total': len(application_list)
+            'total': len(application_list),
+            'next_cursor': next_cursor
         }), 200
     
     except Exception as e:
@@ -1479,8 +2124,17 @@ def get_my_applications():
 @jwt_required("access")
 @role_required("applicant")
 def get_matched_jobs():
-    """Get jobs that match the applicant's skills"""
+    """Get jobs that match the applicant's resume, best first, one page at a time"""
     try:
+        try:
+            limit = min(max(int(request.args.get('limit', MATCH_PAGE_SIZE)), 1), MATCH_MAX_PAGE_SIZE)
+            offset = max(int(request.args.get('offset', 0)), 0)
+        except ValueError:
+            return jsonify({'error': 'limit and offset must be integers'}), 400
+        mode = request.args.get('mode', MATCH_DEFAULT_MODE)
+        if mode not in ('semantic', 'skills'):
+            return jsonify({'error': 'mode must be semantic or skills'}), 400
+        
         # Get user's resume
         user_ref = db.collection('users').document(request.uid)
         user_data = user_ref.get().to_dict()
@@ -1494,51 +2148,204 @@ def get_matched_jobs():
         if not resume_data:
             return jsonify({'error': 'Resume not found'}), 404
         
-        # Get active jobs
-        jobs_ref = db.collection('jobs').where('is_active', '==', True)
-        jobs = jobs_ref.stream()
+        user_skills = resume_match_skills(resume_data)
         
-        matched_jobs = []
-        user_skills = set(resume_data.get('technical_skills', []) + resume_data.get('programming_languages', []))
+        matches = None
+        if mode == 'semantic' and not len(job_vector_index):
+            # Nothing embedded yet, semantic matching would come back empty
+            logger.warning("Job vector index is empty, falling back to skills")
+            mode = 'skills'
+        if mode == 'semantic':
+            try:
+                # Nearest jobs by cosine similarity, one extra to know if another page follows
+                resume_vector = get_resume_embedding(user_data['resumeId'], resume_data)
+                matches = job_vector_index.search(
+                    resume_vector, k=limit + 1, offset=offset, min_score=SEMANTIC_MATCH_MIN_SCORE
+                )
+            except Exception as e:
+                logger.warning(f"Semantic matching unavailable, falling back to skills: {e}")
+                mode = 'skills'
+        if matches is None:
+            # Only jobs sharing at least one skill are scored, straight from the index
+            matches = [
+                (job_id, score) for job_id, score, _ in
+                skill_index.match(user_skills, min_score=MATCH_MIN_SCORE)[offset:offset + limit + 1]
+            ]
+        
+        has_more = len(matches) > limit
+        matches = matches[:limit]
+        cached_jobs = job_catalogue.get_many([job_id for job_id, _ in matches])
+        cached_jobs = {
+            job_id: {field: job[field] for field in JOB_LIST_FIELDS if field in job}
+            for job_id, job in cached_jobs.items()
+        }
+        wanted_skills = {normalize_skill(skill): skill for skill in user_skills if str(skill).strip()}
         
-        for job in jobs:
-            job_data = job.to_dict()
+        matched_jobs = []
+        for job_id, match_score in matches:
+            job_data = cached_jobs.get(job_id)
+            # The indexes may briefly lag writes made by other workers
+            if not job_data:
+                continue
             
-            # Calculate match score based on skills
-            job_skills = set(job_data.get('key_requirements', []) + job_data.get('preferred_qualifications', []))
-            common_skills = user_skills.intersection(job_skills)
-            match_score = len(common_skills) / len(job_skills) if len(job_skills) > 0 else 0
+            # Convert datetime objects to ISO strings
+            if 'created_at' in job_data and job_data['created_at']:
+                job_data['created_at'] = job_data['created_at'].isoformat()
+            if 'updated_at' in job_data and job_data['updated_at']:
+                job_data['updated_at'] = job_data['updated_at'].isoformat()
             
-            # Only include jobs with at least 30% match
-            if match_score >= 0.3:
-                # Convert datetime to string
-                if 'created_at' in job_data and job_data['created_at']:
-                    job_data['created_at'] = job_data['created_at'].isoformat()
-                
-                # Remove large fields to reduce payload
-                if 'original_pdf_text' in job_data:
-                    del job_data['original_pdf_text']
-                
-                job_data['match_score'] = round(match_score * 100, 1)
-                job_data['matching_skills'] = list(common_skills)
-                matched_jobs.append(job_data)
-        
-        # Sort by match score (highest first)
-        matched_jobs.sort(key=lambda x: x['match_score'], reverse=True)
+            job_data['match_score'] = round(match_score * 100, 1)
+            required_skills = job_skills(job_data)
+            job_data['matching_skills'] = [
+                skill for normalized, skill in wanted_skills.items() if normalized in required_skills
+            ]
+            matched_jobs.append(job_data)
         
         return jsonify({
             'jobs': matched_jobs,
-            'total': len(matched_jobs)
+            'total': len(matched_jobs),
+            'mode': mode,
+            'offset': offset,
+            'limit': limit,
+            'next_offset': offset + limit if has_more else None
         }), 200
     
     except Exception as e:
         return jsonify({'error': f'Failed to get matched jobs: {str(e)}'}), 500
 
+# Batch commands
+@app.cli.command("recommend-jobs")
+@click.option("--output", type=click.File("w"), default="-", help="JSON lines file, stdout by default")
+@click.option("--top", default=10, show_default=True, help="Jobs recommended per resume")
+@click.option("--min-score", default=MATCH_MIN_SCORE, show_default=True, help="Minimum match score (0-1)")
+def recommend_jobs(output, top, min_score):
+    """Score every active resume against every active job and write the best matches"""
+    jobs = {}
+    job_titles = {}
+    jobs_ref = db.collection('jobs').where('is_active', '==', True)
+    for job in jobs_ref.select(['title', 'company', 'key_requirements', 'preferred_qualifications']).stream():
+        job_data = job.to_dict()
+        jobs[job.id] = list(job_skills(job_data))
+        job_titles[job.id] = (job_data.get('title', ''), job_data.get('company', ''))
+    
+    resumes = {}
+    resume_owners = {}
+    resumes_ref = db.collection('resumes').where('isActive', '==', True)
+    for resume in resumes_ref.select(['userId', 'email', 'technical_skills', 'programming_languages']).stream():
+        resume_data = resume.to_dict()
+        resumes[resume.id] = resume_match_skills(resume_data)
+        resume_owners[resume.id] = (resume_data.get('userId'), resume_data.get('email'))
+    
+    start = time.perf_counter()
+    matches = BulkMatcher().top_matches(resumes, jobs, k=max(top, 1), min_score=min_score)
+    logger.info(f"Scored {len(resumes)} resumes against {len(jobs)} jobs in {time.perf_counter() - start:.2f}s")
+    
+    for resume_id, resume_matches in matches.items():
+        if not resume_matches:
+            continue
+        user_id, email = resume_owners[resume_id]
+        output.write(json.dumps({
+            'resume_id': resume_id,
+            'user_id': user_id,
+            'email': email,
+            'jobs': [
+                {
+                    'job_id': job_id,
+                    'title': job_titles[job_id][0],
+                    'company': job_titles[job_id][1],
+                    'match_score': round(score * 100, 1),
+                    'matching_skills': common_skills
+                }
+                for job_id, score, common_skills in resume_matches
+            ]
+        }) + "\n")
+
+@app.cli.command("backfill-job-embeddings")
+@click.option("--dry-run", is_flag=True, help="Report how many jobs would be embedded without writing")
+@click.option("--force", is_flag=True, help="Re-embed jobs that already have a stored vector")
+def backfill_job_embeddings(dry_run, force):
+    """Embed active jobs without a stored vector, so semantic matching covers jobs posted before it"""
+    chunk_size = 100  # Jobs embedded per call and written per batch, well under Firestore's request size cap
+    fields = ['title', 'description', 'enhanced_description', 'key_requirements',
+              'preferred_qualifications', 'key_responsibilities']
+    jobs_ref = db.collection('jobs').where('is_active', '==', True)
+    jobs = {job.id: job.to_dict() for job in jobs_ref.select(fields).stream()}
+    
+    if not force:
+        embedding_refs = {job_id: db.collection('job_embeddings').document(job_id) for job_id in jobs}
+        stored = get_all_batched(db, list(embedding_refs.values()), field_paths=['is_active'])
+
+        def embedded(job_id):
+            snapshot = stored.get(embedding_refs[job_id].path)
+            return snapshot is not None and snapshot.exists and (snapshot.to_dict() or {}).get('is_active')
+
+        jobs = {job_id: job_data for job_id, job_data in jobs.items() if not embedded(job_id)}
+    
+    click.echo(f"{len(jobs)} active jobs to embed")
+    if dry_run:
+        return
+    
+    embeddings = get_embeddings()
+    job_ids = list(jobs)
+    for start in range(0, len(job_ids), chunk_size):
+        chunk = job_ids[start:start + chunk_size]
+        vectors = embeddings.embed_documents([job_embedding_text(jobs[job_id]) for job_id in chunk])
+        batch = db.batch()
+        for job_id, vector in zip(chunk, vectors):
+            batch.set(db.collection('job_embeddings').document(job_id), {
+                'vector': vector,
+                'is_active': True,
+                'updated_at': datetime.now(dt.UTC)
+            })
+        batch.commit()
+        click.echo(f"Embedded {start + len(chunk)}/{len(job_ids)} jobs")
+    
+    # Running workers pick the vectors up on their next index refresh
+    click.echo("Done. Set MATCH_DEFAULT_MODE=semantic to make semantic matching the default.")
+
+@app.cli.command("migrate-applicants")
+@click.option("--dry-run", is_flag=True, help="Report what would move without writing")
+def migrate_applicants(dry_run):
+    """Move applicants arrays on job documents into jobs/<id>/applicants subcollections"""
+    batch_limit = 500  # Firestore's cap on writes per batch
+    migrated_jobs = 0
+    migrated_applicants = 0
+    
+    for job in db.collection('jobs').select(['applicants']).stream():
+        applicants = (job.to_dict() or {}).get('applicants')
+        if applicants is None:
+            continue
+        
+        job_ref = db.collection('jobs').document(job.id)
+        applicants_ref = job_ref.collection('applicants')
+        if not dry_run:
+            # Application ids are the document ids, so re-running overwrites instead of duplicating
+            for start in range(0, len(applicants), batch_limit):
+                batch = db.batch()
+                for applicant in applicants[start:start + batch_limit]:
+                    batch.set(applicants_ref.document(applicant['application_id']), applicant)
+                batch.commit()
+            
+            # Count the subcollection so applications made through the new path are included
+            applicant_count = applicants_ref.count().get()[0][0].value
+            job_ref.update({'applicant_count': applicant_count, 'applicants': firestore.DELETE_FIELD})
+        
+        migrated_jobs += 1
+        migrated_applicants += len(applicants)
+        click.echo(f"{job.id}: {len(applicants)} applicants")
+    
+    action = "Would migrate" if dry_run else "Migrated"
+    click.echo(f"{action} {migrated_applicants} applicants across {migrated_jobs} jobs")
+
 # Error Handlers
 @app.errorhandler(404)
 def not_found(error):
     return jsonify({"error": "Endpoint not found"}), 404
 
+@app.errorhandler(413)
+def request_too_large(error):
+    return jsonify({"error": f"File size exceeds {MAX_FILE_SIZE // (1024 * 1024)}MB limit"}), 413
+
 @app.errorhandler(500)
 def internal_error(error):
     logger.error(f"Internal server error: {error}")
@@ -1551,6 +2358,14 @@ def add_security_headers(response):
     response.headers["X-Content-Type-Options"] = "nosniff"
     response.headers["X-Frame-Options"] = "DENY"
     response.headers["Content-Security-Policy"] = "default-src 'self'"
+    
+    # Responses with an ETag may be kept by the client but must be revalidated, nothing else is stored
+    if "Cache-Control" not in response.headers:
+        if request.method == "GET" and response.headers.get("ETag"):
+            response.headers["Cache-Control"] = "private, no-cache"
+        else:
+            response.headers["Cache-Control"] = "no-store"
+        response.vary.add("Authorization")
     return response
 
 if __name__ == "__main__":
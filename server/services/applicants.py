@@ -0,0 +1,30 @@
+from utils.batch_reads import get_all_batched
+
+def fetch_applicant_resumes(db, applicant_ids, resume_fields, chunk_size=100, max_workers=4):
+    """Return applicant id -> projected resume for applicants that have one
+
+    Reads every user document, then every resume, as two rounds of batched
+    get_all calls instead of two reads per applicant.
+    """
+    user_refs = [db.collection('users').document(applicant_id) for applicant_id in applicant_ids]
+    users = get_all_batched(db, user_refs, ['resumeId'], chunk_size, max_workers)
+
+    resume_ids = {}
+    for applicant_id, user_ref in zip(applicant_ids, user_refs):
+        user = users.get(user_ref.path)
+        resume_id = user.to_dict().get('resumeId') if user is not None and user.exists else None
+        if resume_id:
+            resume_ids[applicant_id] = resume_id
+
+    resume_refs = {
+        applicant_id: db.collection('resumes').document(resume_id)
+        for applicant_id, resume_id in resume_ids.items()
+    }
+    resumes = get_all_batched(db, list(resume_refs.values()), list(resume_fields), chunk_size, max_workers)
+
+    found = {}
+    for applicant_id, resume_ref in resume_refs.items():
+        resume = resumes.get(resume_ref.path)
+        if resume is not None and resume.exists:
+            found[applicant_id] = resume.to_dict()
+    return found
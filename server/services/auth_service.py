@@ -1,6 +1,10 @@
 from firebase_admin import auth
 from firebase.firebase_client import db
 from utils.jwt_utils import create_access_token, create_refresh_token
+from services.user_record_cache import get_user_record_cache
+from services.profile_versions import get_profile_versions
+from services.write_behind import get_write_behind
+from utils.concurrency import get_fanout
 from datetime import datetime
 import datetime as dt
 import logging
@@ -19,12 +23,12 @@ class AuthService:
         if provider_id != "google.com":
             raise ValueError("Only Google Sign-In is supported")
         
+        profile_version = get_profile_versions().get(uid)
         user_ref = db.collection("users").document(uid)
-        if user_ref.get().exists:
+        user_doc, user_record = get_fanout().gather(user_ref.get, lambda: get_user_record_cache().get(uid))
+        if user_doc.exists:
             raise ValueError("User already exists")
         
-        user_record = auth.get_user(uid)
-        
         user_data = {
             "email": email,
             "displayName": user_record.display_name,
@@ -38,7 +42,7 @@ class AuthService:
         
         user_ref.set(user_data)
         
-        access_token = create_access_token(uid, email, provider_id, role)
+        access_token = create_access_token(uid, email, provider_id, role, user_record, profile_version)
         refresh_token = create_refresh_token(uid)
         
         return {
@@ -65,8 +69,9 @@ class AuthService:
         if provider_id != "google.com":
             raise ValueError("Only Google Sign-In is supported")
         
+        profile_version = get_profile_versions().get(uid)
         user_ref = db.collection("users").document(uid)
-        user_doc = user_ref.get()
+        user_doc, user_record = get_fanout().gather(user_ref.get, lambda: get_user_record_cache().get(uid))
         
         if not user_doc.exists:
             raise ValueError("Account not found")
@@ -74,14 +79,12 @@ class AuthService:
         user_data = user_doc.to_dict()
         if user_data.get("role") != role:
             raise ValueError(f"Account exists with different role: {user_data.get('role')}")
-        
-        user_record = auth.get_user(uid)
-        user_ref.update({
+        get_write_behind(db, "users").update(uid, {
             "lastLogin": datetime.now(dt.UTC),
             "updatedAt": datetime.now(dt.UTC)
         })
         
-        access_token = create_access_token(uid, email, provider_id, role)
+        access_token = create_access_token(uid, email, provider_id, role, user_record, profile_version)
         refresh_token = create_refresh_token(uid)
         
         return {
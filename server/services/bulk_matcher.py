@@ -0,0 +1,95 @@
+import numpy as np
+from services.skill_index import normalize_skill
+
+class BulkMatcher:
+    """Scores many resumes against many jobs at once using packed skill bitsets"""
+
+    def __init__(self, block_size=1024):
+        self.block_size = block_size
+        self.skill_ids = {}  # normalized skill -> bit position
+        self.skills = []  # bit position -> skill as first seen
+
+    def intern(self, skills):
+        """Map skills to their bit positions, assigning new positions to unseen skills"""
+        ids = set()
+        for skill in skills:
+            if not str(skill).strip():
+                continue
+            normalized = normalize_skill(skill)
+            skill_id = self.skill_ids.get(normalized)
+            if skill_id is None:
+                skill_id = self.skill_ids[normalized] = len(self.skills)
+                self.skills.append(skill)
+            ids.add(skill_id)
+        return ids
+
+    def pack(self, skill_lists):
+        """Pack each skill list into a row of bits, one bit per interned skill"""
+        rows = [self.intern(skills) for skills in skill_lists]
+        dense = np.zeros((len(rows), max(len(self.skills), 1)), dtype=np.uint8)
+        for row, ids in enumerate(rows):
+            dense[row, list(ids)] = 1
+        return np.packbits(dense, axis=1)
+
+    def counts(self, resume_bits, job_bits):
+        """Return shared skill counts, one row per resume and one column per job"""
+        jobs = self._unpack(job_bits)
+        counts = np.empty((resume_bits.shape[0], job_bits.shape[0]), dtype=np.float32)
+        for start in range(0, resume_bits.shape[0], self.block_size):
+            # A product of 0/1 matrices counts the bits set in both rows
+            counts[start:start + self.block_size] = self._unpack(resume_bits[start:start + self.block_size]) @ jobs.T
+        return counts
+
+    def scores(self, resume_bits, job_bits):
+        """Return match_score ratios, shared skills over each job's skill count"""
+        return self._ratios(self.counts(resume_bits, job_bits), self._unpack(job_bits).sum(axis=1))
+
+    def top_matches(self, resumes, jobs, k=10, min_score=0.3, with_skills=True):
+        """Return the best k jobs per resume as (job_id, score, matching_skills), best first
+
+        resumes and jobs map ids to skill lists. Set with_skills to False to skip
+        listing the matching skills when only scores are needed.
+        """
+        resume_ids, job_ids = list(resumes), list(jobs)
+        # Resumes go first so matching skills are reported in the resume's spelling
+        resume_bits = self.pack([resumes[resume_id] for resume_id in resume_ids])
+        job_bits = self.pack([jobs[job_id] for job_id in job_ids])
+        job_dense = self._unpack(job_bits)
+        job_sizes = job_dense.sum(axis=1)
+
+        results = {}
+        for start in range(0, len(resume_ids), self.block_size):
+            block = self._unpack(resume_bits[start:start + self.block_size])
+            scores = self._ratios(block @ job_dense.T, job_sizes)
+            # Pick each row's top k columns for the whole block at once, then order them
+            if scores.shape[1] > k:
+                columns = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            else:
+                columns = np.tile(np.arange(scores.shape[1]), (scores.shape[0], 1))
+            top = np.take_along_axis(scores, columns, axis=1)
+            order = np.argsort(-top, axis=1, kind="stable")
+            columns = np.take_along_axis(columns, order, axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+
+            for offset in range(scores.shape[0]):
+                matches = []
+                for column, score in zip(columns[offset].tolist(), top[offset].tolist()):
+                    if score < min_score:
+                        break
+                    skills = self._skills_of(block[offset] * job_dense[column]) if with_skills else []
+                    matches.append((job_ids[column], score, skills))
+                results[resume_ids[start + offset]] = matches
+        return results
+
+    def _ratios(self, counts, job_sizes):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = counts / job_sizes
+        # Jobs without skills never match
+        return np.where(job_sizes > 0, scores, 0.0).astype(np.float32)
+
+    def _skills_of(self, row):
+        return [self.skills[skill_id] for skill_id in np.flatnonzero(row)]
+
+    def _unpack(self, bits):
+        # Rows packed before later skills were interned unpack with zeros for them
+        return np.unpackbits(bits, axis=1, count=max(len(self.skills), 1)).astype(np.float32)
@@ -0,0 +1,254 @@
+import io
+import os
+import time
+import itertools
+import threading
+import logging
+import multiprocessing
+from collections import deque
+import PyPDF2
+from docx import Document
+
+logger = logging.getLogger(__name__)
+
+# Worker functions run in child processes and must stay importable at module level
+
+# (document key, PdfReader) of the PDF this worker process parsed last
+_document = None
+
+def _extract_pdf_pages(key, data, start, end):
+    """Extract text for pages [start, end) and return it with the document's page count
+
+    data is only sent with a worker's first range of a document; later ranges
+    reuse the reader this process already built for the same key.
+    """
+    global _document
+    if data is not None:
+        _document = (key, PyPDF2.PdfReader(io.BytesIO(data)))
+    elif _document is None or _document[0] != key:
+        raise LookupError(f"Worker does not hold document {key}")
+    reader = _document[1]
+    page_count = len(reader.pages)
+    return page_count, [reader.pages[i].extract_text() or "" for i in range(start, min(end, page_count))]
+
+def _extract_docx_paragraphs(data):
+    """Extract paragraph texts from a DOCX document"""
+    doc = Document(io.BytesIO(data))
+    return [para.text for para in doc.paragraphs]
+
+class _Worker:
+    """One long-lived worker process; a single-process pool gives us apply_async and terminate()"""
+
+    def __init__(self, context):
+        self._pool = context.Pool(processes=1)
+        self._pending = []
+        self.document = None
+
+    def submit(self, fn, *args):
+        result = self._pool.apply_async(fn, args)
+        self._pending.append(result)
+        return result
+
+    def busy(self):
+        self._pending = [result for result in self._pending if not result.ready()]
+        return bool(self._pending)
+
+    def terminate(self):
+        self._pool.terminate()
+
+class _DocumentWorkers:
+    """The workers checked out for one document"""
+
+    def __init__(self, key):
+        self.key = key
+        self.workers = []
+        self._submitted = 0
+
+    def __len__(self):
+        return len(self.workers)
+
+    def submit(self, fn, *args):
+        worker = self.workers[self._submitted % len(self.workers)]
+        self._submitted += 1
+        return worker.submit(fn, *args)
+
+    def submit_pages(self, data, start, end):
+        worker = self.workers[self._submitted % len(self.workers)]
+        self._submitted += 1
+        # Each worker receives the PDF bytes once per document
+        first = worker.document != self.key
+        worker.document = self.key
+        return worker.submit(_extract_pdf_pages, self.key, data if first else None, start, end)
+
+class DocumentParser:
+    """Parses PDF and DOCX documents in long-lived worker processes, splitting PDFs by page range
+
+    Up to max_workers processes are started on first use and reused across
+    documents. They are started with spawn rather than fork, because forking a
+    process that runs gRPC and FAISS threads can deadlock the child. A document
+    checks workers out for the length of its parse; if it exceeds the timeout
+    only its own workers are killed, and replacements are started on demand.
+    """
+
+    def __init__(self, max_workers=None, max_pages=50, timeout=30, pages_per_task=8, start_method="spawn"):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.pages_per_task = pages_per_task
+        self.started = 0
+        self.killed = 0
+        self._context = multiprocessing.get_context(start_method)
+        self._keys = itertools.count()
+        self._lock = threading.Lock()
+        self._reset()
+
+    def parse(self, data, filename):
+        """Extract text from document bytes within the per-document timeout"""
+        return "".join(self.iter_text(data, filename))
+
+    def iter_text(self, data, filename):
+        """Yield text page by page (PDF) or paragraph by paragraph (DOCX) as it is parsed"""
+        deadline = time.monotonic() + self.timeout
+        filename = (filename or '').lower()
+        if not filename.endswith(('.pdf', '.docx')):
+            raise ValueError("Unsupported file format")
+
+        workers = self._start_workers(deadline)
+        timed_out = False
+        try:
+            if filename.endswith('.pdf'):
+                yield from self._iter_pdf(workers, data, deadline)
+            else:
+                paragraphs = self._result(workers.submit(_extract_docx_paragraphs, data), deadline)
+                for i, paragraph in enumerate(paragraphs):
+                    yield paragraph if i == 0 else "\n" + paragraph
+        except TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            # Also runs when the consumer stops early
+            self._stop_workers(workers, kill=timed_out)
+
+    def shutdown(self):
+        """Kill every worker process, idle or busy"""
+        with self._lock:
+            workers = self._idle + [worker for document in self._active for worker in document.workers]
+            self._reset()
+        for worker in workers:
+            worker.terminate()
+
+    def stats(self):
+        """Return worker counts"""
+        with self._lock:
+            return {
+                "idle": len(self._idle),
+                "busy": sum(len(document) for document in self._active),
+                "started": self.started,
+                "killed": self.killed
+            }
+
+    def _reset(self):
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._idle = []
+        self._active = set()
+        self._pid = os.getpid()
+
+    def _iter_pdf(self, workers, data, deadline):
+        # The first range also tells us how many pages there are to fan out
+        first_end = min(self.pages_per_task, self.max_pages)
+        page_count, texts = self._result(workers.submit_pages(data, 0, first_end), deadline)
+
+        if page_count > self.max_pages:
+            logger.warning(f"PDF has {page_count} pages, only the first {self.max_pages} will be parsed")
+        last_page = min(page_count, self.max_pages)
+
+        # Take more workers for the remaining ranges if other documents leave any free
+        ranges = range(first_end, last_page, self.pages_per_task)
+        self._grow_workers(workers, min(len(ranges), self.max_workers))
+
+        # Keep at most one range per worker in flight so unread pages do not pile up in memory
+        starts = iter(ranges)
+        in_flight = deque()
+
+        def submit_next():
+            start = next(starts, None)
+            if start is not None:
+                in_flight.append(workers.submit_pages(data, start, min(start + self.pages_per_task, last_page)))
+
+        for _ in range(len(workers)):
+            submit_next()
+
+        yield from texts
+        while in_flight:
+            _, texts = self._result(in_flight.popleft(), deadline)
+            submit_next()
+            yield from texts
+
+    def _check_out(self, blocking=True, timeout=None):
+        """Take a worker, reusing an idle one, or None if none became free"""
+        with self._lock:
+            # Worker handles inherited from the parent are useless after a fork
+            if self._pid != os.getpid():
+                self._reset()
+            slots = self._slots
+        if not slots.acquire(blocking, timeout if blocking else None):
+            return None
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        try:
+            worker = _Worker(self._context)
+        except Exception:
+            slots.release()
+            raise
+        with self._lock:
+            self.started += 1
+        return worker
+
+    def _check_in(self, worker, kill=False):
+        # A worker still running a task, from a timeout or an abandoned parse, cannot be reused
+        if kill or worker.busy():
+            worker.terminate()
+            with self._lock:
+                self.killed += 1
+        else:
+            with self._lock:
+                self._idle.append(worker)
+        self._slots.release()
+
+    def _start_workers(self, deadline):
+        worker = self._check_out(timeout=max(0, deadline - time.monotonic()))
+        if worker is None:
+            raise TimeoutError(f"No document parser worker became free within {self.timeout}s")
+        workers = _DocumentWorkers(next(self._keys))
+        workers.workers.append(worker)
+        with self._lock:
+            self._active.add(workers)
+        return workers
+
+    def _grow_workers(self, workers, wanted):
+        while len(workers) < wanted:
+            try:
+                worker = self._check_out(blocking=False)
+            except Exception as e:
+                logger.warning(f"Could not start another document parser worker: {e}")
+                return
+            if worker is None:
+                return
+            workers.workers.append(worker)
+
+    def _stop_workers(self, workers, kill=False):
+        with self._lock:
+            if workers not in self._active:
+                # Already terminated by shutdown()
+                return
+            self._active.discard(workers)
+        for worker in workers.workers:
+            self._check_in(worker, kill)
+
+    def _result(self, async_result, deadline):
+        try:
+            return async_result.get(timeout=max(0, deadline - time.monotonic()))
+        except multiprocessing.TimeoutError:
+            # A runaway parse keeps its core busy until its worker is killed
+            raise TimeoutError(f"Document parsing exceeded {self.timeout}s")
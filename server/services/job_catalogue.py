@@ -0,0 +1,289 @@
+import time
+import bisect
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+class LocalVersionStore:
+    """In-process stand-in for the Redis GET/INCR calls the catalogue uses to stay coherent"""
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._values.get(key)
+
+    def incr(self, key):
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + 1
+            return self._values[key]
+
+class JobTable:
+    """Active jobs in memory, indexed by creation time and by owner; callers do the locking"""
+
+    def __init__(self, fields=None, order_field='created_at', owner_field='posted_by'):
+        self.fields = fields
+        self.order_field = order_field
+        self.owner_field = owner_field
+        self.clear()
+
+    def clear(self):
+        self._jobs = {}
+        self._order = []  # (order value, job id) ascending
+        self._by_owner = {}  # owner -> (order value, job id) ascending
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def owners(self):
+        return len(self._by_owner)
+
+    def load(self, items):
+        """Replace the contents with (job id, job) pairs, sorting the indexes once"""
+        self.clear()
+        for job_id, job_data in items:
+            if job_data.get('is_active', False):
+                self._jobs[job_id] = self._project(job_data)
+        for job_id, job in self._jobs.items():
+            key = (job[self.order_field], job_id)
+            self._order.append(key)
+            self._by_owner.setdefault(job.get(self.owner_field), []).append(key)
+        self._order.sort()
+        for keys in self._by_owner.values():
+            keys.sort()
+
+    def put(self, job_id, job_data):
+        """Insert or replace a job, dropping it if it is not active"""
+        self.discard(job_id)
+        if not job_data.get('is_active', False):
+            return
+        job = self._project(job_data)
+        key = (job[self.order_field], job_id)
+        self._jobs[job_id] = job
+        bisect.insort(self._order, key)
+        bisect.insort(self._by_owner.setdefault(job.get(self.owner_field), []), key)
+
+    def increment(self, job_id, field, amount=1):
+        """Add amount to a counter of a stored job in place, returning False if it is not stored
+
+        Only for fields the indexes do not use.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return False
+        if field in (self.order_field, self.owner_field):
+            raise ValueError("increment cannot change indexed fields, use put")
+        if self.fields is None or field in self.fields:
+            job[field] = (job.get(field) or 0) + amount
+        return True
+
+    def discard(self, job_id):
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return
+        key = (job[self.order_field], job_id)
+        owner = job.get(self.owner_field)
+        self._remove_key(self._order, key)
+        self._remove_key(self._by_owner.get(owner, []), key)
+        if not self._by_owner.get(owner, True):
+            del self._by_owner[owner]
+
+    def get(self, job_id):
+        job = self._jobs.get(job_id)
+        return dict(job) if job is not None else None
+
+    def get_many(self, job_ids):
+        return {job_id: dict(self._jobs[job_id]) for job_id in job_ids if job_id in self._jobs}
+
+    def items(self):
+        return [(job_id, dict(job)) for job_id, job in self._jobs.items()]
+
+    def page(self, limit, after=None, owner=None):
+        """Return up to limit (job id, job) pairs newest first, after the (order value, job id) position"""
+        order = self._order if owner is None else self._by_owner.get(owner, [])
+        end = bisect.bisect_left(order, after) if after else len(order)
+        keys = order[max(0, end - limit):end][::-1]
+        return [(job_id, dict(self._jobs[job_id])) for _, job_id in keys], end > limit
+
+    def _project(self, job_data):
+        if self.fields is None:
+            return dict(job_data)
+        return {field: job_data[field] for field in self.fields if field in job_data}
+
+    @staticmethod
+    def _remove_key(order, key):
+        position = bisect.bisect_left(order, key)
+        if position < len(order) and order[position] == key:
+            del order[position]
+
+class JobCatalogueCache:
+    """Process-local copy of the active jobs, patched on writes and reloaded when another worker writes
+
+    version_store is anything with Redis' get/incr, shared by every worker. A
+    write bumps the shared version, and a worker that sees a version it did not
+    produce itself reloads the catalogue. The version is checked at most every
+    check_interval seconds, and the TTL bounds staleness if a bump is ever
+    missed. Reloads build a new table without holding the lock, so reads keep
+    being served from the current table while one runs.
+    """
+
+    def __init__(self, loader, version_store=None, ttl=300, fields=None, order_field='created_at',
+                 key="job_catalogue:version", check_interval=0.5):
+        self.loader = loader
+        self.version_store = version_store or LocalVersionStore()
+        self.ttl = ttl
+        self.key = key
+        self.check_interval = check_interval
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.version_checks = 0
+        self._table = JobTable(fields, order_field)
+        self._version = None
+        self._loaded_at = None
+        self._checked_at = None
+        self._reloading = False
+        self._pending = []  # local writes made during a reload, replayed on the new table
+        self._lock = threading.RLock()
+        self._reload_lock = threading.Lock()
+
+    def get(self, job_id):
+        """Return a cached active job, or None"""
+        self._ensure_fresh()
+        with self._lock:
+            return self._table.get(job_id)
+
+    def get_many(self, job_ids):
+        """Return a dict of job id -> job for the ids that are active"""
+        self._ensure_fresh()
+        with self._lock:
+            return self._table.get_many(job_ids)
+
+    def items(self):
+        """Return (job id, job) pairs for every active job"""
+        self._ensure_fresh()
+        with self._lock:
+            return self._table.items()
+
+    def page(self, limit, after=None, owner=None):
+        """Return up to limit jobs newest first, optionally only one owner's, and whether more follow"""
+        self._ensure_fresh()
+        with self._lock:
+            return self._table.page(limit, after, owner)
+
+    def upsert(self, job_id, job_data):
+        """Apply a write locally and tell the other workers to reload"""
+        self._write(lambda table: table.put(job_id, job_data))
+        self._bump()
+
+    def increment(self, job_id, field, amount=1):
+        """Add amount to a counter on a cached job without telling the other workers
+
+        A full reload on every worker is too high a price for a counter; their
+        copies catch up on the next reload or when the TTL expires. Relative
+        updates are not replayed after a reload, as the new snapshot may already
+        hold them.
+        """
+        self._write(lambda table: table.increment(job_id, field, amount), replay=False)
+
+    def remove(self, job_id):
+        """Drop a job locally and tell the other workers to reload"""
+        self._write(lambda table: table.discard(job_id))
+        self._bump()
+
+    def stats(self):
+        """Return hit ratio and staleness"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "mode": "cache",
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "reloads": self.reloads,
+                "version_checks": self.version_checks,
+                "jobs": len(self._table),
+                "version": self._version,
+                "age_seconds": round(time.monotonic() - self._loaded_at, 1) if self._loaded_at else None
+            }
+
+    def _write(self, apply, replay=True):
+        with self._lock:
+            apply(self._table)
+            if self._reloading and replay:
+                self._pending.append(apply)
+
+    def _ensure_fresh(self):
+        now = time.monotonic()
+        with self._lock:
+            expired = self._loaded_at is None or now - self._loaded_at > self.ttl
+            if not expired and self._checked_at is not None and now - self._checked_at < self.check_interval:
+                self.hits += 1
+                return
+            # Other readers skip the check until this one is done
+            self._checked_at = now
+            known_version = self._version
+            self.version_checks += 1
+
+        try:
+            version = int(self.version_store.get(self.key) or 0)
+        except Exception as e:
+            # Without the shared version only the TTL keeps workers in step
+            logger.warning(f"Job catalogue version check failed: {e}")
+            version = known_version
+
+        with self._lock:
+            if not expired and version == self._version:
+                self.hits += 1
+                return
+            self.misses += 1
+            loaded = self._loaded_at is not None
+
+        # Only the first load makes readers wait, later ones serve the current table meanwhile
+        if not self._reload_lock.acquire(blocking=not loaded):
+            return
+        try:
+            with self._lock:
+                if self._loaded_at is not None and not loaded:
+                    # Another reader finished the first load while we waited
+                    return
+                self._reloading = True
+                self._pending = []
+                table = JobTable(self._table.fields, self._table.order_field, self._table.owner_field)
+            try:
+                table.load(self.loader())
+            except Exception:
+                with self._lock:
+                    self._reloading = False
+                    self._pending = []
+                    # Retry on the next read rather than after check_interval
+                    self._checked_at = None
+                raise
+            with self._lock:
+                # Writes made while loading win over the snapshot
+                for apply in self._pending:
+                    apply(table)
+                self._table = table
+                self._reloading = False
+                self._pending = []
+                # Read before the load, so a write that lands during it triggers another reload
+                self._version = version
+                self._loaded_at = time.monotonic()
+                self.reloads += 1
+            logger.info(f"Job catalogue loaded {len(table)} jobs at version {version}")
+        finally:
+            self._reload_lock.release()
+
+    def _bump(self):
+        try:
+            version = int(self.version_store.incr(self.key))
+        except Exception as e:
+            logger.warning(f"Job catalogue version bump failed: {e}")
+            return
+        with self._lock:
+            # If nobody else wrote since our last load, our patched copy is current
+            if self._version is not None and version == self._version + 1:
+                self._version = version
@@ -0,0 +1,258 @@
+import os
+import time
+import threading
+import logging
+from services.job_catalogue import JobTable
+
+logger = logging.getLogger(__name__)
+
+class FirestoreSnapshotSource:
+    """Feeds a replica from a Firestore query's snapshot listener, resubscribing when the watch dies
+
+    A watch that errors or closes stops delivering without telling anyone, so
+    a monitor thread checks it every check_interval seconds and resubscribes
+    with exponential backoff. The first snapshot of a new watch carries every
+    matching document and is delivered as a reset, so removals missed while
+    the watch was down are not kept.
+    """
+
+    def __init__(self, query, check_interval=15, max_backoff=60):
+        self.query = query
+        self.check_interval = check_interval
+        self.max_backoff = max_backoff
+        self.restarts = 0
+        self.errors = 0
+        self._on_changes = None
+        self._watch = None
+        self._failed = False
+        self._down_since = None
+        self._stopped = threading.Event()
+        self._monitor = None
+        self._lock = threading.Lock()
+
+    def start(self, on_changes):
+        self._on_changes = on_changes
+        self._stopped.clear()
+        self._subscribe()
+        self._monitor = threading.Thread(target=self._watch_loop, name="job-replica-watch", daemon=True)
+        self._monitor.start()
+
+    def stop(self):
+        self._stopped.set()
+        with self._lock:
+            self._close()
+
+    def stats(self):
+        """Return restart count and how long the watch has been down"""
+        with self._lock:
+            return {
+                "watch_active": self._down_since is None,
+                "watch_restarts": self.restarts,
+                "watch_errors": self.errors,
+                "stale_seconds": round(time.monotonic() - self._down_since, 1) if self._down_since else 0.0
+            }
+
+    def _subscribe(self):
+        first = [True]
+
+        def callback(doc_snapshots, changes, read_time):
+            try:
+                if first[0]:
+                    first[0] = False
+                    self._on_changes([(doc.id, doc.to_dict()) for doc in doc_snapshots], reset=True)
+                else:
+                    # Documents leaving the query (deleted or deactivated) arrive as REMOVED
+                    self._on_changes([
+                        (change.document.id, None if change.type.name == 'REMOVED' else change.document.to_dict())
+                        for change in changes
+                    ])
+            except Exception:
+                # Raising here would close the watch from inside Firestore's thread
+                logger.exception("Job replica failed to apply a snapshot, resubscribing")
+                with self._lock:
+                    self._failed = True
+
+        watch = self.query.on_snapshot(callback)
+        with self._lock:
+            self._watch = watch
+            self._failed = False
+            self._down_since = None
+
+    def _close(self):
+        if self._watch is not None:
+            try:
+                self._watch.unsubscribe()
+            except Exception as e:
+                logger.warning(f"Job replica watch unsubscribe failed: {e}")
+            self._watch = None
+
+    def _is_healthy(self):
+        with self._lock:
+            return self._watch is not None and not self._failed and getattr(self._watch, 'is_active', True)
+
+    def _watch_loop(self):
+        while not self._stopped.wait(self.check_interval):
+            if self._is_healthy():
+                continue
+            with self._lock:
+                self.errors += 1
+                self._down_since = self._down_since or time.monotonic()
+                self._close()
+            logger.warning("Job replica watch stopped, resubscribing")
+            self._resubscribe()
+
+    def _resubscribe(self):
+        delay = 1
+        while not self._stopped.is_set():
+            try:
+                self._subscribe()
+                with self._lock:
+                    self.restarts += 1
+                logger.info(f"Job replica watch resubscribed after {self.restarts} restart(s)")
+                return
+            except Exception as e:
+                logger.warning(f"Job replica resubscribe failed, retrying in {delay}s: {e}")
+                self._stopped.wait(delay)
+                delay = min(delay * 2, self.max_backoff)
+
+class StubSnapshotSource:
+    """In-memory snapshot source for tests and local runs without Firestore"""
+
+    def __init__(self, jobs=None):
+        self.jobs = dict(jobs or {})
+        self._on_changes = None
+
+    def start(self, on_changes):
+        self._on_changes = on_changes
+        # Like Firestore, the first snapshot carries every matching document
+        on_changes(list(self.jobs.items()), reset=True)
+
+    def stop(self):
+        self._on_changes = None
+
+    def stats(self):
+        return {"watch_active": self._on_changes is not None}
+
+    def set(self, job_id, job_data):
+        """Write a job and deliver the change to the subscriber"""
+        self.jobs[job_id] = job_data
+        self._emit([(job_id, job_data)])
+
+    def delete(self, job_id):
+        """Delete a job and deliver the removal to the subscriber"""
+        self.jobs.pop(job_id, None)
+        self._emit([(job_id, None)])
+
+    def _emit(self, changes):
+        if self._on_changes is not None:
+            self._on_changes(changes)
+
+class JobReplica:
+    """Live in-memory table of active jobs fed by a snapshot source, indexed by owner and creation time
+
+    Offers the same reads and write-through calls as JobCatalogueCache. Local
+    writes are applied at once so the writer reads its own changes; the
+    listener confirms them, and delivers writes from other workers, moments later.
+    """
+
+    def __init__(self, source, fields=None, order_field='created_at', owner_field='posted_by', ready_timeout=10):
+        self.source = source
+        self.ready_timeout = ready_timeout
+        self.reads = 0
+        self.events = 0
+        self.changes = 0
+        self._table = JobTable(fields, order_field, owner_field)
+        self._ready = threading.Event()
+        self._started_pid = None
+        self._last_event_at = None
+        self._lock = threading.RLock()
+
+    def start(self):
+        """Subscribe to the source, once per process"""
+        with self._lock:
+            # Listener threads do not survive a fork, so a forked worker subscribes again
+            if self._started_pid == os.getpid():
+                return
+            self._started_pid = os.getpid()
+            self._ready.clear()
+            self._table = JobTable(self._table.fields, self._table.order_field, self._table.owner_field)
+        self.source.start(self._apply)
+
+    def stop(self):
+        """Unsubscribe from the source"""
+        self.source.stop()
+        with self._lock:
+            self._started_pid = None
+
+    def get(self, job_id):
+        """Return an active job, or None"""
+        with self._read():
+            return self._table.get(job_id)
+
+    def get_many(self, job_ids):
+        """Return a dict of job id -> job for the ids that are active"""
+        with self._read():
+            return self._table.get_many(job_ids)
+
+    def items(self):
+        """Return (job id, job) pairs for every active job"""
+        with self._read():
+            return self._table.items()
+
+    def page(self, limit, after=None, owner=None):
+        """Return up to limit jobs newest first, optionally only one owner's, and whether more follow"""
+        with self._read():
+            return self._table.page(limit, after, owner)
+
+    def upsert(self, job_id, job_data):
+        """Apply a local write ahead of the listener"""
+        with self._lock:
+            self._table.put(job_id, job_data)
+
+    def increment(self, job_id, field, amount=1):
+        """Add amount to a counter on a job locally ahead of the listener"""
+        with self._lock:
+            self._table.increment(job_id, field, amount)
+
+    def remove(self, job_id):
+        """Drop a job locally ahead of the listener"""
+        with self._lock:
+            self._table.discard(job_id)
+
+    def stats(self):
+        """Return table size, read count, how long ago the listener last delivered and watch health"""
+        source_stats = self.source.stats()
+        with self._lock:
+            return {
+                **source_stats,
+                "mode": "replica",
+                "ready": self._ready.is_set(),
+                "reads": self.reads,
+                "events": self.events,
+                "changes": self.changes,
+                "jobs": len(self._table),
+                "owners": self._table.owners(),
+                "last_event_seconds": round(time.monotonic() - self._last_event_at, 1) if self._last_event_at else None
+            }
+
+    def _apply(self, changes, reset=False):
+        with self._lock:
+            if reset:
+                # A fresh snapshot replaces whatever the table held
+                self._table = JobTable(self._table.fields, self._table.order_field, self._table.owner_field)
+            for job_id, job_data in changes:
+                if job_data is None:
+                    self._table.discard(job_id)
+                else:
+                    self._table.put(job_id, job_data)
+            self.events += 1
+            self.changes += len(changes)
+            self._last_event_at = time.monotonic()
+        self._ready.set()
+
+    def _read(self):
+        self.start()
+        if not self._ready.wait(self.ready_timeout):
+            raise TimeoutError("Job replica has not received its initial snapshot")
+        self.reads += 1
+        return self._lock
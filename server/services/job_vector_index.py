@@ -0,0 +1,181 @@
+import time
+import threading
+import logging
+import numpy as np
+import faiss
+
+logger = logging.getLogger(__name__)
+
+def normalize_vector(vector):
+    """Return a float32 unit vector so inner product equals cosine similarity"""
+    vector = np.asarray(vector, dtype="float32").reshape(-1)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+class JobVectorIndex:
+    """Approximate nearest neighbour index of job embeddings by cosine similarity, maintained incrementally"""
+
+    def __init__(self, loader=None, refresh_interval=300, neighbors=32, ef_search=64, compact_ratio=0.2):
+        self.loader = loader
+        self.refresh_interval = refresh_interval
+        self.neighbors = neighbors
+        self.ef_search = ef_search
+        self.compact_ratio = compact_ratio
+        self._index = None
+        self._labels = []  # faiss position -> job id, None once superseded
+        self._positions = {}  # job id -> faiss position
+        self._vectors = {}  # job id -> unit vector, kept for compaction
+        self._loaded_at = None
+        self._rebuilding = False
+        self._pending = {}
+        self._lock = threading.RLock()
+        self._rebuild_lock = threading.Lock()
+
+    def upsert(self, job_id, vector, active=True):
+        """Index a job's embedding, or drop the job if it is inactive"""
+        with self._lock:
+            if self._rebuilding:
+                self._pending[job_id] = (vector, active)
+            self._remove(job_id)
+            if active and vector is not None:
+                vector = normalize_vector(vector)
+                if self._index is None or self._index.d != vector.shape[0]:
+                    self._reset(vector.shape[0])
+                self._add(job_id, vector)
+
+    def remove(self, job_id):
+        """Drop a job from the index"""
+        self.upsert(job_id, None, active=False)
+
+    def search(self, vector, k=20, offset=0, min_score=0.0):
+        """Return up to k (job_id, score) pairs best first, skipping the first offset results"""
+        self._ensure_fresh()
+        query = normalize_vector(vector).reshape(1, -1)
+        wanted = offset + k
+
+        with self._lock:
+            if self._index is None or not self._positions or query.shape[1] != self._index.d:
+                return []
+
+            # Superseded vectors still occupy slots, ask for enough to cover them
+            fetch = min(wanted + len(self._labels) - len(self._positions), self._index.ntotal)
+            while True:
+                self._index.hnsw.efSearch = max(self.ef_search, fetch)
+                scores, positions = self._index.search(query, fetch)
+                results = []
+                for score, position in zip(scores[0], positions[0]):
+                    if position < 0 or score < min_score:
+                        continue
+                    job_id = self._labels[position]
+                    if job_id is not None:
+                        results.append((job_id, float(score)))
+                # The graph search is approximate and can come up short, widen it once more if so
+                if len(results) >= wanted or fetch >= self._index.ntotal or (len(scores[0]) and scores[0][-1] < min_score):
+                    break
+                fetch = min(fetch * 2, self._index.ntotal)
+
+        return results[offset:wanted]
+
+    def rebuild(self):
+        """Reload every active job vector from the loader and swap in a fresh index"""
+        with self._rebuild_lock:
+            self._rebuild()
+
+    def _rebuild(self):
+        with self._lock:
+            self._rebuilding = True
+            self._pending = {}
+        try:
+            vectors = {}
+            for job_id, vector in self.loader():
+                if vector:
+                    vectors[job_id] = normalize_vector(vector)
+
+            with self._lock:
+                self._load(vectors)
+                self._loaded_at = time.monotonic()
+                self._rebuilding = False
+                # Writes that raced with the scan win over the snapshot
+                for job_id, (vector, active) in self._pending.items():
+                    self.upsert(job_id, vector, active)
+                self._pending = {}
+            logger.info(f"Job vector index rebuilt with {len(vectors)} jobs")
+        finally:
+            with self._lock:
+                self._rebuilding = False
+
+    def _rebuild_in_background(self):
+        if not self._rebuild_lock.acquire(blocking=False):
+            return
+        try:
+            self._rebuild()
+        except Exception as e:
+            logger.error(f"Job vector index refresh failed: {e}")
+        finally:
+            self._rebuild_lock.release()
+
+    def __len__(self):
+        """Number of jobs with a live vector, waiting for the initial load if needed"""
+        self._ensure_fresh()
+        with self._lock:
+            return len(self._positions)
+
+    def stats(self):
+        """Return index size and age"""
+        with self._lock:
+            return {
+                "jobs": len(self._positions),
+                "slots": len(self._labels),
+                "dimension": self._index.d if self._index is not None else None,
+                "age_seconds": round(time.monotonic() - self._loaded_at, 1) if self._loaded_at else None
+            }
+
+    def _ensure_fresh(self):
+        if self.loader is None:
+            return
+        if self._loaded_at is None:
+            # The first search has to wait for the initial load
+            with self._rebuild_lock:
+                if self._loaded_at is None:
+                    self._rebuild()
+        elif time.monotonic() - self._loaded_at > self.refresh_interval and not self._rebuild_lock.locked():
+            # Later refreshes only pick up writes from other workers, serve the current index meanwhile
+            threading.Thread(target=self._rebuild_in_background, daemon=True).start()
+
+    def _reset(self, dimension):
+        self._index = faiss.IndexHNSWFlat(dimension, self.neighbors, faiss.METRIC_INNER_PRODUCT)
+        self._labels = []
+        self._positions = {}
+        self._vectors = {}
+
+    def _load(self, vectors):
+        """Replace the index contents with the given job id -> unit vector mapping"""
+        self._index = None
+        self._labels = []
+        self._positions = {}
+        self._vectors = {}
+        if not vectors:
+            return
+        dimension = next(iter(vectors.values())).shape[0]
+        vectors = {job_id: vector for job_id, vector in vectors.items() if vector.shape[0] == dimension}
+        self._reset(dimension)
+        self._index.add(np.vstack(list(vectors.values())))
+        self._labels = list(vectors)
+        self._positions = {job_id: position for position, job_id in enumerate(self._labels)}
+        self._vectors = vectors
+
+    def _add(self, job_id, vector):
+        self._index.add(vector.reshape(1, -1))
+        self._positions[job_id] = len(self._labels)
+        self._labels.append(job_id)
+        self._vectors[job_id] = vector
+
+    def _remove(self, job_id):
+        # HNSW graphs cannot delete, superseded slots are skipped and dropped on compaction
+        position = self._positions.pop(job_id, None)
+        self._vectors.pop(job_id, None)
+        if position is None:
+            return
+        self._labels[position] = None
+        if len(self._labels) - len(self._positions) > self.compact_ratio * max(len(self._labels), 1):
+            self._load(dict(self._vectors))
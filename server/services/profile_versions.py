@@ -0,0 +1,96 @@
+import os
+import time
+import threading
+import logging
+from collections import OrderedDict
+from services.job_catalogue import LocalVersionStore
+
+logger = logging.getLogger(__name__)
+
+class ProfileVersions:
+    """Per-uid profile version counters, remembered locally and shared through a version store
+
+    store is anything with Redis' get/incr. Access tokens carry the version their
+    profile claims were read at, so a token whose version is behind the current
+    one holds a stale profile. Local reads are trusted for ttl seconds, which
+    bounds how long another worker's bump can go unseen.
+    """
+
+    def __init__(self, store=None, ttl=5, max_entries=100000, key_prefix="profile_version:"):
+        self.store = store or LocalVersionStore()
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.key_prefix = key_prefix
+        self.hits = 0
+        self.misses = 0
+        self.bumps = 0
+        self._versions = OrderedDict()  # uid -> (version, checked_at)
+        self._lock = threading.Lock()
+
+    def get(self, uid):
+        """Return the current profile version for uid"""
+        with self._lock:
+            entry = self._versions.get(uid)
+            if entry is not None and time.monotonic() - entry[1] <= self.ttl:
+                self._versions.move_to_end(uid)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        try:
+            version = int(self.store.get(self.key_prefix + uid) or 0)
+        except Exception as e:
+            # Without the shared store, fall back to the last version seen here
+            logger.warning(f"Profile version read failed for {uid}: {e}")
+            return entry[0] if entry is not None else 0
+
+        self._remember(uid, version)
+        return version
+
+    def bump(self, uid):
+        """Mark the profile of uid as changed and return its new version"""
+        version = int(self.store.incr(self.key_prefix + uid))
+        self._remember(uid, version)
+        with self._lock:
+            self.bumps += 1
+        return version
+
+    def stats(self):
+        """Return hit/miss counters and entry count"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "bumps": self.bumps,
+                "entries": len(self._versions)
+            }
+
+    def _remember(self, uid, version):
+        with self._lock:
+            # A read that started before a bump must not put the older version back
+            entry = self._versions.get(uid)
+            if entry is not None and entry[0] > version:
+                version = entry[0]
+            self._versions[uid] = (version, time.monotonic())
+            self._versions.move_to_end(uid)
+            while len(self._versions) > self.max_entries:
+                self._versions.popitem(last=False)
+
+_shared_versions = None
+_shared_lock = threading.Lock()
+
+def get_profile_versions():
+    """Get the profile versions shared by the app and the blueprints, creating them on first use"""
+    global _shared_versions
+    with _shared_lock:
+        if _shared_versions is None:
+            redis_url = os.getenv("PROFILE_VERSION_REDIS_URL")
+            if redis_url:
+                import redis  # Only needed when several workers share profile versions
+                store = redis.Redis.from_url(redis_url)
+            else:
+                store = LocalVersionStore()
+            _shared_versions = ProfileVersions(store, ttl=float(os.getenv("PROFILE_VERSION_TTL", 5)))
+    return _shared_versions
@@ -0,0 +1,109 @@
+import time
+import threading
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+logger = logging.getLogger(__name__)
+
+class QuestionRunner:
+    """Answers questions in parallel with a timeout per question, timed from when it starts
+
+    At most max_workers questions run at once. A question still running
+    timeout seconds after it started is answered with the fallback, and the
+    rest keep their full budget. Python cannot stop a thread, so a timed-out
+    call keeps running, and its LLM connection stays open, until it returns.
+    Those abandoned calls are counted, and while max_abandoned of them are
+    still running no new questions are started.
+    """
+
+    def __init__(self, max_workers=4, timeout=30, max_abandoned=8, fallback="Not available"):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.max_abandoned = max_abandoned
+        self.fallback = fallback
+        self.questions = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.refused = 0
+        self._abandoned = set()
+        self._lock = threading.Lock()
+
+    def run(self, answer, questions, max_workers=None, timeout=None):
+        """Call answer(question) for every question, returns the answers and the questions that failed"""
+        max_workers = max(1, min(max_workers or self.max_workers, len(questions) or 1))
+        timeout = timeout or self.timeout
+        answers = {question: self.fallback for question in questions}
+        failed = []
+        pending = deque(questions)
+        running = {}  # future -> (question, started at)
+        with self._lock:
+            self.questions += len(questions)
+
+        # Threads are created on demand, so a hung call never takes a slot from the questions behind it
+        executor = ThreadPoolExecutor(max_workers=max(1, len(questions)), thread_name_prefix="rag-question")
+        try:
+            while pending or running:
+                while pending and len(running) < max_workers:
+                    if self.abandoned() >= self.max_abandoned:
+                        logger.warning(f"{self.abandoned()} timed-out questions are still running, "
+                                       f"not starting {len(pending)} more")
+                        with self._lock:
+                            self.refused += len(pending)
+                        failed.extend(pending)
+                        pending.clear()
+                        break
+                    question = pending.popleft()
+                    running[executor.submit(answer, question)] = (question, time.monotonic())
+                if not running:
+                    break
+
+                next_deadline = min(started for _, started in running.values()) + timeout
+                done, _ = wait(running, timeout=max(0, next_deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+                for future in done:
+                    question, _ = running.pop(future)
+                    try:
+                        answers[question] = future.result()
+                    except Exception as e:
+                        failed.append(question)
+                        with self._lock:
+                            self.failures += 1
+                        logger.warning(f"Error processing question '{question}': {e}")
+
+                now = time.monotonic()
+                for future, (question, started) in list(running.items()):
+                    if now - started >= timeout:
+                        del running[future]
+                        failed.append(question)
+                        self._abandon(future)
+                        logger.warning(f"Timed out processing question '{question}' after {timeout}s")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return answers, failed
+
+    def abandoned(self):
+        """Return how many timed-out calls are still running"""
+        with self._lock:
+            return len(self._abandoned)
+
+    def stats(self):
+        """Return question, failure and timeout counts and the calls still running after a timeout"""
+        with self._lock:
+            return {
+                "questions": self.questions,
+                "failures": self.failures,
+                "timeouts": self.timeouts,
+                "refused": self.refused,
+                "abandoned_running": len(self._abandoned)
+            }
+
+    def _abandon(self, future):
+        with self._lock:
+            self.timeouts += 1
+            self._abandoned.add(future)
+        future.add_done_callback(self._release)
+
+    def _release(self, future):
+        with self._lock:
+            self._abandoned.discard(future)
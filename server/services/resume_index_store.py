@@ -0,0 +1,93 @@
+import os
+import re
+import pickle
+import shutil
+import threading
+import logging
+from collections import OrderedDict
+import faiss
+from langchain_community.vectorstores import FAISS
+
+logger = logging.getLogger(__name__)
+
+class ResumeIndexStore:
+    """On-disk per-resume FAISS indexes with an LRU of resident indexes"""
+
+    def __init__(self, base_dir, embeddings_factory, max_resident=32):
+        self.base_dir = base_dir
+        self.embeddings_factory = embeddings_factory
+        self.max_resident = max_resident
+        self._resident = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        os.makedirs(base_dir, exist_ok=True)
+
+    def get(self, resume_id, build=None):
+        """Return the index for a resume from memory or disk, building it with build() on a miss"""
+        with self._lock:
+            if resume_id in self._resident:
+                self._resident.move_to_end(resume_id)
+                return self._resident[resume_id]
+
+        knowledge_base = self._load(resume_id)
+        if knowledge_base is None:
+            if build is None:
+                return None
+            with self._build_lock:
+                # Another thread may have built it while we waited
+                knowledge_base = self._load(resume_id)
+                if knowledge_base is None:
+                    knowledge_base = build()
+                    self.save(resume_id, knowledge_base)
+                    return knowledge_base
+
+        self._remember(resume_id, knowledge_base)
+        return knowledge_base
+
+    def save(self, resume_id, knowledge_base):
+        """Persist an index under the resume's directory and keep it resident"""
+        path = self._path(resume_id)
+        tmp_path = f"{path}.tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        knowledge_base.save_local(tmp_path)
+        shutil.rmtree(path, ignore_errors=True)
+        os.rename(tmp_path, path)
+        self._remember(resume_id, knowledge_base)
+
+    def invalidate(self, resume_id):
+        """Drop a resume's index from memory and disk"""
+        with self._lock:
+            self._resident.pop(resume_id, None)
+        shutil.rmtree(self._path(resume_id), ignore_errors=True)
+
+    def _load(self, resume_id):
+        path = self._path(resume_id)
+        index_path = os.path.join(path, "index.faiss")
+        if not os.path.exists(index_path):
+            return None
+
+        try:
+            try:
+                index = faiss.read_index(index_path, faiss.IO_FLAG_MMAP)
+            except RuntimeError:
+                # Not every index type supports memory mapping
+                index = faiss.read_index(index_path)
+            # Written by save_local from our own process, never user supplied
+            with open(os.path.join(path, "index.pkl"), "rb") as f:
+                docstore, index_to_docstore_id = pickle.load(f)
+            return FAISS(self.embeddings_factory(), index, docstore, index_to_docstore_id)
+        except Exception as e:
+            logger.warning(f"Failed to load index for resume {resume_id}: {e}")
+            return None
+
+    def _remember(self, resume_id, knowledge_base):
+        with self._lock:
+            self._resident[resume_id] = knowledge_base
+            self._resident.move_to_end(resume_id)
+            while len(self._resident) > self.max_resident:
+                self._resident.popitem(last=False)
+
+    def _path(self, resume_id):
+        if not re.fullmatch(r'[\w\-]+', resume_id or ''):
+            raise ValueError(f"Invalid resume id: {resume_id}")
+        return os.path.join(self.base_dir, resume_id)
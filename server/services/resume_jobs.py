@@ -0,0 +1,233 @@
+import os
+import uuid
+import time
+import socket
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import datetime as dt
+from utils.exceptions import QueueFullError
+
+logger = logging.getLogger(__name__)
+
+# Ordered pipeline stages reported to clients while a job runs
+RESUME_JOB_STAGES = [
+    "queued",
+    "extracting_text",
+    "extracting_contact_info",
+    "analyzing",
+    "saving",
+    "completed"
+]
+
+class ResumeJobQueue:
+    """Bounded background worker pool for resume processing jobs
+
+    Every unfinished job records the worker that owns it, and that worker
+    refreshes the job's heartbeatAt every heartbeat_interval seconds while it
+    is alive. A job is only failed as stale once its heartbeat is older than
+    stale_after, so jobs queued or running on another live worker are left alone.
+    """
+
+    def __init__(self, pipeline, db=None, max_workers=2, max_pending=20,
+                 collection="resume_jobs", retention=3600, stale_after=600, heartbeat_interval=None):
+        self.pipeline = pipeline
+        self.db = db
+        self.max_pending = max_pending
+        self.collection = collection
+        self.retention = retention
+        self.stale_after = stale_after
+        self.heartbeat_interval = heartbeat_interval or stale_after / 4
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="resume-job")
+        self._jobs = {}
+        self._finished_at = {}
+        self._pending = 0
+        self._worker_id = None
+        self._heartbeat_pid = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def worker_id(self):
+        """Identifies this process in the jobs it owns, a forked worker gets its own"""
+        if self._worker_id is None or not self._worker_id.endswith(f":{os.getpid()}"):
+            self._worker_id = f"{socket.gethostname()}:{uuid.uuid4().hex[:8]}:{os.getpid()}"
+        return self._worker_id
+
+    def submit(self, uid, user_email, filename, stream):
+        """Queue an uploaded file stream for processing and take ownership of it, returns the job id"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise QueueFullError("Resume processing queue is full, please retry shortly")
+            self._pending += 1
+
+        job_id = str(uuid.uuid4())
+        try:
+            now = datetime.now(dt.UTC)
+            self._update(job_id, {
+                "id": job_id,
+                "userId": uid,
+                "workerId": self.worker_id,
+                "filename": filename,
+                "status": "queued",
+                "stage": "queued",
+                "progress": 0,
+                "result": None,
+                "error": None,
+                "createdAt": now,
+                "heartbeatAt": now
+            })
+            self._ensure_heartbeat()
+            self._executor.submit(self._run, job_id, stream, filename, uid, user_email)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            stream.close()
+            raise
+
+        self._prune()
+        return job_id
+
+    def get(self, job_id):
+        """Get a job's status, falling back to Firestore for jobs owned by other workers"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                return dict(job)
+
+        if self.db is None:
+            return None
+        try:
+            job_doc = self.db.collection(self.collection).document(job_id).get()
+            if not job_doc.exists:
+                return None
+            job = job_doc.to_dict()
+            # Jobs owned by other workers are only trusted while they keep reporting progress
+            if self._is_stale(job):
+                self._fail_stale(job_id, job)
+            return job
+        except Exception as e:
+            logger.error(f"Failed to read resume job {job_id}: {e}")
+            return None
+
+    def recover_stale(self):
+        """Mark unfinished jobs whose worker stopped sending heartbeats as failed, returns how many"""
+        if self.db is None:
+            return 0
+        jobs_ref = self.db.collection(self.collection).where('status', 'in', ['queued', 'processing'])
+        recovered = 0
+        for job_doc in jobs_ref.stream():
+            job = job_doc.to_dict()
+            with self._lock:
+                if job_doc.id in self._jobs:
+                    continue
+            if self._is_stale(job):
+                self._fail_stale(job_doc.id, job)
+                recovered += 1
+        if recovered:
+            logger.warning(f"Marked {recovered} stale resume jobs as failed")
+        return recovered
+
+    def heartbeat(self):
+        """Refresh heartbeatAt on every unfinished job this worker owns, returns how many"""
+        with self._lock:
+            job_ids = [job_id for job_id, job in self._jobs.items() if job.get("status") in ("queued", "processing")]
+        if not job_ids or self.db is None:
+            return 0
+        now = datetime.now(dt.UTC)
+        collection = self.db.collection(self.collection)
+        batch = self.db.batch()
+        for job_id in job_ids:
+            batch.set(collection.document(job_id), {"heartbeatAt": now}, merge=True)
+        try:
+            batch.commit()
+        except Exception as e:
+            logger.warning(f"Resume job heartbeat failed: {e}")
+            return 0
+        return len(job_ids)
+
+    def shutdown(self, wait=True):
+        """Stop accepting jobs and wait for running ones to finish"""
+        self._executor.shutdown(wait=wait)
+        self._stopped.set()
+
+    def _run(self, job_id, stream, filename, uid, user_email):
+        def report_stage(stage):
+            self._update(job_id, {
+                "status": "processing",
+                "stage": stage,
+                "progress": int(100 * RESUME_JOB_STAGES.index(stage) / (len(RESUME_JOB_STAGES) - 1))
+            })
+
+        try:
+            result = self.pipeline(stream, filename, uid, user_email, report_stage)
+            self._update(job_id, {
+                "status": "completed",
+                "stage": "completed",
+                "progress": 100,
+                "result": result
+            })
+            logger.info(f"Resume job {job_id} completed")
+        except Exception as e:
+            logger.error(f"Resume job {job_id} failed: {e}")
+            self._update(job_id, {"status": "failed", "error": str(e)})
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._finished_at[job_id] = time.monotonic()
+            stream.close()
+
+    def _is_stale(self, job):
+        # Jobs written before heartbeats existed only have updatedAt
+        beat = job.get("heartbeatAt") or job.get("updatedAt")
+        if job.get("status") not in ("queued", "processing") or not isinstance(beat, datetime):
+            return False
+        return (datetime.now(dt.UTC) - beat).total_seconds() > self.stale_after
+
+    def _ensure_heartbeat(self):
+        # Threads do not survive a fork, so a forked worker starts its own heartbeat
+        if self.db is None or self._heartbeat_pid == os.getpid():
+            return
+        with self._lock:
+            if self._heartbeat_pid == os.getpid():
+                return
+            self._heartbeat_pid = os.getpid()
+        threading.Thread(target=self._heartbeat_loop, name="resume-job-heartbeat", daemon=True).start()
+
+    def _heartbeat_loop(self):
+        while not self._stopped.wait(self.heartbeat_interval):
+            self.heartbeat()
+
+    def _fail_stale(self, job_id, job):
+        # The worker running it was restarted or died, nothing will finish it
+        fields = {
+            "status": "failed",
+            "error": "Resume processing was interrupted, please upload again",
+            "updatedAt": datetime.now(dt.UTC)
+        }
+        job.update(fields)
+        try:
+            self.db.collection(self.collection).document(job_id).set(fields, merge=True)
+        except Exception as e:
+            logger.warning(f"Failed to mark resume job {job_id} as failed: {e}")
+
+    def _update(self, job_id, fields):
+        fields["updatedAt"] = fields["heartbeatAt"] = datetime.now(dt.UTC)
+        with self._lock:
+            self._jobs.setdefault(job_id, {}).update(fields)
+
+        if self.db is not None:
+            try:
+                self.db.collection(self.collection).document(job_id).set(fields, merge=True)
+            except Exception as e:
+                logger.warning(f"Failed to persist resume job {job_id}: {e}")
+
+    def _prune(self):
+        """Drop finished jobs from memory once they are older than the retention window"""
+        cutoff = time.monotonic() - self.retention
+        with self._lock:
+            expired = [job_id for job_id, finished in self._finished_at.items() if finished < cutoff]
+            for job_id in expired:
+                self._jobs.pop(job_id, None)
+                self._finished_at.pop(job_id, None)
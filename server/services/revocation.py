@@ -0,0 +1,208 @@
+import os
+import math
+import time
+import hashlib
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings, sized for a capacity and false positive rate"""
+
+    def __init__(self, capacity=10000, error_rate=0.001):
+        self.capacity = max(capacity, 1)
+        self.bits = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / self.capacity * math.log(2)))
+        self.count = 0
+        self._array = bytearray((self.bits + 7) // 8)
+
+    def add(self, item):
+        for position in self._positions(item):
+            self._array[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self._array[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def _positions(self, item):
+        # Double hashing: k positions from the two halves of one digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.bits for i in range(self.hashes)]
+
+class LocalRevocationBackend:
+    """In-process revocation store, for a single worker or local runs
+
+    Other workers never see these revocations, so a logged out token keeps
+    working on them. Set REVOCATION_REDIS_URL whenever more than one worker
+    process serves requests.
+    """
+
+    def __init__(self):
+        self._revoked = {}  # jti -> expiry as a Unix timestamp
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def add(self, jti, expires_at):
+        with self._lock:
+            self._revoked[jti] = expires_at
+            self._version += 1
+
+    def contains(self, jti):
+        with self._lock:
+            return self._revoked.get(jti, 0) > time.time()
+
+    def version(self):
+        with self._lock:
+            return self._version
+
+    def entries(self):
+        """Return the ids still revoked, dropping those whose tokens have expired anyway"""
+        now = time.time()
+        with self._lock:
+            self._revoked = {jti: expires_at for jti, expires_at in self._revoked.items() if expires_at > now}
+            return list(self._revoked)
+
+class RedisRevocationBackend:
+    """Revocation store in a Redis sorted set scored by token expiry, shared by every worker"""
+
+    def __init__(self, client, key="revoked_tokens"):
+        self.client = client
+        self.key = key
+        self.version_key = f"{key}:version"
+
+    def add(self, jti, expires_at):
+        pipeline = self.client.pipeline()
+        pipeline.zadd(self.key, {jti: expires_at})
+        pipeline.incr(self.version_key)
+        pipeline.execute()
+
+    def contains(self, jti):
+        expires_at = self.client.zscore(self.key, jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def version(self):
+        return int(self.client.get(self.version_key) or 0)
+
+    def entries(self):
+        """Return the ids still revoked, dropping those whose tokens have expired anyway"""
+        self.client.zremrangebyscore(self.key, "-inf", time.time())
+        return [jti.decode() if isinstance(jti, bytes) else jti for jti in self.client.zrange(self.key, 0, -1)]
+
+class RevocationList:
+    """Revoked token ids behind an in-memory Bloom filter, so tokens that are not revoked cost no I/O
+
+    Only ids the filter reports are confirmed against the backend. The filter is
+    rebuilt from the backend when its version moves, checked at most every
+    sync_interval seconds, which bounds how long a revocation made by another
+    worker goes unnoticed here.
+    """
+
+    def __init__(self, backend=None, capacity=10000, error_rate=0.001, sync_interval=1.0):
+        self.backend = backend or LocalRevocationBackend()
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.checks = 0
+        self.filtered = 0
+        self.confirmed = 0
+        self.false_positives = 0
+        self.syncs = 0
+        self._filter = BloomFilter(capacity, error_rate)
+        self._version = None
+        self._synced_at = None
+        self._lock = threading.Lock()
+        # Separate from _lock, which a sync holds across backend calls
+        self._stats_lock = threading.Lock()
+
+    def revoke(self, jti, expires_at):
+        """Revoke a token id until its expiry, given as a Unix timestamp"""
+        self.backend.add(jti, expires_at)
+        with self._lock:
+            self._filter.add(jti)
+
+    def is_revoked(self, jti):
+        """Return whether a token id has been revoked"""
+        self._maybe_sync()
+        if jti not in self._filter:
+            self._count("filtered")
+            return False
+        try:
+            revoked = self.backend.contains(jti)
+        except Exception as e:
+            # Rejecting a token that is probably revoked is safer than letting it through
+            logger.warning(f"Revocation check failed for {jti}: {e}")
+            self._count()
+            return True
+        self._count("confirmed" if revoked else "false_positives")
+        return revoked
+
+    def stats(self):
+        """Return check counters and filter size"""
+        with self._stats_lock:
+            return {
+                "checks": self.checks,
+                "filtered": self.filtered,
+                "confirmed": self.confirmed,
+                "false_positives": self.false_positives,
+                "syncs": self.syncs,
+                "entries": self._filter.count,
+                "version": self._version
+            }
+
+    def _count(self, outcome=None):
+        with self._stats_lock:
+            self.checks += 1
+            if outcome is not None:
+                setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def _maybe_sync(self):
+        now = time.monotonic()
+        if self._synced_at is not None and now - self._synced_at < self.sync_interval:
+            return
+        # Requests that find a sync under way keep using the current filter
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._synced_at = now
+            version = self.backend.version()
+            if version == self._version:
+                return
+            entries = self.backend.entries()
+            bloom = BloomFilter(max(self.capacity, 2 * len(entries)), self.error_rate)
+            for jti in entries:
+                bloom.add(jti)
+            self._filter = bloom
+            with self._stats_lock:
+                self._version = version
+                self.syncs += 1
+        except Exception as e:
+            logger.warning(f"Revocation list sync failed: {e}")
+        finally:
+            self._lock.release()
+
+_shared_list = None
+_shared_lock = threading.Lock()
+
+def get_revocation_list():
+    """Get the revocation list shared by the app and the blueprints, creating it on first use"""
+    global _shared_list
+    with _shared_lock:
+        if _shared_list is None:
+            redis_url = os.getenv("REVOCATION_REDIS_URL")
+            if redis_url:
+                import redis  # Only needed when several workers share revocations
+                backend = RedisRevocationBackend(redis.Redis.from_url(redis_url))
+            else:
+                logger.warning(
+                    "REVOCATION_REDIS_URL is not set, revoked tokens are only rejected by the worker "
+                    "that revoked them; set it when running more than one worker"
+                )
+                backend = LocalRevocationBackend()
+            _shared_list = RevocationList(
+                backend,
+                capacity=int(os.getenv("REVOCATION_CAPACITY", 10000)),
+                sync_interval=float(os.getenv("REVOCATION_SYNC_INTERVAL", 1))
+            )
+    return _shared_list
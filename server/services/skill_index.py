@@ -0,0 +1,144 @@
+import time
+import threading
+import logging
+from collections import Counter, defaultdict
+
+logger = logging.getLogger(__name__)
+
+def normalize_skill(skill):
+    """Normalize a skill string for index lookups"""
+    return " ".join(str(skill).split()).lower()
+
+def job_skills(job_data):
+    """Normalized skills a job is matched on"""
+    skills = (job_data.get('key_requirements') or []) + (job_data.get('preferred_qualifications') or [])
+    return {normalize_skill(skill) for skill in skills if str(skill).strip()}
+
+class SkillIndex:
+    """Inverted index from skill to active job ids, maintained incrementally"""
+
+    def __init__(self, loader=None, refresh_interval=300):
+        self.loader = loader
+        self.refresh_interval = refresh_interval
+        self._postings = defaultdict(set)
+        self._job_skills = {}
+        self._loaded_at = None
+        self._rebuilding = False
+        self._pending = {}
+        self._lock = threading.RLock()
+        self._rebuild_lock = threading.Lock()
+
+    def upsert(self, job_id, job_data):
+        """Index a job, or drop it if it is inactive or has no skills"""
+        with self._lock:
+            if self._rebuilding:
+                self._pending[job_id] = job_data
+            self._remove(job_id)
+            if job_data.get('is_active', False):
+                skills = job_skills(job_data)
+                if skills:
+                    self._job_skills[job_id] = skills
+                    for skill in skills:
+                        self._postings[skill].add(job_id)
+
+    def remove(self, job_id):
+        """Drop a job from the index"""
+        self.upsert(job_id, {'is_active': False})
+
+    def match(self, skills, min_score=0.3):
+        """Return (job_id, score, matching_skills) for jobs sharing skills, best first"""
+        self._ensure_fresh()
+
+        # Several spellings of the same skill count once
+        wanted = {}
+        for skill in skills:
+            if str(skill).strip():
+                wanted.setdefault(normalize_skill(skill), skill)
+
+        counts = Counter()
+        matching = defaultdict(list)
+        with self._lock:
+            for skill, original in wanted.items():
+                for job_id in self._postings.get(skill, ()):
+                    counts[job_id] += 1
+                    matching[job_id].append(original)
+            sizes = {job_id: len(self._job_skills[job_id]) for job_id in counts}
+
+        results = []
+        for job_id, count in counts.items():
+            score = count / sizes[job_id]
+            if score >= min_score:
+                results.append((job_id, score, matching[job_id]))
+        results.sort(key=lambda result: result[1], reverse=True)
+        return results
+
+    def rebuild(self):
+        """Reload every active job from the loader and swap in a fresh index"""
+        with self._rebuild_lock:
+            self._rebuild()
+
+    def _rebuild(self):
+        with self._lock:
+            self._rebuilding = True
+            self._pending = {}
+        try:
+            postings = defaultdict(set)
+            skills_by_job = {}
+            for job_id, job_data in self.loader():
+                skills = job_skills(job_data)
+                if job_data.get('is_active', False) and skills:
+                    skills_by_job[job_id] = skills
+                    for skill in skills:
+                        postings[skill].add(job_id)
+
+            with self._lock:
+                self._postings, self._job_skills = postings, skills_by_job
+                self._loaded_at = time.monotonic()
+                self._rebuilding = False
+                # Writes that raced with the scan win over the snapshot
+                for job_id, job_data in self._pending.items():
+                    self.upsert(job_id, job_data)
+                self._pending = {}
+            logger.info(f"Skill index rebuilt with {len(skills_by_job)} jobs and {len(postings)} skills")
+        finally:
+            with self._lock:
+                self._rebuilding = False
+
+    def _rebuild_in_background(self):
+        if not self._rebuild_lock.acquire(blocking=False):
+            return
+        try:
+            self._rebuild()
+        except Exception as e:
+            logger.error(f"Skill index refresh failed: {e}")
+        finally:
+            self._rebuild_lock.release()
+
+    def stats(self):
+        """Return index size and age"""
+        with self._lock:
+            return {
+                "jobs": len(self._job_skills),
+                "skills": len(self._postings),
+                "age_seconds": round(time.monotonic() - self._loaded_at, 1) if self._loaded_at else None
+            }
+
+    def _ensure_fresh(self):
+        if self.loader is None:
+            return
+        if self._loaded_at is None:
+            # The first match has to wait for the initial load
+            with self._rebuild_lock:
+                if self._loaded_at is None:
+                    self._rebuild()
+        elif time.monotonic() - self._loaded_at > self.refresh_interval and not self._rebuild_lock.locked():
+            # Later refreshes only pick up writes from other workers, serve the current index meanwhile
+            threading.Thread(target=self._rebuild_in_background, daemon=True).start()
+
+    def _remove(self, job_id):
+        for skill in self._job_skills.pop(job_id, ()):
+            postings = self._postings.get(skill)
+            if postings is not None:
+                postings.discard(job_id)
+                if not postings:
+                    del self._postings[skill]
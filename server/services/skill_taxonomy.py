@@ -0,0 +1,267 @@
+from collections import deque
+
+# Canonical skills per resume field, each with the aliases that should map to it.
+# Aliases are matched case-insensitively on word boundaries; the canonical name
+# itself is always an alias. Text is usually preprocessed first, which drops '/'
+# so aliases like "ci/cd" also list their slash-less form.
+SKILL_TAXONOMY = {
+    'programming_languages': {
+        'Python': ['python3', 'py'],
+        'Java': ['core java', 'java se', 'java ee'],
+        'JavaScript': ['js', 'ecmascript', 'es6', 'vanilla js'],
+        'TypeScript': ['ts'],
+        'C++': ['cpp', 'c plus plus'],
+        'C#': ['csharp', 'c sharp'],
+        'Golang': ['go lang', 'go programming'],
+        'Ruby': [],
+        'PHP': [],
+        'Swift': [],
+        'Kotlin': [],
+        'Rust': [],
+        'Scala': [],
+        'MATLAB': [],
+        'Perl': [],
+        'Dart': [],
+        'Elixir': [],
+        'Haskell': [],
+        'Lua': [],
+        'Objective-C': ['objective c', 'objc'],
+        'SQL': ['t-sql', 'pl-sql', 'plsql', 'tsql'],
+        'Bash': ['shell scripting', 'bash scripting', 'shell script'],
+        'HTML': ['html5'],
+        'CSS': ['css3'],
+        'Solidity': [],
+        'Groovy': [],
+        'Clojure': [],
+        'COBOL': [],
+        'Fortran': [],
+        'Visual Basic': ['vb.net', 'vba']
+    },
+    'frameworks_tools': {
+        'React': ['react.js', 'reactjs'],
+        'React Native': [],
+        'Angular': ['angularjs', 'angular.js'],
+        'Vue.js': ['vue', 'vuejs'],
+        'Next.js': ['nextjs'],
+        'Node.js': ['node', 'nodejs'],
+        'Express.js': ['expressjs'],
+        'Svelte': [],
+        'jQuery': [],
+        'Redux': [],
+        'Tailwind CSS': ['tailwind', 'tailwindcss'],
+        'Django': [],
+        'Flask': [],
+        'FastAPI': [],
+        'Spring Boot': ['springboot', 'spring framework'],
+        '.NET': ['dotnet', '.net core'],
+        'ASP.NET': ['asp.net core'],
+        'Ruby on Rails': ['ror'],
+        'Laravel': [],
+        'Flutter': [],
+        'Android': ['android sdk'],
+        'iOS': [],
+        'Xcode': [],
+        'TensorFlow': [],
+        'PyTorch': [],
+        'Keras': [],
+        'scikit-learn': ['sklearn', 'scikit learn'],
+        'Pandas': [],
+        'NumPy': [],
+        'OpenCV': [],
+        'Hugging Face': ['huggingface'],
+        'LangChain': [],
+        'FAISS': [],
+        'Apache Spark': ['pyspark'],
+        'Hadoop': [],
+        'Apache Kafka': ['kafka'],
+        'Apache Airflow': ['airflow'],
+        'Databricks': [],
+        'Docker': [],
+        'Kubernetes': ['k8s'],
+        'Terraform': [],
+        'Ansible': [],
+        'Jenkins': [],
+        'GitHub Actions': [],
+        'Git': [],
+        'GitHub': [],
+        'GitLab': [],
+        'Jira': [],
+        'Linux': ['unix'],
+        'Nginx': [],
+        'GraphQL': [],
+        'REST APIs': ['rest api', 'restful', 'restful apis'],
+        'gRPC': [],
+        'PostgreSQL': ['postgres'],
+        'MySQL': [],
+        'MongoDB': ['mongo'],
+        'Redis': [],
+        'Elasticsearch': ['elastic search'],
+        'SQLite': [],
+        'Oracle Database': ['oracle db'],
+        'DynamoDB': [],
+        'Cassandra': ['apache cassandra'],
+        'Firebase': [],
+        'Firestore': [],
+        'AWS': ['amazon web services'],
+        'Azure': ['microsoft azure'],
+        'Google Cloud': ['gcp', 'google cloud platform'],
+        'Heroku': [],
+        'Vercel': [],
+        'RabbitMQ': [],
+        'Prometheus': [],
+        'Grafana': [],
+        'Postman': [],
+        'Selenium': [],
+        'Jest': [],
+        'Pytest': [],
+        'Cypress': [],
+        'Webpack': [],
+        'Vite': [],
+        'Figma': [],
+        'Tableau': [],
+        'Power BI': ['powerbi'],
+        'Microsoft Excel': ['ms excel'],
+        'Unity Engine': ['unity3d']
+    },
+    'technical_skills': {
+        'Machine Learning': ['ml'],
+        'Deep Learning': [],
+        'Natural Language Processing': ['nlp'],
+        'Computer Vision': [],
+        'Large Language Models': ['llm', 'llms'],
+        'Generative AI': ['genai', 'gen ai'],
+        'Artificial Intelligence': ['ai'],
+        'Reinforcement Learning': [],
+        'MLOps': [],
+        'Data Science': [],
+        'Data Analysis': ['data analytics'],
+        'Data Engineering': [],
+        'Data Visualization': [],
+        'Big Data': [],
+        'ETL': ['etl pipelines'],
+        'Statistics': ['statistical analysis'],
+        'Microservices': ['microservice architecture'],
+        'CI/CD': ['cicd', 'ci-cd', 'continuous integration', 'continuous deployment'],
+        'DevOps': [],
+        'Cloud Computing': [],
+        'Serverless': [],
+        'Distributed Systems': [],
+        'System Design': [],
+        'Object-Oriented Programming': ['oop', 'object oriented programming'],
+        'Data Structures': [],
+        'Algorithms': [],
+        'Agile': ['scrum', 'kanban'],
+        'Test-Driven Development': ['tdd', 'test driven development'],
+        'Unit Testing': [],
+        'Web Development': [],
+        'Mobile Development': ['mobile app development'],
+        'Full Stack Development': ['full stack', 'full-stack', 'fullstack'],
+        'Frontend Development': ['frontend', 'front-end', 'front end'],
+        'Backend Development': ['backend', 'back-end', 'back end'],
+        'Cybersecurity': ['information security', 'cyber security'],
+        'Blockchain': [],
+        'Web Scraping': [],
+        'UI/UX Design': ['ui/ux', 'uiux', 'ux design', 'ui design']
+    },
+    'soft_skills': {
+        'Communication': ['communication skills'],
+        'Leadership': [],
+        'Teamwork': ['team player', 'collaboration'],
+        'Problem Solving': ['problem-solving'],
+        'Critical Thinking': [],
+        'Analytical Thinking': ['analytical skills'],
+        'Time Management': [],
+        'Adaptability': [],
+        'Project Management': [],
+        'Mentoring': ['mentorship'],
+        'Public Speaking': ['presentation skills'],
+        'Attention to Detail': ['detail-oriented', 'detail oriented'],
+        'Creativity': [],
+        'Negotiation': [],
+        'Stakeholder Management': [],
+        'Conflict Resolution': [],
+        'Decision Making': ['decision-making']
+    }
+}
+
+SKILL_CATEGORIES = tuple(SKILL_TAXONOMY)
+
+class SkillMatcher:
+    """Aho-Corasick automaton over skill aliases that finds canonical skills in one pass"""
+
+    def __init__(self, taxonomy=SKILL_TAXONOMY):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self.aliases = {}  # alias -> (category, canonical)
+
+        for category, skills in taxonomy.items():
+            for canonical, aliases in skills.items():
+                for alias in [canonical, *aliases]:
+                    alias = alias.lower()
+                    self.aliases.setdefault(alias, (category, canonical))
+                    self._add(alias, (category, canonical, len(alias)))
+        self._build()
+
+    def _add(self, word, value):
+        node = 0
+        for ch in word:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[node][ch] = next_node
+            node = next_node
+        self._output[node].append(value)
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, next_node in self._goto[node].items():
+                queue.append(next_node)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_node] = self._goto[fail].get(ch, 0)
+                self._output[next_node] = self._output[next_node] + self._output[self._fail[next_node]]
+
+    def iter_matches(self, text):
+        """Yield (category, canonical, start) for every alias found on word boundaries"""
+        text = text.lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not output[node]:
+                continue
+            after_ok = i + 1 == len(text) or not text[i + 1].isalnum()
+            for category, canonical, length in output[node]:
+                start = i - length + 1
+                if after_ok and (start == 0 or not text[start - 1].isalnum()):
+                    yield category, canonical, start
+
+    def extract(self, text):
+        """Return canonical skills found in text, grouped by category in order of first mention"""
+        found = {category: {} for category in SKILL_CATEGORIES}
+        for category, canonical, _ in self.iter_matches(text or ""):
+            found.setdefault(category, {})[canonical] = None
+        return {category: list(skills) for category, skills in found.items()}
+
+    def canonicalize(self, skill):
+        """Map a skill name or alias to its canonical name, or None if unknown"""
+        match = self.aliases.get((skill or "").strip().lower())
+        return match[1] if match else None
+
+_default_matcher = None
+
+def get_skill_matcher():
+    """Get the shared matcher for the built-in taxonomy, compiling it on first use"""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = SkillMatcher()
+    return _default_matcher
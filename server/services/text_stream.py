@@ -0,0 +1,72 @@
+import re
+
+# Characters kept by normalization besides word characters and whitespace
+SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s@\+\(\)\-\.\,\#\&]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def normalize_stream(pieces):
+    """Collapse whitespace, drop special characters and strip a stream of text pieces
+
+    Joining the output gives the same result as normalizing the joined input,
+    without ever holding the whole document in memory.
+    """
+    in_whitespace = False
+    started = False
+    held = ""  # Trailing whitespace that is only emitted if more text follows
+
+    for piece in pieces:
+        if not piece:
+            continue
+
+        collapsed = WHITESPACE_PATTERN.sub(' ', piece)
+        # A whitespace run spanning two pieces collapses to a single space
+        if in_whitespace and collapsed.startswith(' '):
+            collapsed = collapsed[1:]
+        in_whitespace = piece[-1].isspace()
+
+        text = SPECIAL_CHARS_PATTERN.sub('', collapsed)
+        if not started:
+            text = text.lstrip()
+            if not text:
+                continue
+            started = True
+
+        body = text.rstrip()
+        if body:
+            yield held + body
+            held = text[len(body):]
+        else:
+            held += text
+
+def chunk_stream(pieces, chunk_size=1000, overlap=200):
+    """Split a stream of text into overlapping chunks, preferring sentence boundaries"""
+    buffer = ""
+    emitted = False
+
+    for piece in pieces:
+        buffer += piece
+        # Only cut once the buffer holds more than a chunk, so we know it is not the last one
+        while len(buffer) > chunk_size:
+            end = chunk_size
+            last_period = buffer.rfind('.', 0, end)
+            if last_period > chunk_size // 2:
+                end = last_period + 1
+            yield buffer[:end].strip()
+            emitted = True
+            buffer = buffer[end - overlap:]
+
+    yield buffer.strip() if emitted else buffer
+
+class TextPrefix:
+    """Pass a text stream through while keeping its first limit characters"""
+
+    def __init__(self, pieces, limit):
+        self.pieces = pieces
+        self.limit = limit
+        self.text = ""
+
+    def __iter__(self):
+        for piece in self.pieces:
+            if len(self.text) < self.limit:
+                self.text += piece[:self.limit - len(self.text)]
+            yield piece
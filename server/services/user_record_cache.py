@@ -0,0 +1,90 @@
+import os
+import time
+import threading
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+def _get_firebase_user(uid):
+    from firebase_admin import auth
+    return auth.get_user(uid)
+
+class UserRecordCache:
+    """Bounded TTL cache of Firebase Auth user records keyed by uid, evicting least recently used"""
+
+    def __init__(self, fetch=None, max_entries=10000, ttl=300):
+        self.fetch = fetch or _get_firebase_user
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._records = OrderedDict()  # uid -> (record, fetched_at)
+        self._generations = {}  # uid -> invalidation count, for uids invalidated while cached or in flight
+        self._lock = threading.Lock()
+
+    def get(self, uid):
+        """Return the user record for uid, fetching it from Firebase Auth when missing or expired"""
+        with self._lock:
+            entry = self._records.get(uid)
+            if entry is not None and time.monotonic() - entry[1] <= self.ttl:
+                self._records.move_to_end(uid)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            generation = self._generations.get(uid, 0)
+
+        # The remote call runs outside the lock; errors such as UserNotFoundError are not cached
+        record = self.fetch(uid)
+
+        with self._lock:
+            # An invalidation during the fetch means the record may predate the update
+            if self._generations.get(uid, 0) == generation:
+                self._records[uid] = (record, time.monotonic())
+                self._records.move_to_end(uid)
+                while len(self._records) > self.max_entries:
+                    evicted, _ = self._records.popitem(last=False)
+                    self._generations.pop(evicted, None)
+                    self.evictions += 1
+        return record
+
+    def invalidate(self, uid):
+        """Drop a cached record after the user is updated"""
+        with self._lock:
+            self._records.pop(uid, None)
+            self._generations[uid] = self._generations.get(uid, 0) + 1
+            self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+            self._generations.clear()
+
+    def stats(self):
+        """Return hit/miss counters and entry count"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._records)
+            }
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+def get_user_record_cache():
+    """Get the user record cache shared by the app and the blueprints, creating it on first use"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = UserRecordCache(
+                max_entries=int(os.getenv("USER_RECORD_CACHE_MAX_ENTRIES", 10000)),
+                ttl=int(os.getenv("USER_RECORD_CACHE_TTL", 300))
+            )
+    return _shared_cache
@@ -0,0 +1,160 @@
+import os
+import time
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Firestore rejects batches with more than 500 writes
+MAX_BATCH_WRITES = 500
+
+class WriteBehindBuffer:
+    """Coalesces field updates per document and writes them to Firestore in batches off the request path
+
+    Each document keeps only its latest pending fields, so a burst of updates
+    to one document becomes a single write. A background thread flushes on an
+    interval, sooner when max_pending documents are waiting, and once more at
+    shutdown. Updates after shutdown are written through synchronously. Pending
+    updates are lost if the process dies without shutting down, so only use
+    this for fields that can tolerate it, such as timestamps.
+    """
+
+    def __init__(self, db, collection, interval=2.0, max_pending=10000, batch_size=MAX_BATCH_WRITES):
+        self.db = db
+        self.collection = collection
+        self.interval = interval
+        self.max_pending = max_pending
+        self.batch_size = min(batch_size, MAX_BATCH_WRITES)
+        self.updates = 0
+        self.coalesced = 0
+        self.writes = 0
+        self.batches = 0
+        self.failures = 0
+        self.last_flush_lag = None
+        self._pending = {}  # doc id -> (fields, first queued at)
+        self._wake = threading.Event()
+        self._stopped = False
+        self._started_pid = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def update(self, doc_id, fields):
+        """Queue fields for a document, merging them into any update still pending for it"""
+        self._ensure_started()
+        with self._lock:
+            self.updates += 1
+            stopped = self._stopped
+            if not stopped:
+                entry = self._pending.get(doc_id)
+                if entry is None:
+                    self._pending[doc_id] = (dict(fields), time.monotonic())
+                else:
+                    entry[0].update(fields)
+                    self.coalesced += 1
+                if len(self._pending) >= self.max_pending:
+                    self._wake.set()
+        if stopped:
+            # Nothing flushes after shutdown, so write now rather than drop the update
+            self._write([(doc_id, dict(fields))])
+
+    def flush(self):
+        """Write everything pending now, in batches of up to batch_size"""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+
+            lag = round(time.monotonic() - min(queued_at for _, queued_at in pending.values()), 3)
+            with self._lock:
+                self.last_flush_lag = lag
+            items = [(doc_id, fields) for doc_id, (fields, _) in pending.items()]
+            for start in range(0, len(items), self.batch_size):
+                self._write(items[start:start + self.batch_size])
+            return len(items)
+
+    def shutdown(self):
+        """Stop the flusher and write what is still pending"""
+        with self._lock:
+            # Updates that see this write through, those queued before it are flushed below
+            self._stopped = True
+        self._wake.set()
+        if self._thread is not None and self._started_pid == os.getpid():
+            self._thread.join(timeout=self.interval + 5)
+        self.flush()
+
+    def stats(self):
+        """Return queue depth, flush lag and write counters"""
+        with self._lock:
+            oldest = min((queued_at for _, queued_at in self._pending.values()), default=None)
+            return {
+                "queue_depth": len(self._pending),
+                "oldest_pending_seconds": round(time.monotonic() - oldest, 3) if oldest is not None else None,
+                "last_flush_lag_seconds": self.last_flush_lag,
+                "updates": self.updates,
+                "coalesced": self.coalesced,
+                "writes": self.writes,
+                "batches": self.batches,
+                "failures": self.failures
+            }
+
+    def _ensure_started(self):
+        # Threads do not survive a fork, so a forked worker starts its own flusher
+        if self._started_pid == os.getpid() or self._stopped:
+            return
+        with self._lock:
+            if self._started_pid == os.getpid():
+                return
+            self._started_pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Write-behind flush of {self.collection} failed: {e}")
+
+    def _write(self, items):
+        collection = self.db.collection(self.collection)
+        batch = self.db.batch()
+        for doc_id, fields in items:
+            batch.update(collection.document(doc_id), fields)
+        try:
+            batch.commit()
+            with self._lock:
+                self.batches += 1
+                self.writes += len(items)
+            return
+        except Exception as e:
+            # One missing document fails the whole batch, so retry the writes one by one
+            logger.warning(f"Write-behind batch of {len(items)} {self.collection} updates failed, retrying singly: {e}")
+
+        for doc_id, fields in items:
+            try:
+                collection.document(doc_id).update(fields)
+                with self._lock:
+                    self.writes += 1
+            except Exception as e:
+                with self._lock:
+                    self.failures += 1
+                logger.warning(f"Write-behind update of {self.collection}/{doc_id} dropped: {e}")
+
+_shared_buffers = {}
+_shared_lock = threading.Lock()
+
+def get_write_behind(db, collection):
+    """Get the write-behind buffer for a collection, shared by the app and the blueprints"""
+    with _shared_lock:
+        if collection not in _shared_buffers:
+            _shared_buffers[collection] = WriteBehindBuffer(
+                db,
+                collection,
+                interval=float(os.getenv("WRITE_BEHIND_INTERVAL", 2)),
+                max_pending=int(os.getenv("WRITE_BEHIND_MAX_PENDING", 10000))
+            )
+    return _shared_buffers[collection]
@@ -0,0 +1,323 @@
+import sys
+import importlib
+from collections import defaultdict
+import pytest
+
+try:
+    from google.api_core.exceptions import AlreadyExists, NotFound
+    from google.cloud.firestore_v1 import transforms
+except ImportError:
+    class AlreadyExists(Exception):
+        pass
+
+    class NotFound(Exception):
+        pass
+
+    transforms = None
+
+DOCUMENT_ID = "__name__"
+
+def apply_fields(current, fields):
+    """Merge fields into a document, applying Firestore's Increment and DELETE_FIELD transforms"""
+    merged = dict(current)
+    for field, value in fields.items():
+        if transforms is not None and value is transforms.DELETE_FIELD:
+            merged.pop(field, None)
+        elif transforms is not None and value is transforms.SERVER_TIMESTAMP:
+            merged[field] = "SERVER_TIMESTAMP"
+        elif transforms is not None and isinstance(value, transforms.Increment):
+            merged[field] = merged.get(field, 0) + value.value
+        else:
+            merged[field] = value
+    return merged
+
+class FakeSnapshot:
+    def __init__(self, reference, data, field_paths=None):
+        self.reference = reference
+        self.id = reference.id
+        self.exists = data is not None
+        if data is not None and field_paths is not None:
+            data = {field: data[field] for field in field_paths if field in data}
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+    def get(self, field):
+        return self._data.get(field)
+
+class FakeDocument:
+    def __init__(self, db, collection_path, doc_id):
+        self.db = db
+        self.collection_path = collection_path
+        self.id = doc_id
+        self.path = f"{collection_path}/{doc_id}"
+
+    def _docs(self):
+        return self.db.data[self.collection_path]
+
+    def get(self, field_paths=None):
+        return FakeSnapshot(self, self._docs().get(self.id), field_paths)
+
+    def set(self, fields, merge=False):
+        current = self._docs().get(self.id, {}) if merge else {}
+        self._docs()[self.id] = apply_fields(current, fields)
+
+    def create(self, fields):
+        if self.id in self._docs():
+            raise AlreadyExists(self.path)
+        self.set(fields)
+
+    def update(self, fields):
+        if self.id not in self._docs() or self.path in self.db.missing:
+            raise NotFound(self.path)
+        self._docs()[self.id] = apply_fields(self._docs()[self.id], fields)
+        self.db.single_writes += 1
+
+    def delete(self):
+        self._docs().pop(self.id, None)
+
+    def collection(self, name):
+        return FakeCollection(self.db, f"{self.path}/{name}")
+
+class FakeAggregate:
+    def __init__(self, value):
+        self.value = value
+
+class FakeCount:
+    def __init__(self, query):
+        self.query = query
+
+    def get(self):
+        return [[FakeAggregate(len(self.query.stream()))]]
+
+class FakeWatch:
+    def __init__(self):
+        self.is_active = True
+        self.unsubscribed = False
+
+    def unsubscribe(self):
+        self.unsubscribed = True
+
+class FakeQuery:
+    def __init__(self, db, collection_path, filters=(), orders=(), limit=None, fields=None, after=None):
+        self.db = db
+        self.collection_path = collection_path
+        self.filters = list(filters)
+        self.orders = list(orders)
+        self._limit = limit
+        self.fields = fields
+        self.after = after
+
+    def _copy(self, **changes):
+        state = dict(filters=self.filters, orders=self.orders, limit=self._limit, fields=self.fields, after=self.after)
+        state.update(changes)
+        return FakeQuery(self.db, self.collection_path, **state)
+
+    def where(self, field, op, value):
+        return self._copy(filters=self.filters + [(field, op, value)])
+
+    def order_by(self, field, direction="ASCENDING"):
+        return self._copy(orders=self.orders + [(field, direction == "DESCENDING")])
+
+    def limit(self, count):
+        return self._copy(limit=count)
+
+    def select(self, fields):
+        return self._copy(fields=list(fields))
+
+    def start_after(self, values):
+        return self._copy(after=values)
+
+    def count(self):
+        return FakeCount(self)
+
+    def stream(self):
+        docs = self.db.data[self.collection_path]
+        rows = [(doc_id, data) for doc_id, data in docs.items() if all(
+            self._matches(doc_id, data, *condition) for condition in self.filters)]
+        for field, descending in reversed(self.orders):
+            rows.sort(key=lambda row: self._value(row, field), reverse=descending)
+        if self.after is not None:
+            rows = [row for row in rows if self._is_after(row)]
+        if self._limit is not None:
+            rows = rows[:self._limit]
+        collection = FakeCollection(self.db, self.collection_path)
+        return [FakeSnapshot(collection.document(doc_id), data, self.fields) for doc_id, data in rows]
+
+    get = stream
+
+    def on_snapshot(self, callback):
+        """Deliver the current results like a Firestore listener's first snapshot"""
+        watch = FakeWatch()
+        self.db.watches.append(watch)
+        callback(self.stream(), [], None)
+        return watch
+
+    @staticmethod
+    def _value(row, field):
+        doc_id, data = row
+        return doc_id if field == DOCUMENT_ID else data.get(field)
+
+    def _matches(self, doc_id, data, field, op, value):
+        actual = self._value((doc_id, data), field)
+        if op == "==":
+            return actual == value
+        if op == "!=":
+            return actual != value
+        if op == "in":
+            return actual in value
+        if op == "array_contains":
+            return value in (actual or [])
+        if actual is None:
+            return False
+        return {"<": actual < value, "<=": actual <= value, ">": actual > value, ">=": actual >= value}[op]
+
+    def _is_after(self, row):
+        key = tuple(self._value(row, field) for field, _ in self.orders)
+        cursor = tuple(self.after[field] for field, _ in self.orders)
+        for value, bound, (_, descending) in zip(key, cursor, self.orders):
+            if value != bound:
+                return value < bound if descending else value > bound
+        return False
+
+class FakeCollection(FakeQuery):
+    def __init__(self, db, collection_path, **state):
+        super().__init__(db, collection_path, **state)
+        self.id = collection_path.rsplit("/", 1)[-1]
+
+    def document(self, doc_id=None):
+        if doc_id is None:
+            self.db.generated_ids += 1
+            doc_id = f"generated{self.db.generated_ids}"
+        return FakeDocument(self.db, self.collection_path, doc_id)
+
+    def add(self, fields):
+        ref = self.document()
+        ref.set(fields)
+        return None, ref
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+        self.writes = []
+
+    def set(self, ref, fields, merge=False):
+        self.writes.append(("set", ref, fields, merge))
+
+    def create(self, ref, fields):
+        self.writes.append(("create", ref, fields, False))
+
+    def update(self, ref, fields):
+        self.writes.append(("update", ref, fields, False))
+
+    def delete(self, ref):
+        self.writes.append(("delete", ref, None, False))
+
+    def commit(self):
+        # Check every precondition first so a failed batch writes nothing
+        for op, ref, _, _ in self.writes:
+            exists = ref.id in ref._docs()
+            if op == "create" and exists:
+                raise AlreadyExists(ref.path)
+            if op == "update" and (not exists or ref.path in self.db.missing):
+                raise NotFound(ref.path)
+        for op, ref, fields, merge in self.writes:
+            if op == "delete":
+                ref.delete()
+            elif op == "update":
+                ref._docs()[ref.id] = apply_fields(ref._docs()[ref.id], fields)
+            else:
+                ref.set(fields, merge=merge)
+        self.db.batch_sizes.append(len(self.writes))
+
+class FakeFirestore:
+    """In-memory stand-in for the parts of the Firestore client the server uses
+
+    data maps a collection path ("jobs", "jobs/<id>/applicants") to its
+    documents by id. Paths in missing make updates fail as if the document
+    had been deleted.
+    """
+
+    def __init__(self):
+        self.data = defaultdict(dict)
+        self.missing = set()
+        self.batch_sizes = []
+        self.single_writes = 0
+        self.generated_ids = 0
+        self.watches = []
+
+    def collection(self, name):
+        return FakeCollection(self, name)
+
+    def batch(self):
+        return FakeBatch(self)
+
+    def get_all(self, refs, field_paths=None):
+        for ref in refs:
+            yield ref.get(field_paths)
+
+    def reset(self):
+        self.__init__()
+
+@pytest.fixture
+def firestore_db():
+    return FakeFirestore()
+
+# Modules server.py needs beyond the services, the app tests skip without them
+SERVER_DEPENDENCIES = ("flask", "flask_cors", "flask_limiter", "dotenv", "firebase_admin", "openai",
+                       "langchain", "langchain_openai", "langchain_community")
+
+@pytest.fixture(scope="session")
+def server_module(tmp_path_factory):
+    """Import server.py once, against a FakeFirestore instead of a Firebase project"""
+    for name in SERVER_DEPENDENCIES:
+        pytest.importorskip(name)
+    import firebase_admin
+    from firebase_admin import credentials, firestore
+
+    root = tmp_path_factory.mktemp("server")
+    credentials_path = root / "credentials.json"
+    credentials_path.write_text("{}")
+    db = FakeFirestore()
+    patch = pytest.MonkeyPatch()
+    for name, value in {
+        "FIREBASE_CREDENTIALS": str(credentials_path),
+        "JWT_SECRET": "test-secret-that-is-long-enough-for-hs256",
+        "OPENAI_API_KEY": "test",
+        "JOB_CATALOGUE_MODE": "cache",
+        # Reload the catalogue on every read so tests can write straight to the fake
+        "JOB_CACHE_TTL": "0",
+        "EXTRACTION_CACHE_PATH": str(root / "extraction_cache.db"),
+        "EMBEDDING_CACHE_PATH": str(root / "embeddings.db"),
+        "RESUME_INDEX_DIR": str(root / "resume_indexes")
+    }.items():
+        patch.setenv(name, value)
+    patch.setattr(credentials, "Certificate", lambda path: object())
+    patch.setattr(firebase_admin, "initialize_app", lambda cred: None)
+    patch.setattr(firestore, "client", lambda: db)
+    try:
+        server = importlib.import_module("server")
+    finally:
+        patch.undo()
+    server.limiter.enabled = False
+    yield server
+    sys.modules.pop("server", None)
+
+@pytest.fixture
+def server(server_module):
+    """The server module with an empty database"""
+    server_module.db.reset()
+    return server_module
+
+@pytest.fixture
+def client(server):
+    return server.app.test_client()
+
+@pytest.fixture
+def auth_headers(server):
+    """Build an Authorization header for a user id and role"""
+    def build(uid, role="applicant", **kwargs):
+        token = server.create_access_token(uid, f"{uid}@example.com", "google.com", role, **kwargs)
+        return {"Authorization": f"Bearer {token}"}
+    return build
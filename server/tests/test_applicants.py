@@ -0,0 +1,45 @@
+from services.applicants import fetch_applicant_resumes
+from utils.batch_reads import get_all_batched
+
+def count_get_all(db, monkeypatch):
+    calls = []
+    get_all = db.get_all
+
+    def counted(refs, field_paths=None):
+        refs = list(refs)
+        calls.append(len(refs))
+        return get_all(refs, field_paths=field_paths)
+    monkeypatch.setattr(db, "get_all", counted)
+    return calls
+
+def test_reads_users_then_resumes_in_batches(firestore_db, monkeypatch):
+    for i in range(5):
+        firestore_db.data["users"][f"u{i}"] = {"resumeId": f"r{i}", "email": "secret"}
+        firestore_db.data["resumes"][f"r{i}"] = {"name": f"Applicant {i}", "phone": "555"}
+    calls = count_get_all(firestore_db, monkeypatch)
+
+    resumes = fetch_applicant_resumes(firestore_db, [f"u{i}" for i in range(5)], ["name"], chunk_size=2)
+
+    assert resumes == {f"u{i}": {"name": f"Applicant {i}"} for i in range(5)}
+    # Chunks of two: three calls for the users and three for the resumes, not ten single reads
+    assert sorted(calls) == [1, 1, 2, 2, 2, 2]
+
+def test_skips_applicants_without_a_resume(firestore_db):
+    firestore_db.data["users"]["with"] = {"resumeId": "r1"}
+    firestore_db.data["users"]["without"] = {}
+    firestore_db.data["users"]["dangling"] = {"resumeId": "deleted"}
+    firestore_db.data["resumes"]["r1"] = {"name": "A"}
+
+    resumes = fetch_applicant_resumes(firestore_db, ["with", "without", "dangling", "unknown"], ["name"])
+
+    assert resumes == {"with": {"name": "A"}}
+
+def test_get_all_batched_reads_duplicates_once(firestore_db, monkeypatch):
+    firestore_db.data["users"]["u1"] = {"role": "applicant"}
+    calls = count_get_all(firestore_db, monkeypatch)
+    ref = firestore_db.collection("users").document("u1")
+
+    snapshots = get_all_batched(firestore_db, [ref, ref, firestore_db.collection("users").document("u2")])
+
+    assert calls == [2]
+    assert snapshots["users/u1"].exists and not snapshots["users/u2"].exists
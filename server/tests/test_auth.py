@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+def stub_user_records(server, monkeypatch):
+    """Serve Firebase Auth lookups from a stub, returning the uids looked up"""
+    fetched = []
+
+    def fetch(uid):
+        fetched.append(uid)
+        return SimpleNamespace(uid=uid, email=f"{uid}@example.com", display_name="New Name",
+                               email_verified=True, photo_url=None)
+
+    server.user_records.clear()
+    monkeypatch.setattr(server.user_records, "fetch", fetch)
+    return fetched
+
+def test_verify_answers_from_the_token_claims(server, client, auth_headers, monkeypatch):
+    fetched = stub_user_records(server, monkeypatch)
+    uid = "verify-current"
+    headers = auth_headers(uid, profile_version=server.profile_versions.get(uid))
+
+    response = client.get("/auth/verify", headers=headers)
+
+    assert response.status_code == 200
+    assert response.get_json()["user"]["role"] == "applicant"
+    assert fetched == []
+
+def test_verify_reads_the_profile_again_after_it_changed(server, client, auth_headers, monkeypatch):
+    fetched = stub_user_records(server, monkeypatch)
+    uid = "verify-stale"
+    headers = auth_headers(uid, profile_version=server.profile_versions.get(uid))
+    server.db.data["users"][uid] = {"role": "requester"}
+
+    server.profile_versions.bump(uid)
+    response = client.get("/auth/verify", headers=headers)
+
+    assert response.status_code == 200
+    assert response.get_json()["user"]["displayName"] == "New Name"
+    assert response.get_json()["user"]["role"] == "requester"
+    assert fetched == [uid]
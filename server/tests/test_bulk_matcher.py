@@ -0,0 +1,51 @@
+import random
+import pytest
+from services.bulk_matcher import BulkMatcher
+from benchmarks.bench_bulk_matcher import set_top_matches
+
+def test_scores_are_shared_skills_over_job_skills():
+    matcher = BulkMatcher()
+    resume_bits = matcher.pack([["Python", "SQL"]])
+    job_bits = matcher.pack([["python", "Docker"], ["SQL"], []])
+
+    scores = matcher.scores(resume_bits, job_bits)
+
+    assert scores.tolist() == [[0.5, 1.0, 0.0]]
+
+def test_top_matches_orders_filters_and_reports_skills_in_resume_spelling():
+    resumes = {"r1": ["Python", "Machine  Learning", "SQL"]}
+    jobs = {
+        "all": ["python", "sql"],
+        "half": ["Python", "Go"],
+        "none": ["Rust"],
+        "third": ["machine learning", "Go", "Java"]
+    }
+
+    matches = BulkMatcher().top_matches(resumes, jobs, k=5, min_score=0.4)
+
+    assert [(job_id, round(score, 3)) for job_id, score, _ in matches["r1"]] == [("all", 1.0), ("half", 0.5)]
+    assert sorted(matches["r1"][0][2]) == ["Python", "SQL"]
+
+def test_top_matches_keeps_k_best():
+    resumes = {"r1": ["a", "b", "c"]}
+    jobs = {"j1": ["a"], "j2": ["a", "x"], "j3": ["a", "b"], "j4": ["x"]}
+
+    matches = BulkMatcher().top_matches(resumes, jobs, k=2, min_score=0.0, with_skills=False)
+
+    assert {job_id for job_id, _, _ in matches["r1"]} == {"j1", "j3"}
+    assert all(skills == [] for _, _, skills in matches["r1"])
+
+@pytest.mark.parametrize("block_size", [1, 7, 1024])
+def test_top_matches_agrees_with_set_intersection(block_size):
+    rng = random.Random(3)
+    skills = [f"skill{i}" for i in range(40)]
+    resumes = {f"r{i}": rng.sample(skills, rng.randint(1, 12)) for i in range(30)}
+    jobs = {f"j{i}": rng.sample(skills, rng.randint(1, 6)) for i in range(50)}
+
+    bitset = BulkMatcher(block_size=block_size).top_matches(resumes, jobs, k=5, min_score=0.3)
+    baseline = set_top_matches(resumes, jobs, 5, 0.3)
+
+    for resume_id in resumes:
+        # Ties at the cut-off may be broken differently, so compare scores
+        assert [round(score, 5) for _, score, _ in bitset[resume_id]] == \
+            [round(score, 5) for _, score in baseline[resume_id]]
@@ -0,0 +1,37 @@
+import threading
+import pytest
+from utils.concurrency import FanOut
+
+@pytest.fixture
+def fanout():
+    pool = FanOut(max_workers=4, timeout=5)
+    yield pool
+    pool.shutdown()
+
+def test_calls_run_side_by_side_and_results_keep_their_order(fanout):
+    # Each call waits for the others, so this only finishes if they overlap
+    barrier = threading.Barrier(3, timeout=5)
+
+    def call(value):
+        return lambda: (barrier.wait(), value)[1]
+
+    assert fanout.gather(call("a"), call("b"), call("c")) == ["a", "b", "c"]
+    assert fanout.stats()["calls"] == 3
+
+def test_the_earliest_failure_is_raised(fanout):
+    def fail(message):
+        def call():
+            raise ValueError(message)
+        return call
+
+    with pytest.raises(ValueError, match="second"):
+        fanout.gather(lambda: 1, fail("second"), fail("third"))
+
+def test_a_call_missing_the_deadline_raises_timeout(fanout):
+    release = threading.Event()
+
+    with pytest.raises(TimeoutError):
+        fanout.gather(lambda: 1, lambda: release.wait(5), timeout=0.05)
+    release.set()
+
+    assert fanout.stats()["timeouts"] == 1
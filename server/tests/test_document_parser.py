@@ -0,0 +1,75 @@
+import time
+import threading
+import pytest
+from services import document_parser
+from services.document_parser import DocumentParser, _extract_pdf_pages
+from benchmarks.bench_document_parser import build_pdf
+
+def slow_paragraphs(data):
+    time.sleep(30)
+    return []
+
+def test_parses_pdf_across_workers():
+    parser = DocumentParser(max_workers=2, timeout=30, pages_per_task=2)
+    try:
+        text = parser.parse(build_pdf(6), "resume.pdf")
+    finally:
+        parser.shutdown()
+
+    assert "Page 1 line 0" in text
+    assert "Page 6 line 0" in text
+
+def test_workers_are_reused_across_documents():
+    parser = DocumentParser(max_workers=1, timeout=30)
+    try:
+        parser.parse(build_pdf(2), "first.pdf")
+        parser.parse(build_pdf(3), "second.pdf")
+        stats = parser.stats()
+    finally:
+        parser.shutdown()
+
+    assert (stats["started"], stats["idle"], stats["killed"]) == (1, 1, 0)
+
+def test_timeout_only_kills_the_slow_documents_worker(monkeypatch):
+    # Forked workers inherit the patched function, spawned ones would import the real one
+    monkeypatch.setattr(document_parser, "_extract_docx_paragraphs", slow_paragraphs)
+    parser = DocumentParser(max_workers=3, timeout=2, start_method="fork")
+    results = {}
+
+    def parse_slow():
+        try:
+            parser.parse(b"not really a docx", "slow.docx")
+        except Exception as e:
+            results["slow"] = e
+
+    try:
+        parser.parse(build_pdf(1), "warm.pdf")
+        slow = threading.Thread(target=parse_slow)
+        slow.start()
+        time.sleep(0.2)
+        # Runs while the slow document is being killed
+        results["pdf"] = parser.parse(build_pdf(3), "resume.pdf")
+        slow.join()
+        stats = parser.stats()
+    finally:
+        parser.shutdown()
+
+    assert isinstance(results["slow"], TimeoutError)
+    assert "Page 3 line 0" in results["pdf"]
+    assert stats["killed"] == 1
+    assert stats["idle"] == stats["started"] - 1
+
+def test_page_ranges_after_the_first_reuse_the_parsed_document():
+    data = build_pdf(4)
+
+    page_count, first = _extract_pdf_pages("doc-1", data, 0, 2)
+    _, rest = _extract_pdf_pages("doc-1", None, 2, 4)
+
+    assert page_count == 4
+    assert "Page 1 line 0" in first[0] and "Page 4 line 0" in rest[1]
+    with pytest.raises(LookupError):
+        _extract_pdf_pages("doc-2", None, 0, 1)
+
+def test_rejects_unsupported_formats():
+    with pytest.raises(ValueError):
+        DocumentParser(max_workers=1).parse(b"text", "resume.txt")
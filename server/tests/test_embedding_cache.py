@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip("langchain_core")
+from langchain_core.embeddings import Embeddings
+from services.embedding_cache import EmbeddingStore, CachedEmbeddings
+
+class CountingEmbeddings(Embeddings):
+    model = "test-model"
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text):
+        self.calls.append([text])
+        return [float(len(text)), 2.0]
+
+def test_only_uncached_chunks_reach_the_model(tmp_path):
+    model = CountingEmbeddings()
+    embeddings = CachedEmbeddings(model, EmbeddingStore(str(tmp_path / "embeddings.db")))
+
+    first = embeddings.embed_documents(["alpha", "beta", "alpha"])
+    second = embeddings.embed_documents(["beta", "gamma"])
+
+    assert model.calls == [["alpha", "beta"], ["gamma"]]
+    assert first == [[5.0, 1.0], [4.0, 1.0], [5.0, 1.0]]
+    assert second == [[4.0, 1.0], [5.0, 1.0]]
+
+def test_vectors_survive_a_restart(tmp_path):
+    path = str(tmp_path / "embeddings.db")
+    CachedEmbeddings(CountingEmbeddings(), EmbeddingStore(path)).embed_documents(["chunk"])
+
+    model = CountingEmbeddings()
+    vectors = CachedEmbeddings(model, EmbeddingStore(path)).embed_documents(["chunk"])
+
+    assert vectors == [[5.0, 1.0]]
+    assert model.calls == []
+
+def test_keys_include_the_model(tmp_path):
+    store = EmbeddingStore(str(tmp_path / "embeddings.db"))
+    CachedEmbeddings(CountingEmbeddings(), store, model_name="small").embed_query("text")
+
+    model = CountingEmbeddings()
+    CachedEmbeddings(model, store, model_name="large").embed_query("text")
+
+    assert model.calls == [["text"]]
+
+def test_evicts_least_recently_used(tmp_path):
+    store = EmbeddingStore(str(tmp_path / "embeddings.db"), max_entries=2)
+    store.set_many([("a", [1.0])])
+    store.set_many([("b", [2.0])])
+    store.get_many(["a"])
+    store.set_many([("c", [3.0])])
+
+    assert set(store.get_many(["a", "b", "c"])) == {"a", "c"}
+    assert store.stats()["entries"] == 2
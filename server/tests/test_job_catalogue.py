@@ -0,0 +1,117 @@
+import threading
+import pytest
+from services.job_catalogue import JobCatalogueCache, LocalVersionStore
+
+def make_job(created_at, owner="owner1", **fields):
+    return {"is_active": True, "created_at": created_at, "posted_by": owner, "applicant_count": 0, **fields}
+
+def make_cache(jobs, store, check_interval=0):
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return list(jobs.items())
+    return JobCatalogueCache(loader, version_store=store, check_interval=check_interval), loads
+
+class CountingStore(LocalVersionStore):
+    def __init__(self):
+        super().__init__()
+        self.gets = 0
+
+    def get(self, key):
+        self.gets += 1
+        return super().get(key)
+
+def test_increment_does_not_make_other_workers_reload():
+    jobs = {"j1": make_job(1)}
+    store = LocalVersionStore()
+    writer, _ = make_cache(jobs, store)
+    reader, reader_loads = make_cache(jobs, store)
+    writer.get("j1")
+    reader.get("j1")
+
+    writer.increment("j1", "applicant_count")
+
+    assert writer.get("j1")["applicant_count"] == 1
+    reader.get("j1")
+    assert len(reader_loads) == 1
+
+def test_upsert_makes_other_workers_reload():
+    jobs = {"j1": make_job(1)}
+    store = LocalVersionStore()
+    writer, _ = make_cache(jobs, store)
+    reader, reader_loads = make_cache(jobs, store)
+    writer.get("j1")
+    reader.get("j1")
+
+    jobs["j1"] = make_job(1, title="Renamed")
+    writer.upsert("j1", jobs["j1"])
+
+    assert reader.get("j1")["title"] == "Renamed"
+    assert len(reader_loads) == 2
+
+def test_increment_ignores_unknown_jobs():
+    cache, _ = make_cache({}, LocalVersionStore())
+
+    cache.increment("missing", "applicant_count")
+
+    assert cache.get("missing") is None
+
+def test_concurrent_increments_are_all_counted():
+    cache, _ = make_cache({"j1": make_job(1)}, LocalVersionStore(), check_interval=60)
+    cache.get("j1")
+
+    threads = [threading.Thread(target=cache.increment, args=("j1", "applicant_count")) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.get("j1")["applicant_count"] == 8
+
+def test_increment_cannot_change_indexed_fields():
+    cache, _ = make_cache({"j1": make_job(1)}, LocalVersionStore())
+    cache.get("j1")
+
+    with pytest.raises(ValueError):
+        cache.increment("j1", "created_at")
+
+def test_version_checks_are_throttled():
+    store = CountingStore()
+    cache, _ = make_cache({"j1": make_job(1)}, store, check_interval=60)
+
+    for _ in range(50):
+        cache.get("j1")
+
+    assert store.gets == 1
+
+def test_reads_are_served_from_the_old_table_during_a_reload():
+    jobs = {"j1": make_job(1, title="Old")}
+    store = LocalVersionStore()
+    loading = threading.Event()
+    release = threading.Event()
+    cache, _ = make_cache(jobs, store)
+    cache.get("j1")
+
+    def slow_loader():
+        loading.set()
+        release.wait(5)
+        return list(jobs.items())
+
+    cache.loader = slow_loader
+    jobs["j1"] = make_job(1, title="New")
+    store.incr(cache.key)
+    reloader = threading.Thread(target=cache.get, args=("j1",))
+    reloader.start()
+    assert loading.wait(5)
+
+    # Answered while the loader is still blocked
+    assert cache.get("j1")["title"] == "Old"
+    # Written after the loader took its snapshot
+    cache.upsert("j2", make_job(2))
+
+    cache.check_interval = 60
+    release.set()
+    reloader.join()
+    assert cache.get("j1")["title"] == "New"
+    assert cache.get("j2") is not None
@@ -0,0 +1,106 @@
+import time
+import pytest
+from services.job_replica import JobReplica, StubSnapshotSource, FirestoreSnapshotSource
+
+def make_job(created_at, owner="owner1", **fields):
+    return {"is_active": True, "created_at": created_at, "posted_by": owner, **fields}
+
+def page_ids(replica, limit=10, after=None, owner=None):
+    jobs, has_more = replica.page(limit, after, owner)
+    return [job_id for job_id, _ in jobs], has_more
+
+def test_initial_snapshot_fills_the_table():
+    replica = JobReplica(StubSnapshotSource({"j1": make_job(1), "j2": make_job(2)}))
+
+    assert replica.get("j1")["created_at"] == 1
+    assert replica.stats()["jobs"] == 2
+
+def test_inserts_updates_and_removals_are_applied():
+    source = StubSnapshotSource({"j1": make_job(1, title="Old")})
+    replica = JobReplica(source)
+    replica.start()
+
+    source.set("j2", make_job(2))
+    source.set("j1", make_job(1, title="New"))
+    assert replica.get("j1")["title"] == "New"
+    assert replica.get("j2") is not None
+
+    source.delete("j2")
+    assert replica.get("j2") is None
+
+def test_deactivated_jobs_are_dropped():
+    source = StubSnapshotSource({"j1": make_job(1)})
+    replica = JobReplica(source)
+    replica.start()
+
+    source.set("j1", {**make_job(1), "is_active": False})
+
+    assert replica.get("j1") is None
+    assert page_ids(replica) == ([], False)
+
+def test_pages_newest_first_with_cursor():
+    replica = JobReplica(StubSnapshotSource({f"j{i}": make_job(i) for i in range(5)}))
+
+    first, more = page_ids(replica, limit=2)
+    assert (first, more) == (["j4", "j3"], True)
+
+    rest, more = page_ids(replica, limit=10, after=(3, "j3"))
+    assert (rest, more) == (["j2", "j1", "j0"], False)
+
+def test_pages_by_owner_follow_updates():
+    source = StubSnapshotSource({
+        "a1": make_job(1, owner="alice"),
+        "b1": make_job(2, owner="bob"),
+        "a2": make_job(3, owner="alice")
+    })
+    replica = JobReplica(source)
+    replica.start()
+
+    assert page_ids(replica, owner="alice") == (["a2", "a1"], False)
+
+    # Moving a job to another owner and a later time reindexes it
+    source.set("a1", make_job(4, owner="bob"))
+    assert page_ids(replica, owner="alice") == (["a2"], False)
+    assert page_ids(replica, owner="bob") == (["a1", "b1"], False)
+    assert page_ids(replica, owner="nobody") == ([], False)
+
+def test_projects_fields():
+    replica = JobReplica(StubSnapshotSource({"j1": make_job(1, title="T", secret="x")}),
+                         fields=("is_active", "created_at", "posted_by", "title"))
+
+    assert "secret" not in replica.get("j1")
+
+def test_local_writes_are_visible_before_the_listener():
+    replica = JobReplica(StubSnapshotSource())
+    replica.start()
+
+    replica.upsert("j1", make_job(1))
+    assert replica.get("j1") is not None
+
+    replica.remove("j1")
+    assert replica.get("j1") is None
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail("condition not reached")
+        time.sleep(0.01)
+
+def test_firestore_source_resubscribes_when_the_watch_dies(firestore_db):
+    jobs = firestore_db.data["jobs"]
+    jobs.update({"j1": make_job(1), "j2": make_job(2)})
+    source = FirestoreSnapshotSource(firestore_db.collection("jobs").where("is_active", "==", True), check_interval=0.05)
+    replica = JobReplica(source)
+    replica.start()
+    assert replica.stats()["jobs"] == 2
+
+    # j2 is deleted while the watch is down, the new snapshot must not keep it
+    del jobs["j2"]
+    firestore_db.watches[0].is_active = False
+    wait_for(lambda: source.stats()["watch_restarts"] == 1)
+
+    assert firestore_db.watches[0].unsubscribed
+    assert replica.get("j2") is None
+    assert replica.stats()["watch_active"]
+    replica.stop()
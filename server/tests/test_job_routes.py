@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+import datetime as dt
+
+def add_job(db, job_id, owner="owner1", minutes_ago=0, **fields):
+    created_at = datetime(2024, 1, 1, tzinfo=dt.UTC) - timedelta(minutes=minutes_ago)
+    db.data["jobs"][job_id] = {
+        "id": job_id, "title": f"Job {job_id}", "company": "Acme", "posted_by": owner, "is_active": True,
+        "created_at": created_at, "updated_at": created_at, "key_requirements": ["Python", "SQL"],
+        "preferred_qualifications": [], "applicant_count": 0, **fields
+    }
+
+def add_applicant(db, uid, skills=("Python", "SQL")):
+    db.data["users"][uid] = {"role": "applicant", "resumeId": f"resume-{uid}"}
+    db.data["resumes"][f"resume-{uid}"] = {"name": uid, "email": f"{uid}@example.com", "technical_skills": list(skills)}
+
+def test_semantic_matching_falls_back_to_skills_before_the_backfill(server, client, auth_headers):
+    add_job(server.db, "j1")
+    add_applicant(server.db, "u1")
+    server.skill_index.rebuild()
+    server.job_vector_index.rebuild()
+
+    response = client.get("/jobs/match?mode=semantic", headers=auth_headers("u1"))
+
+    assert response.status_code == 200
+    assert [job["id"] for job in response.get_json()["jobs"]] == ["j1"]
+
+def test_only_the_owner_sees_the_applicant_count(server, client, auth_headers):
+    add_job(server.db, "active", applicant_count=3)
+    add_job(server.db, "closed", applicant_count=5, is_active=False)
+
+    for job_id, count in (("active", 3), ("closed", 5)):
+        owner = client.get(f"/jobs/{job_id}", headers=auth_headers("owner1", role="requester")).get_json()
+        other = client.get(f"/jobs/{job_id}", headers=auth_headers("u1")).get_json()
+
+        assert owner["applicant_count"] == count
+        assert "applicant_count" not in other
+
+def test_non_owner_etag_does_not_change_with_the_applicant_count(server, client, auth_headers):
+    add_job(server.db, "j1", applicant_count=1)
+    etag = client.get("/jobs/j1", headers=auth_headers("u1")).headers["ETag"]
+
+    server.db.data["jobs"]["j1"]["applicant_count"] = 2
+    response = client.get("/jobs/j1", headers={**auth_headers("u1"), "If-None-Match": etag})
+
+    assert response.status_code == 304
+
+def test_owner_etag_changes_with_the_applicant_count(server, client, auth_headers):
+    add_job(server.db, "j1", applicant_count=1)
+    headers = auth_headers("owner1", role="requester")
+    etag = client.get("/jobs/j1", headers=headers).headers["ETag"]
+
+    assert client.get("/jobs/j1", headers={**headers, "If-None-Match": etag}).status_code == 304
+    server.db.data["jobs"]["j1"]["applicant_count"] = 2
+    assert client.get("/jobs/j1", headers={**headers, "If-None-Match": etag}).status_code == 200
+
+def apply(client, auth_headers, uid, job_id="j1", key=None):
+    headers = auth_headers(uid)
+    if key:
+        headers["Idempotency-Key"] = key
+    return client.post(f"/jobs/{job_id}/apply", headers=headers)
+
+def test_applying_twice_is_a_conflict(server, client, auth_headers):
+    add_job(server.db, "j1")
+    add_applicant(server.db, "u1")
+
+    assert apply(client, auth_headers, "u1").status_code == 201
+    response = apply(client, auth_headers, "u1")
+
+    assert response.status_code == 409
+    assert server.db.data["jobs"]["j1"]["applicant_count"] == 1
+
+def test_a_retry_with_the_same_idempotency_key_is_replayed(server, client, auth_headers):
+    add_job(server.db, "j1")
+    add_applicant(server.db, "u1")
+
+    first = apply(client, auth_headers, "u1", key="attempt-1")
+    retry = apply(client, auth_headers, "u1", key="attempt-1")
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.get_json()["application_id"] == first.get_json()["application_id"]
+    assert server.db.data["jobs"]["j1"]["applicant_count"] == 1
+    assert apply(client, auth_headers, "u1", key="attempt-2").status_code == 409
+
+def test_every_application_is_counted_in_the_catalogue(server, client, auth_headers):
+    add_job(server.db, "j1")
+    for uid in ("u1", "u2"):
+        add_applicant(server.db, uid)
+        assert apply(client, auth_headers, uid).status_code == 201
+
+    assert server.db.data["jobs"]["j1"]["applicant_count"] == 2
+    assert server.job_catalogue.get("j1")["applicant_count"] == 2
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+from services.job_vector_index import JobVectorIndex
+
+def unit(i, dimension=8):
+    vector = np.zeros(dimension, dtype="float32")
+    vector[i] = 1.0
+    return vector
+
+def test_finds_nearest_jobs_by_cosine():
+    index = JobVectorIndex()
+    index.upsert("x", unit(0))
+    index.upsert("y", unit(1))
+    index.upsert("xy", unit(0) + unit(1))
+
+    results = index.search(unit(0) * 5, k=2)
+
+    assert [job_id for job_id, _ in results] == ["x", "xy"]
+    assert results[0][1] == pytest.approx(1.0)
+    assert results[1][1] == pytest.approx(2 ** -0.5)
+
+def test_upsert_supersedes_the_old_vector():
+    index = JobVectorIndex(compact_ratio=1.0)
+    index.upsert("job", unit(0))
+    index.upsert("other", unit(2))
+
+    index.upsert("job", unit(1))
+
+    results = index.search(unit(1), k=5)
+    assert [job_id for job_id, _ in results][:1] == ["job"]
+    # The superseded slot is never returned, so the job appears once
+    assert [job_id for job_id, _ in results].count("job") == 1
+    assert index.stats()["slots"] == 3
+    assert len(index) == 2
+
+def test_removals_past_the_ratio_compact_the_graph():
+    index = JobVectorIndex(compact_ratio=0.2)
+    for i in range(8):
+        index.upsert(f"j{i}", unit(i))
+
+    index.remove("j0")
+    assert index.stats()["slots"] == 8
+    index.remove("j1")
+
+    stats = index.stats()
+    assert (stats["jobs"], stats["slots"]) == (6, 6)
+    assert {job_id for job_id, _ in index.search(unit(2), k=10)} == {f"j{i}" for i in range(2, 8)}
+
+def test_offset_pages_through_results():
+    index = JobVectorIndex()
+    for i in range(4):
+        index.upsert(f"j{i}", unit(0) + unit(i + 1) * (i + 1))
+
+    first = index.search(unit(0), k=2)
+    second = index.search(unit(0), k=2, offset=2)
+
+    assert [job_id for job_id, _ in first + second] == ["j0", "j1", "j2", "j3"]
+
+def test_inactive_jobs_are_dropped():
+    index = JobVectorIndex()
+    index.upsert("j1", unit(0))
+
+    index.upsert("j1", unit(0), active=False)
+
+    assert index.search(unit(0)) == []
+    assert len(index) == 0
+
+def test_loads_from_the_loader_on_first_use():
+    index = JobVectorIndex(lambda: iter([("j1", unit(0).tolist()), ("j2", None)]))
+
+    assert len(index) == 1
+    assert index.search(unit(0)) == [("j1", pytest.approx(1.0))]
@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+import pytest
+
+pytest.importorskip("firebase_admin")
+from utils.pagination import parse_page_args, encode_cursor, make_cursor, decode_cursor
+
+class FakeDoc:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+
+    def get(self, field):
+        return self._data.get(field)
+
+def test_cursor_round_trips_datetimes():
+    created = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+    assert decode_cursor(make_cursor(created, "job1")) == (created, "job1")
+
+def test_cursor_round_trips_plain_values():
+    assert decode_cursor(make_cursor(0.75, "job2")) == (0.75, "job2")
+    assert decode_cursor(make_cursor("title", "job3")) == ("title", "job3")
+
+def test_encode_cursor_reads_the_order_field():
+    created = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    doc = FakeDoc("app1", {"appliedAt": created, "status": "pending"})
+
+    assert decode_cursor(encode_cursor(doc, "appliedAt")) == (created, "app1")
+
+@pytest.mark.parametrize("cursor", ["not a cursor", "e30", "bnVsbA"])
+def test_decode_cursor_rejects_malformed_cursors(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+def test_parse_page_args_validates_the_cursor():
+    with pytest.raises(ValueError):
+        parse_page_args({"cursor": "garbage"}, allowed_fields=["title"])
+
+    cursor = make_cursor("x", "job1")
+    assert parse_page_args({"cursor": cursor, "limit": "5"}, allowed_fields=["title"]) == (5, cursor, None)
@@ -0,0 +1,68 @@
+import time
+import threading
+from services.question_runner import QuestionRunner
+
+def test_answers_every_question():
+    runner = QuestionRunner(max_workers=3, timeout=5)
+
+    answers, failed = runner.run(str.upper, ["a", "b", "c", "d"])
+
+    assert answers == {"a": "A", "b": "B", "c": "C", "d": "D"}
+    assert failed == []
+
+def test_a_failing_question_does_not_affect_the_others():
+    def answer(question):
+        if question == "bad":
+            raise RuntimeError("LLM error")
+        return question
+
+    runner = QuestionRunner(max_workers=2, timeout=5)
+    answers, failed = runner.run(answer, ["one", "bad", "two"])
+
+    assert answers == {"one": "one", "bad": "Not available", "two": "two"}
+    assert failed == ["bad"]
+    assert runner.stats()["failures"] == 1
+
+def test_timeout_is_per_question_from_its_start():
+    release = threading.Event()
+
+    def answer(question):
+        if question == "hung":
+            release.wait(10)
+        else:
+            time.sleep(0.3)
+        return question
+
+    # The hung question holds one of two slots, so the others run one after another
+    runner = QuestionRunner(max_workers=2, timeout=0.5)
+    started = time.monotonic()
+    answers, failed = runner.run(answer, ["hung", "q1", "q2", "q3", "q4"])
+    elapsed = time.monotonic() - started
+
+    assert failed == ["hung"]
+    assert [answers[q] for q in ("q1", "q2", "q3", "q4")] == ["q1", "q2", "q3", "q4"]
+    # The hung question is abandoned at 0.5s instead of holding up the run
+    assert elapsed < 2
+    assert runner.stats()["abandoned_running"] == 1
+
+    release.set()
+    time.sleep(0.1)
+    assert runner.stats()["abandoned_running"] == 0
+    assert runner.stats()["timeouts"] == 1
+
+def test_stops_starting_questions_while_too_many_calls_are_abandoned():
+    release = threading.Event()
+    calls = []
+
+    def answer(question):
+        calls.append(question)
+        release.wait(10)
+        return question
+
+    runner = QuestionRunner(max_workers=1, timeout=0.1, max_abandoned=1)
+    answers, failed = runner.run(answer, ["first", "second"])
+
+    assert calls == ["first"]
+    assert failed == ["first", "second"]
+    assert runner.stats()["refused"] == 1
+    release.set()
@@ -0,0 +1,53 @@
+import pytest
+
+pytest.importorskip("langchain_community")
+pytest.importorskip("faiss")
+from langchain_core.embeddings import Embeddings
+from langchain_community.vectorstores import FAISS
+from services.resume_index_store import ResumeIndexStore
+
+class KeywordEmbeddings(Embeddings):
+    """Embeds text by which of a few keywords it contains"""
+    words = ("python", "sql", "docker", "design")
+
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text):
+        return [float(word in text.lower()) + 0.01 for word in self.words]
+
+def builder(calls, texts):
+    def build():
+        calls.append(1)
+        return FAISS.from_texts(texts, KeywordEmbeddings())
+    return build
+
+def test_builds_once_and_reloads_from_disk(tmp_path):
+    calls = []
+    texts = ["Python developer", "SQL tuning", "Docker images"]
+    ResumeIndexStore(str(tmp_path), KeywordEmbeddings).get("resume-1", builder(calls, texts))
+
+    # A fresh store, as after a restart, finds the saved index
+    store = ResumeIndexStore(str(tmp_path), KeywordEmbeddings)
+    index = store.get("resume-1", builder(calls, texts))
+
+    assert calls == [1]
+    assert index.similarity_search("sql", k=1)[0].page_content == "SQL tuning"
+
+def test_get_without_build_misses(tmp_path):
+    assert ResumeIndexStore(str(tmp_path), KeywordEmbeddings).get("unknown") is None
+
+def test_invalidate_forces_a_rebuild(tmp_path):
+    calls = []
+    store = ResumeIndexStore(str(tmp_path), KeywordEmbeddings)
+    store.get("resume-1", builder(calls, ["Python developer"]))
+
+    store.invalidate("resume-1")
+    index = store.get("resume-1", builder(calls, ["Docker images"]))
+
+    assert calls == [1, 1]
+    assert index.similarity_search("docker", k=1)[0].page_content == "Docker images"
+
+def test_rejects_ids_that_are_not_safe_paths(tmp_path):
+    with pytest.raises(ValueError):
+        ResumeIndexStore(str(tmp_path), KeywordEmbeddings).get("../escape", builder([], ["x"]))
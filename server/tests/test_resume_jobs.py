@@ -0,0 +1,81 @@
+import io
+import threading
+from datetime import datetime, timedelta
+import datetime as dt
+from services.resume_jobs import ResumeJobQueue
+
+def make_queue(db):
+    return ResumeJobQueue(lambda *args: None, db=db, max_workers=1, stale_after=600)
+
+def test_get_fails_jobs_that_stopped_reporting(firestore_db):
+    jobs = firestore_db.data["resume_jobs"]
+    jobs["old"] = {"status": "processing", "updatedAt": datetime.now(dt.UTC) - timedelta(hours=1)}
+    queue = make_queue(firestore_db)
+
+    job = queue.get("old")
+
+    assert job["status"] == "failed"
+    assert jobs["old"]["status"] == "failed"
+    queue.shutdown()
+
+def test_get_leaves_recent_and_finished_jobs_alone(firestore_db):
+    jobs = firestore_db.data["resume_jobs"]
+    jobs["recent"] = {"status": "processing", "updatedAt": datetime.now(dt.UTC)}
+    jobs["done"] = {"status": "completed", "updatedAt": datetime.now(dt.UTC) - timedelta(hours=1)}
+    queue = make_queue(firestore_db)
+
+    assert queue.get("recent")["status"] == "processing"
+    assert queue.get("done")["status"] == "completed"
+    queue.shutdown()
+
+def test_recover_stale_marks_only_old_unfinished_jobs(firestore_db):
+    jobs = firestore_db.data["resume_jobs"]
+    old = datetime.now(dt.UTC) - timedelta(hours=1)
+    jobs["queued"] = {"status": "queued", "updatedAt": old}
+    jobs["processing"] = {"status": "processing", "updatedAt": old}
+    jobs["recent"] = {"status": "processing", "updatedAt": datetime.now(dt.UTC)}
+    queue = make_queue(firestore_db)
+
+    assert queue.recover_stale() == 2
+    assert jobs["queued"]["status"] == "failed"
+    assert jobs["processing"]["status"] == "failed"
+    assert jobs["recent"]["status"] == "processing"
+    queue.shutdown()
+
+def test_recover_stale_leaves_jobs_with_a_fresh_heartbeat(firestore_db):
+    jobs = firestore_db.data["resume_jobs"]
+    old = datetime.now(dt.UTC) - timedelta(hours=1)
+    # Queued long ago on another worker that is still alive
+    jobs["waiting"] = {"status": "queued", "workerId": "other", "createdAt": old, "updatedAt": old,
+                       "heartbeatAt": datetime.now(dt.UTC)}
+    jobs["orphaned"] = {"status": "queued", "workerId": "dead", "createdAt": old, "updatedAt": old,
+                        "heartbeatAt": old}
+    queue = make_queue(firestore_db)
+
+    assert queue.recover_stale() == 1
+    assert jobs["waiting"]["status"] == "queued"
+    assert jobs["orphaned"]["status"] == "failed"
+    queue.shutdown()
+
+def test_heartbeat_refreshes_unfinished_jobs_this_worker_owns(firestore_db):
+    release = threading.Event()
+
+    def pipeline(stream, filename, uid, user_email, report_stage):
+        release.wait(5)
+        return {}
+
+    queue = ResumeJobQueue(pipeline, db=firestore_db, max_workers=1, stale_after=600)
+    job_id = queue.submit("u1", "u1@example.com", "cv.pdf", io.BytesIO(b"pdf"))
+    jobs = firestore_db.data["resume_jobs"]
+    assert jobs[job_id]["workerId"] == queue.worker_id
+
+    # Pretend the last beat was long ago, as another worker's recovery would see it
+    jobs[job_id]["heartbeatAt"] = datetime.now(dt.UTC) - timedelta(hours=1)
+    assert queue.heartbeat() == 1
+    other_worker = make_queue(firestore_db)
+    assert other_worker.recover_stale() == 0
+    other_worker.shutdown()
+
+    release.set()
+    queue.shutdown()
+    assert queue.heartbeat() == 0
@@ -0,0 +1,91 @@
+import sys
+import time
+import threading
+import logging
+from services import revocation
+from services.revocation import BloomFilter, LocalRevocationBackend, RevocationList
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f"jti-{i}" for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    assert bloom.count == 1000
+
+def test_bloom_filter_false_positive_rate_is_near_target():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"jti-{i}")
+
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+
+    assert false_positives < 300
+
+def test_revoked_tokens_are_rejected_until_they_expire():
+    tokens = RevocationList(LocalRevocationBackend(), sync_interval=0)
+
+    tokens.revoke("live", time.time() + 60)
+    tokens.revoke("expired", time.time() - 1)
+
+    assert tokens.is_revoked("live")
+    assert not tokens.is_revoked("expired")
+    assert not tokens.is_revoked("never")
+    assert tokens.stats()["confirmed"] == 1
+
+def test_lists_sharing_a_backend_see_each_others_revocations():
+    backend = LocalRevocationBackend()
+    first = RevocationList(backend, sync_interval=0)
+    second = RevocationList(backend, sync_interval=0)
+    assert not second.is_revoked("jti")
+
+    first.revoke("jti", time.time() + 60)
+
+    assert second.is_revoked("jti")
+    assert second.stats()["syncs"] == 2
+
+def test_backend_errors_fail_closed():
+    class BrokenBackend(LocalRevocationBackend):
+        def contains(self, jti):
+            raise ConnectionError("down")
+
+    tokens = RevocationList(BrokenBackend(), sync_interval=0)
+    tokens.revoke("jti", time.time() + 60)
+
+    assert tokens.is_revoked("jti")
+
+def test_counters_add_up_under_concurrent_checks():
+    tokens = RevocationList(LocalRevocationBackend(), sync_interval=60)
+    tokens.revoke("revoked", time.time() + 60)
+
+    def check():
+        for i in range(2000):
+            tokens.is_revoked("revoked" if i % 2 else f"other-{i}")
+
+    # Switch threads as often as possible so unlocked increments would lose updates
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=check) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    stats = tokens.stats()
+    assert stats["checks"] == 16000
+    assert stats["confirmed"] == 8000
+    assert stats["filtered"] + stats["false_positives"] == 8000
+
+def test_local_backend_logs_a_warning(monkeypatch, caplog):
+    monkeypatch.delenv("REVOCATION_REDIS_URL", raising=False)
+    monkeypatch.setattr(revocation, "_shared_list", None)
+
+    with caplog.at_level(logging.WARNING, logger="services.revocation"):
+        tokens = revocation.get_revocation_list()
+
+    assert isinstance(tokens.backend, LocalRevocationBackend)
+    assert "REVOCATION_REDIS_URL" in caplog.text
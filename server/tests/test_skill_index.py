@@ -0,0 +1,57 @@
+from services.skill_index import SkillIndex, job_skills
+
+def make_job(*skills, active=True, preferred=()):
+    return {"is_active": active, "key_requirements": list(skills), "preferred_qualifications": list(preferred)}
+
+def test_job_skills_normalizes_and_merges_requirements():
+    assert job_skills(make_job(" Python ", "Machine   Learning", "", preferred=["python"])) == \
+        {"python", "machine learning"}
+
+def test_scores_are_shared_skills_over_job_skills():
+    index = SkillIndex()
+    index.upsert("j1", make_job("Python", "SQL"))
+    index.upsert("j2", make_job("Python", "Go", "Rust", "Java"))
+
+    matches = index.match(["python", "SQL", "PYTHON"], min_score=0.0)
+
+    assert [(job_id, score) for job_id, score, _ in matches] == [("j1", 1.0), ("j2", 0.25)]
+    assert sorted(matches[0][2]) == ["SQL", "python"]
+
+def test_min_score_filters_weak_matches():
+    index = SkillIndex()
+    index.upsert("j1", make_job("Python", "Go", "Rust", "Java"))
+
+    assert index.match(["python"], min_score=0.3) == []
+
+def test_updates_and_removals_are_applied_incrementally():
+    index = SkillIndex()
+    index.upsert("j1", make_job("Python"))
+    index.upsert("j2", make_job("Python"))
+
+    index.upsert("j1", make_job("Go"))
+    index.remove("j2")
+    index.upsert("j3", make_job("Python", active=False))
+
+    assert index.match(["python"]) == []
+    assert [job_id for job_id, _, _ in index.match(["go"])] == ["j1"]
+    assert index.stats()["skills"] == 1
+
+def test_first_match_loads_from_the_loader():
+    jobs = [("j1", make_job("Python")), ("j2", make_job("Python", active=False))]
+    index = SkillIndex(lambda: iter(jobs))
+
+    assert [job_id for job_id, _, _ in index.match(["python"])] == ["j1"]
+    assert index.stats()["jobs"] == 1
+
+def test_writes_during_a_rebuild_are_kept():
+    index = SkillIndex()
+
+    def loader():
+        # Lands while the rebuild is scanning, after the snapshot was taken
+        index.upsert("new", make_job("Python"))
+        yield "old", make_job("Python")
+
+    index.loader = loader
+    index.rebuild()
+
+    assert {job_id for job_id, _, _ in index.match(["python"])} == {"old", "new"}
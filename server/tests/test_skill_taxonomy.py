@@ -0,0 +1,33 @@
+from services.skill_taxonomy import SkillMatcher, get_skill_matcher, SKILL_CATEGORIES
+
+def test_maps_aliases_to_canonical_skills():
+    found = get_skill_matcher().extract("Wrote python3 and JS, some C plus plus and ts")
+
+    assert found["programming_languages"] == ["Python", "JavaScript", "C++", "TypeScript"]
+
+def test_matches_only_on_word_boundaries():
+    found = get_skill_matcher().extract("pyramid schemes, tsunami warnings, javascripting")
+
+    assert found["programming_languages"] == []
+
+def test_reports_each_skill_once_in_order_of_first_mention():
+    found = get_skill_matcher().extract("Rust, then Python, then rust again and py")
+
+    assert found["programming_languages"] == ["Rust", "Python"]
+
+def test_returns_every_category_even_when_empty():
+    assert set(get_skill_matcher().extract("")) == set(SKILL_CATEGORIES)
+
+def test_overlapping_aliases_are_all_found():
+    matcher = SkillMatcher({"tools": {"Machine Learning": ["ml"], "Learning": []}})
+
+    found = matcher.extract("Applied machine learning and ML ops")
+
+    assert found["tools"] == ["Machine Learning", "Learning"]
+
+def test_canonicalize():
+    matcher = get_skill_matcher()
+
+    assert matcher.canonicalize("  Python3 ") == "Python"
+    assert matcher.canonicalize("csharp") == "C#"
+    assert matcher.canonicalize("Basket weaving") is None
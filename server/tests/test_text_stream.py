@@ -0,0 +1,47 @@
+import re
+import random
+from services.text_stream import normalize_stream, chunk_stream, TextPrefix
+
+def normalize(text):
+    """The whole-document normalization the stream must agree with"""
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s@\+\(\)\-\.\,\#\&]', '', text)
+    return text.strip()
+
+def split_randomly(text, rng):
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text), 6)))
+    return [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+
+def test_normalize_stream_matches_whole_text():
+    rng = random.Random(7)
+    samples = [
+        "  John   Smith \n\n john@example.com  ",
+        "Skills:\tPython,  SQL\n\n\n* Docker *  ",
+        "\n\n  \t ",
+        "C++ & C# (5 yrs) -- 100% remote!!",
+        "line one\n   \n*\n   line two"
+    ]
+    for text in samples:
+        for _ in range(20):
+            assert "".join(normalize_stream(split_randomly(text, rng))) == normalize(text)
+
+def test_normalize_stream_joins_whitespace_across_pieces():
+    assert "".join(normalize_stream(["Python ", "  ", " SQL  ", "\n"])) == "Python SQL"
+
+def test_normalize_stream_skips_empty_pieces():
+    assert "".join(normalize_stream(["", "  a", "", "b  ", ""])) == "ab"
+
+def test_chunk_stream_overlaps_chunks():
+    text = "x" * 2500
+    chunks = list(chunk_stream([text[:700], text[700:]], chunk_size=1000, overlap=200))
+
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 900]
+
+def test_chunk_stream_passes_short_text_through():
+    assert list(chunk_stream(["short ", "text"])) == ["short text"]
+
+def test_text_prefix_keeps_the_first_characters():
+    prefix = TextPrefix(iter(["abc", "def", "ghi"]), limit=5)
+
+    assert list(prefix) == ["abc", "def", "ghi"]
+    assert prefix.text == "abcde"
@@ -0,0 +1,51 @@
+import io
+from werkzeug.datastructures import FileStorage
+
+def upload(client, headers, size, filename="cv.pdf"):
+    return client.post("/resume/upload", headers=headers, content_type="multipart/form-data",
+                       data={"file": (io.BytesIO(b"x" * size), filename)})
+
+def test_spool_upload_keeps_small_files_in_memory(server, monkeypatch):
+    monkeypatch.setattr(server, "UPLOAD_SPOOL_THRESHOLD", 1024)
+
+    small = server.spool_upload(FileStorage(io.BytesIO(b"x" * 1024)))
+    large = server.spool_upload(FileStorage(io.BytesIO(b"x" * 1025)))
+
+    assert not small._rolled
+    assert large._rolled
+    assert small.read() == b"x" * 1024
+    assert large.read() == b"x" * 1025
+
+def test_oversized_request_is_rejected_with_413(server, client, auth_headers, monkeypatch):
+    submitted = []
+    monkeypatch.setattr(server.resume_job_queue, "submit", lambda *args: submitted.append(args))
+
+    response = upload(client, auth_headers("u1"), server.app.config["MAX_CONTENT_LENGTH"] + 1)
+
+    assert response.status_code == 413
+    assert "limit" in response.get_json()["error"]
+    assert submitted == []
+
+def test_file_over_the_size_limit_is_rejected(server, client, auth_headers, monkeypatch):
+    submitted = []
+    monkeypatch.setattr(server.resume_job_queue, "submit", lambda *args: submitted.append(args))
+
+    # Under the request cap, which leaves room for form fields, but over the file limit
+    response = upload(client, auth_headers("u1"), server.MAX_FILE_SIZE + 1)
+
+    assert response.status_code == 400
+    assert submitted == []
+
+def test_upload_is_queued_from_memory(server, client, auth_headers, monkeypatch):
+    submitted = []
+
+    def submit(uid, email, filename, stream):
+        submitted.append((uid, filename, stream.read()))
+        return "job-1"
+    monkeypatch.setattr(server.resume_job_queue, "submit", submit)
+
+    response = upload(client, auth_headers("u1"), 2048, filename="my cv.pdf")
+
+    assert response.status_code == 202
+    assert response.headers["Location"] == "/resume/jobs/job-1"
+    assert submitted == [("u1", "my_cv.pdf", b"x" * 2048)]
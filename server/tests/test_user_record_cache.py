@@ -0,0 +1,87 @@
+import threading
+import pytest
+from services import user_record_cache
+from services.user_record_cache import UserRecordCache
+
+class Fetcher:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, uid):
+        self.calls.append(uid)
+        return {"uid": uid, "fetch": len(self.calls)}
+
+def test_records_are_fetched_once_until_they_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(user_record_cache.time, "monotonic", lambda: now[0])
+    fetch = Fetcher()
+    cache = UserRecordCache(fetch, ttl=300)
+
+    assert cache.get("u1") == cache.get("u1")
+    now[0] += 301
+    cache.get("u1")
+
+    assert fetch.calls == ["u1", "u1"]
+    assert cache.stats()["hits"] == 1
+
+def test_least_recently_used_record_is_evicted():
+    fetch = Fetcher()
+    cache = UserRecordCache(fetch, max_entries=2)
+    cache.get("u1")
+    cache.get("u2")
+    cache.get("u1")
+
+    cache.get("u3")
+    cache.get("u1")
+    cache.get("u2")
+
+    assert fetch.calls == ["u1", "u2", "u3", "u2"]
+    assert cache.stats()["evictions"] == 2
+
+def test_fetch_errors_are_not_cached():
+    calls = []
+
+    def fetch(uid):
+        calls.append(uid)
+        if len(calls) == 1:
+            raise LookupError(uid)
+        return {"uid": uid}
+
+    cache = UserRecordCache(fetch)
+
+    with pytest.raises(LookupError):
+        cache.get("u1")
+    assert cache.get("u1") == {"uid": "u1"}
+
+def test_invalidate_forces_a_new_fetch():
+    fetch = Fetcher()
+    cache = UserRecordCache(fetch)
+    cache.get("u1")
+
+    cache.invalidate("u1")
+
+    assert cache.get("u1")["fetch"] == 2
+
+def test_record_fetched_across_an_invalidation_is_not_cached():
+    fetching = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch(uid):
+        calls.append(uid)
+        if len(calls) == 1:
+            fetching.set()
+            release.wait(5)
+        return {"uid": uid, "fetch": len(calls)}
+
+    cache = UserRecordCache(fetch)
+    reader = threading.Thread(target=cache.get, args=("u1",))
+    reader.start()
+    assert fetching.wait(5)
+
+    # The user is updated while the old record is in flight
+    cache.invalidate("u1")
+    release.set()
+    reader.join()
+
+    assert cache.get("u1")["fetch"] == 2
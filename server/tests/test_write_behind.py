@@ -0,0 +1,65 @@
+from services.write_behind import WriteBehindBuffer
+
+def make_buffer(db, user_ids, **kwargs):
+    for user_id in user_ids:
+        db.collection("users").document(user_id).set({"role": "applicant"})
+    # A long interval keeps the background flusher out of the way
+    return WriteBehindBuffer(db, "users", interval=60, **kwargs)
+
+def test_coalesces_updates_to_one_document(firestore_db):
+    buffer = make_buffer(firestore_db, ["u1", "u2"])
+
+    buffer.update("u1", {"last_login": 1})
+    buffer.update("u1", {"last_login": 2, "logins": 5})
+    buffer.update("u2", {"last_login": 3})
+
+    assert buffer.flush() == 2
+    assert firestore_db.data["users"] == {
+        "u1": {"role": "applicant", "last_login": 2, "logins": 5},
+        "u2": {"role": "applicant", "last_login": 3}
+    }
+    stats = buffer.stats()
+    assert (stats["updates"], stats["coalesced"], stats["writes"], stats["batches"]) == (3, 1, 2, 1)
+    buffer.shutdown()
+
+def test_splits_batches_at_the_firestore_limit(firestore_db):
+    user_ids = [f"u{i}" for i in range(1200)]
+    buffer = make_buffer(firestore_db, user_ids, batch_size=1000)
+
+    for i, user_id in enumerate(user_ids):
+        buffer.update(user_id, {"last_login": i})
+    buffer.flush()
+
+    assert firestore_db.batch_sizes == [500, 500, 200]
+    buffer.shutdown()
+
+def test_failed_batch_falls_back_to_single_writes(firestore_db):
+    buffer = make_buffer(firestore_db, ["u1"])
+
+    buffer.update("u1", {"last_login": 1})
+    buffer.update("gone", {"last_login": 2})
+    buffer.flush()
+
+    assert firestore_db.data["users"] == {"u1": {"role": "applicant", "last_login": 1}}
+    assert firestore_db.single_writes == 1
+    stats = buffer.stats()
+    assert (stats["writes"], stats["failures"], stats["batches"]) == (1, 1, 0)
+    buffer.shutdown()
+
+def test_shutdown_flushes_pending_updates(firestore_db):
+    buffer = make_buffer(firestore_db, ["u1"])
+
+    buffer.update("u1", {"last_login": 1})
+    buffer.shutdown()
+
+    assert firestore_db.data["users"]["u1"]["last_login"] == 1
+    assert buffer.stats()["queue_depth"] == 0
+
+def test_updates_after_shutdown_are_written_through(firestore_db):
+    buffer = make_buffer(firestore_db, ["u1"])
+    buffer.shutdown()
+
+    buffer.update("u1", {"last_login": 1})
+
+    assert firestore_db.data["users"]["u1"]["last_login"] == 1
+    assert buffer.stats()["queue_depth"] == 0
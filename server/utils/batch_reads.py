@@ -0,0 +1,26 @@
+from concurrent.futures import ThreadPoolExecutor
+
+def get_all_batched(db, refs, field_paths=None, chunk_size=100, max_workers=4):
+    """Fetch documents with batched get_all calls run in parallel, returning path -> snapshot
+
+    Duplicate references are read once. Missing documents come back as
+    snapshots whose exists is False, like get_all itself.
+    """
+    unique = list({ref.path: ref for ref in refs}.values())
+    chunks = [unique[i:i + chunk_size] for i in range(0, len(unique), chunk_size)]
+    if not chunks:
+        return {}
+
+    def fetch(chunk):
+        return list(db.get_all(chunk, field_paths=field_paths))
+
+    snapshots = {}
+    if len(chunks) == 1:
+        results = [fetch(chunks[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks)), thread_name_prefix="get-all") as executor:
+            results = list(executor.map(fetch, chunks))
+    for chunk_snapshots in results:
+        for snapshot in chunk_snapshots:
+            snapshots[snapshot.reference.path] = snapshot
+    return snapshots
@@ -0,0 +1,73 @@
+import os
+import time
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+
+logger = logging.getLogger(__name__)
+
+class FanOut:
+    """Runs independent blocking calls side by side on a shared bounded thread pool"""
+
+    def __init__(self, max_workers=16, timeout=10):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.calls = 0
+        self.timeouts = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fanout")
+        self._lock = threading.Lock()
+
+    def gather(self, *calls, timeout=None):
+        """Run zero-argument calls concurrently and return their results in order
+
+        The first call runs on the caller's thread. If any call fails, the
+        failure of the earliest one is raised, so callers keep their usual
+        exception handling. TimeoutError is raised if the others are not done
+        by the deadline; they cannot be interrupted and finish in the background.
+        """
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        futures = [self._executor.submit(call) for call in calls[1:]]
+        with self._lock:
+            self.calls += len(calls)
+
+        try:
+            first = calls[0]()
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+
+        _, pending = wait(futures, timeout=max(0, deadline - time.monotonic()))
+        if pending:
+            for future in pending:
+                future.cancel()
+            with self._lock:
+                self.timeouts += 1
+            raise TimeoutError(f"{len(pending)} of {len(calls)} calls missed the deadline")
+        return [first] + [future.result() for future in futures]
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        """Return call and timeout counters"""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "timeouts": self.timeouts,
+                "max_workers": self.max_workers
+            }
+
+_shared_fanout = None
+_shared_lock = threading.Lock()
+
+def get_fanout():
+    """Get the fan-out pool shared by the app and the blueprints, creating it on first use"""
+    global _shared_fanout
+    with _shared_lock:
+        if _shared_fanout is None:
+            _shared_fanout = FanOut(
+                max_workers=int(os.getenv("FANOUT_WORKERS", 16)),
+                timeout=float(os.getenv("FANOUT_TIMEOUT", 10))
+            )
+    return _shared_fanout
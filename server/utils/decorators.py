@@ -3,6 +3,7 @@ from flask import request, jsonify
 import jwt
 from config import Config
 from utils.jwt_utils import decode_token
+from services.revocation import get_revocation_list
 
 def jwt_required(token_type="access"):
     """Decorator to protect routes with JWT authentication"""
@@ -25,10 +26,13 @@ def jwt_required(token_type="access"):
                     return jsonify({"error": f"Invalid token type, expected {token_type}"}), 401
                 if token_type == "access" and payload.get("provider_id") != "google.com":
                     return jsonify({"error": "Invalid authentication provider"}), 401
+                if payload.get("jti") and get_revocation_list().is_revoked(payload["jti"]):
+                    return jsonify({"error": "Token has been revoked"}), 401
                 
                 request.uid = payload["uid"]
                 request.user_email = payload.get("email")
                 request.user_role = payload.get("role")
+                request.token_claims = payload
             except jwt.ExpiredSignatureError:
                 return jsonify({"error": "Token has expired"}), 401
             except jwt.InvalidTokenError as e:
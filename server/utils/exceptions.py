@@ -0,0 +1,7 @@
+class QueueFullError(Exception):
+    """Raised when the background worker pool cannot accept more jobs"""
+    pass
+
+class FileTooLargeError(Exception):
+    """Raised when an uploaded file exceeds the configured size limit"""
+    pass
@@ -1,16 +1,26 @@
 import jwt
+import uuid
 from datetime import datetime, timedelta
 import datetime as dt
 from config import Config
 
-def create_access_token(uid, email=None, provider_id=None, role=None):
-    """Create access JWT token"""
+# Access tokens carry the profile so /auth/verify can answer from the token alone
+ACCESS_TOKEN_CLAIMS_VERSION = 2
+
+def create_access_token(uid, email=None, provider_id=None, role=None, user_record=None, profile_version=0):
+    """Create access JWT token, carrying the profile from user_record when given"""
     payload = {
         "uid": uid,
         "email": email,
         "provider_id": provider_id,
         "role": role,
         "type": "access",
+        "jti": uuid.uuid4().hex,
+        "cv": ACCESS_TOKEN_CLAIMS_VERSION,
+        "pv": profile_version,
+        "name": user_record.display_name if user_record else None,
+        "picture": user_record.photo_url if user_record else None,
+        "email_verified": bool(user_record.email_verified) if user_record else False,
         "iat": datetime.now(dt.UTC),
         "exp": datetime.now(dt.UTC) + timedelta(seconds=Config.ACCESS_TOKEN_EXP)
     }
@@ -21,6 +31,7 @@ def create_refresh_token(uid):
     payload = {
         "uid": uid,
         "type": "refresh",
+        "jti": uuid.uuid4().hex,
         "iat": datetime.now(dt.UTC),
         "exp": datetime.now(dt.UTC) + timedelta(seconds=Config.REFRESH_TOKEN_EXP)
     }
@@ -0,0 +1,68 @@
+import json
+import base64
+from datetime import datetime
+from firebase_admin import firestore
+
+def parse_page_args(args, allowed_fields, default_fields=None, default_limit=20, max_limit=100):
+    """Read limit, cursor and fields= from query args, raising ValueError on bad input"""
+    try:
+        limit = int(args.get('limit', default_limit))
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    if not 1 <= limit <= max_limit:
+        raise ValueError(f"limit must be between 1 and {max_limit}")
+
+    fields = default_fields
+    if args.get('fields'):
+        fields = [field.strip() for field in args['fields'].split(',') if field.strip()]
+        unknown = sorted(set(fields) - set(allowed_fields))
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+    cursor = args.get('cursor')
+    if cursor:
+        # Reject malformed cursors before any query runs
+        decode_cursor(cursor)
+
+    return limit, cursor, fields
+
+def encode_cursor(doc, order_field):
+    """Opaque cursor pointing just after a document in (order_field, id) order"""
+    return make_cursor(doc.get(order_field), doc.id)
+
+def make_cursor(value, doc_id):
+    """Opaque cursor pointing just after the (value, doc_id) position"""
+    payload = {'v': value.isoformat() if isinstance(value, datetime) else value, 'id': doc_id}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """Return (order value, document id) from a cursor"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        value = payload['v']
+        try:
+            value = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            pass
+        return value, str(payload['id'])
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+
+def paginate(query, order_field, limit, cursor=None, fields=None):
+    """Fetch one page of a query, newest first, and the cursor for the next page
+
+    The sort runs in Firestore on (order_field, document id) so ties are
+    stable, and only the requested fields are downloaded when fields is set.
+    """
+    query = query.order_by(order_field, direction=firestore.Query.DESCENDING)
+    query = query.order_by(firestore.FieldPath.document_id(), direction=firestore.Query.DESCENDING)
+    if fields is not None:
+        # The order field is needed to build the next cursor
+        query = query.select(sorted(set(fields) | {order_field}))
+    if cursor:
+        value, doc_id = decode_cursor(cursor)
+        query = query.start_after({order_field: value, firestore.FieldPath.document_id(): doc_id})
+
+    docs = list(query.limit(limit + 1).stream())
+    next_cursor = encode_cursor(docs[limit - 1], order_field) if len(docs) > limit else None
+    return docs[:limit], next_cursor